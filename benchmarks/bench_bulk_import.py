@@ -0,0 +1,104 @@
+"""
+Benchmark bulk imports of users and game sessions against the per-row
+repository path they replace.
+
+Usage:
+    python -m benchmarks.bench_bulk_import --users 200000 --sessions 1000000
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from models.game_session import GameSession
+from models.user import User
+from repositories.game_session import GameSessionRepository
+from repositories.user import UserRepository
+from services.bulk_import import bulk_import
+from benchmarks.common import temporary_database, report, FAKE_PASSWORD_HASH
+
+
+def write_users(path, count):
+    with open(path, "w", encoding="utf-8") as handle:
+        for i in range(count):
+            handle.write(json.dumps({
+                "name": f"Legacy Player {i}",
+                "email": f"legacy{i}@example.com",
+                "password_hash": FAKE_PASSWORD_HASH,
+            }) + "\n")
+
+
+def write_sessions(path, count, users, seed=7):
+    rng = random.Random(seed)
+    now = datetime.now()
+    with open(path, "w", encoding="utf-8") as handle:
+        for _ in range(count):
+            started = now - timedelta(seconds=rng.randint(0, 365 * 86_400))
+            duration = rng.randint(5, 600)
+            handle.write(json.dumps({
+                "user_email": f"legacy{rng.randrange(users)}@example.com",
+                "game_id": "number_guessing",
+                "start_time": started.isoformat(),
+                "end_time": (started + timedelta(seconds=duration)).isoformat(),
+                "duration": duration,
+                "score": rng.randint(0, 4_000),
+                "completed": True,
+                "difficulty_level": rng.choice(("Easy", "Medium", "Hard")),
+                "session_data": {"attempts_used": rng.randint(1, 10)},
+            }) + "\n")
+
+
+def per_row_baseline(count):
+    """The path the importer replaces: one repository call (and commit) per row."""
+    users = [User.hydrate(None, f"Row Player {i}", f"row{i}@example.com", FAKE_PASSWORD_HASH, None)
+             for i in range(count)]
+    sessions = GameSessionRepository()
+
+    # The repositories log every query; keep the log out of the measurement output
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for user in users:
+            UserRepository.save(user)
+        user_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for user in users:
+            sessions.create(GameSession(user_id=user.id, game_id="number_guessing"))
+        session_elapsed = time.perf_counter() - start
+
+    return user_elapsed, session_elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000, help="Users to import")
+    parser.add_argument("--sessions", type=int, default=500_000, help="Sessions to import")
+    parser.add_argument("--baseline", type=int, default=2_000, help="Rows for the per-row repository baseline")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Records per transaction")
+    args = parser.parse_args()
+
+    with temporary_database("bench_import.db"), tempfile.TemporaryDirectory() as work_dir:
+        users_path = Path(work_dir) / "users.jsonl"
+        sessions_path = Path(work_dir) / "sessions.jsonl"
+        write_users(users_path, args.users)
+        write_sessions(sessions_path, args.sessions, args.users)
+
+        print()
+        user_elapsed, session_elapsed = per_row_baseline(args.baseline)
+        report("UserRepository.save per row (before)", args.baseline, user_elapsed, "rows")
+        report("GameSessionRepository.create per row (before)", args.baseline, session_elapsed, "rows")
+
+        stats = bulk_import(users_path, "users", batch_size=args.batch_size)
+        report("bulk_import users (after)", stats['inserted'], stats['seconds'], "rows")
+
+        stats = bulk_import(sessions_path, "sessions", batch_size=args.batch_size)
+        report("bulk_import sessions (after)", stats['inserted'], stats['seconds'], "rows")
+
+
+if __name__ == "__main__":
+    main()
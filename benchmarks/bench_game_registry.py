@@ -0,0 +1,103 @@
+"""
+Benchmark listing games: importing and instantiating every game (the old
+discover_games) against GameRegistry building and re-reading its manifest.
+
+Usage:
+    python -m benchmarks.bench_game_registry --games 100
+"""
+import argparse
+import importlib
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from games.registry import GameRegistry
+from benchmarks.common import report
+
+
+GAME_TEMPLATE = '''from rich.console import Console
+
+from games.base import BaseGame
+
+
+class Game{index}(BaseGame):
+    DIFFICULTY_LEVELS = ("Easy", "Medium", "Hard")
+
+    def __init__(self):
+        super().__init__(
+            game_id="bench_game_{index}",
+            name="Bench Game {index}",
+            description="Generated game number {index}",
+            difficulty="Medium"
+        )
+        self.console = Console()
+
+    def setup(self):
+        pass
+
+    def run(self):
+        pass
+'''
+
+
+def write_games(root, package, count):
+    games_dir = Path(root) / package
+    games_dir.mkdir()
+    (games_dir / "__init__.py").write_text("")
+    for index in range(count):
+        game_dir = games_dir / f"game{index}"
+        game_dir.mkdir()
+        (game_dir / "__init__.py").write_text("")
+        (game_dir / "game.py").write_text(GAME_TEMPLATE.format(index=index))
+    return games_dir
+
+
+def import_all(package, count):
+    """The old path: import every game module and construct every game."""
+    games = []
+    for index in range(count):
+        module = importlib.import_module(f"{package}.game{index}.game")
+        games.append(getattr(module, f"Game{index}")())
+    return games
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=100, help="Number of generated games")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="gamehub-bench-")
+    package = "bench_games"
+    try:
+        games_dir = write_games(root, package, args.games)
+        sys.path.insert(0, root)
+        cache_path = Path(root) / "manifest.json"
+
+        print()
+        start = time.perf_counter()
+        GameRegistry(games_dir, cache_path).games()
+        report("GameRegistry, manifest built (cold)", args.games, time.perf_counter() - start, "games")
+
+        start = time.perf_counter()
+        GameRegistry(games_dir, cache_path).games()
+        report("GameRegistry, manifest from disk (new run)", args.games, time.perf_counter() - start, "games")
+
+        registry = GameRegistry(games_dir, cache_path)
+        registry.games()
+        start = time.perf_counter()
+        registry.games()
+        report("GameRegistry, next menu loop", args.games, time.perf_counter() - start, "games")
+
+        start = time.perf_counter()
+        import_all(package, args.games)
+        report("import + instantiate every game (before)", args.games, time.perf_counter() - start, "games")
+    finally:
+        if root in sys.path:
+            sys.path.remove(root)
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
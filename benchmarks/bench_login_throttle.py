@@ -0,0 +1,64 @@
+"""
+Benchmark the CPU a credential flood costs with and without the login throttle.
+
+Replays `--attempts` wrong-password logins against one account, spread over
+`--seconds` of simulated time, once verifying every attempt with bcrypt (the
+old path) and once asking `check_login_attempt` first.
+
+Usage:
+    python -m benchmarks.bench_login_throttle --attempts 500 --seconds 60 --rounds 10
+"""
+import argparse
+import time
+
+from services.login_throttle import check_login_attempt
+from utils.password import PasswordHandler
+from benchmarks.common import temporary_database
+
+
+def flood(attempts, seconds, password_hash, throttled):
+    """
+    Run the simulated attack.
+
+    Returns:
+        tuple: (bcrypt verifies run, rejections, CPU seconds, CPU seconds spent rejecting)
+    """
+    start = time.time()
+    verifies = rejections = 0
+    reject_cpu = 0.0
+    cpu_start = time.process_time()
+    for i in range(attempts):
+        now = start + seconds * i / attempts
+        if throttled:
+            before = time.process_time()
+            allowed, _ = check_login_attempt("victim@example.com", host="bench-host", now=now)
+            if not allowed:
+                rejections += 1
+                reject_cpu += time.process_time() - before
+                continue
+        PasswordHandler.verify_password("wrong-password", password_hash)
+        verifies += 1
+    return verifies, rejections, time.process_time() - cpu_start, reject_cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--attempts", type=int, default=500, help="Login attempts in the flood")
+    parser.add_argument("--seconds", type=float, default=60, help="Simulated duration of the flood")
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt cost of the attacked account")
+    args = parser.parse_args()
+
+    password_hash = PasswordHandler.hash_password("correct-password", rounds=args.rounds)
+
+    with temporary_database("bench_throttle.db"):
+        print()
+        for label, throttled in (("no throttle (before)", False), ("token bucket (after)", True)):
+            verifies, rejections, cpu, reject_cpu = flood(args.attempts, args.seconds, password_hash, throttled)
+            line = f"{label:<24} {verifies:>6,} bcrypt verifies  {cpu:8.3f}s CPU"
+            if rejections:
+                line += f"  {rejections:,} rejected at {reject_cpu / rejections * 1e6:,.0f} us CPU each"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark the headless pygame backend: a tick-loop game moving sprites over a
+text HUD, presenting dirty rectangles versus the whole window every frame.
+
+Runs under SDL's dummy video driver, so it needs no display or GPU.
+
+Usage:
+    python -m benchmarks.bench_pygame_render --sprites 50 --seconds 3
+"""
+import argparse
+import time
+
+from games.base import BaseGame
+from games.game_io import ScriptedInput
+from games.pygame_io import PygameWindow, PygameOutput, BACKGROUND
+from benchmarks.common import report
+
+import pygame
+
+
+SPRITE_SIZE = 16
+
+
+class SpriteGame(BaseGame):
+    """Bounces sprites around the window and shows a score line."""
+
+    TICK_RATE = 60
+
+    def __init__(self, output, sprites, ticks, full_redraw=False):
+        super().__init__(game_id="pygame_bench", name="Pygame Bench", description="Pygame backend benchmark",
+                         input_provider=ScriptedInput([]), output=output)
+        self.sprite_count = sprites
+        self.ticks = ticks
+        self.full_redraw = full_redraw
+        self.image = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE))
+        self.image.fill((80, 200, 120))
+
+    def setup(self):
+        width, height = self.output.window.rect.size
+        self.sprites = [
+            [pygame.Rect(self.rng.randrange(width - SPRITE_SIZE), self.rng.randrange(40, height - SPRITE_SIZE),
+                         SPRITE_SIZE, SPRITE_SIZE), self.rng.choice((-3, 3)), self.rng.choice((-2, 2))]
+            for _ in range(self.sprite_count)
+        ]
+        self.previous = []
+
+    def update(self, dt):
+        bounds = self.output.window.rect
+        for sprite in self.sprites:
+            rect = sprite[0]
+            rect.move_ip(sprite[1], sprite[2])
+            if rect.left < 0 or rect.right > bounds.right:
+                sprite[1] = -sprite[1]
+            if rect.top < 40 or rect.bottom > bounds.bottom:
+                sprite[2] = -sprite[2]
+        if self.tick % 6 == 0:
+            self.update_score(1)
+        if self.tick + 1 >= self.ticks:
+            self.stop()
+
+    def render(self, alpha):
+        window = self.output.window
+        for rect in self.previous:
+            window.fill(BACKGROUND, rect)
+        self.previous = [window.blit(self.image, sprite[0]) for sprite in self.sprites]
+        # The HUD only changes every few ticks; unchanged rows aren't redrawn
+        self.output.items = [f"[bold]Score:[/bold] {self.score}   [dim]Tick {self.tick // 60 * 60}[/dim]"]
+        if self.full_redraw:
+            window.mark_dirty(window.rect)
+        self.output.flush()
+
+
+def run(args, full_redraw, realtime):
+    window = PygameWindow(headless=True)
+    game = SpriteGame(PygameOutput(window), args.sprites, int(args.seconds * SpriteGame.TICK_RATE), full_redraw)
+    game.realtime = realtime
+    start = time.perf_counter()
+    game.start(None, seed=1)
+    elapsed = time.perf_counter() - start
+    stats = window.frame_stats()
+    window.close()
+    return stats, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sprites", type=int, default=50, help="Moving sprites")
+    parser.add_argument("--seconds", type=float, default=3, help="Game time simulated per run")
+    args = parser.parse_args()
+    print()
+
+    for label, full_redraw in (("whole window every frame", True), ("dirty rectangles", False)):
+        stats, elapsed = run(args, full_redraw, realtime=False)
+        report(f"unpaced: {label}", stats['frames'], elapsed, "frames")
+        print(f"  {stats['pixels_per_frame']:,} pixels/frame, frame p50 <{stats['frame_ms_p50']} ms, "
+              f"max {stats['frame_ms_max']} ms")
+
+    stats, elapsed = run(args, full_redraw=False, realtime=True)
+    report(f"tick loop at {SpriteGame.TICK_RATE} Hz: dirty rectangles", stats['frames'], elapsed, "frames")
+    print(f"  expected {args.seconds:.3f}s, frame p99 <{stats['frame_ms_p99']} ms, max {stats['frame_ms_max']} ms")
+    for bucket, count in stats['buckets'].items():
+        if count:
+            print(f"    {bucket:>10} {count:>7,}")
+
+
+if __name__ == "__main__":
+    main()
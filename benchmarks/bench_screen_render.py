@@ -0,0 +1,96 @@
+"""
+Benchmark the differential Screen renderer against clearing and redrawing the
+whole screen with Rich, on an animated game board and on a menu redraw.
+
+Usage:
+    python -m benchmarks.bench_screen_render --frames 500
+"""
+import argparse
+import io
+import time
+
+from rich.console import Console, Group
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from utils.screen import Screen
+from benchmarks.common import report
+
+
+WIDTH, HEIGHT = 100, 40
+BOARD_WIDTH, BOARD_HEIGHT = 40, 20
+
+
+def board_frame(frame):
+    """A snake-like board: one moving head, a score line and a clock."""
+    head = frame % (BOARD_WIDTH * BOARD_HEIGHT)
+    rows = []
+    for y in range(BOARD_HEIGHT):
+        row = Text()
+        for x in range(BOARD_WIDTH):
+            cell = y * BOARD_WIDTH + x
+            if cell == head:
+                row.append("@", style="bold green")
+            elif 0 < head - cell < 5:
+                row.append("o", style="green")
+            else:
+                row.append(".", style="dim")
+        rows.append(row)
+    status = f"Score: [bold]{frame * 10}[/bold]   Time: {frame / 60:6.2f}s"
+    return Panel(Group(*rows, "", status), title="Snake", border_style="blue")
+
+
+def menu_frame(frame):
+    """The games menu, with the highlighted option changing."""
+    grid = Table.grid(padding=(0, 2))
+    grid.add_column(style="cyan", justify="right")
+    grid.add_column()
+    for i in range(1, 9):
+        grid.add_row(f"{i}.", f"[reverse]Game {i}[/reverse]" if i == frame % 8 + 1 else f"Game {i}")
+    return Group(Panel("[bold green]Welcome, Player![/bold green]\n\nEmail: player@example.com",
+                       title="CLI Game Collection", border_style="green"), grid, "─" * WIDTH)
+
+
+def terminal():
+    buffer = io.StringIO()
+    console = Console(file=buffer, width=WIDTH, height=HEIGHT, force_terminal=True, color_system="truecolor")
+    return console, buffer
+
+
+def full_redraw(make_frame, frames):
+    """The current approach: console.clear() then print the whole screen."""
+    console, buffer = terminal()
+    start = time.perf_counter()
+    for frame in range(frames):
+        console.clear()
+        console.print(make_frame(frame))
+    return len(buffer.getvalue().encode('utf-8')), time.perf_counter() - start
+
+
+def differential(make_frame, frames):
+    """Screen.frame(): only changed cells are written."""
+    console, buffer = terminal()
+    screen = Screen(console)
+    start = time.perf_counter()
+    for frame in range(frames):
+        screen.frame(make_frame(frame))
+    return screen.bytes_written, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=500, help="Frames drawn per scenario")
+    args = parser.parse_args()
+
+    for name, make_frame in (("game board", board_frame), ("menu", menu_frame)):
+        print()
+        for label, method in (("clear + full redraw", full_redraw), ("differential Screen", differential)):
+            written, elapsed = method(make_frame, args.frames)
+            report(f"{name}: {label}", args.frames, elapsed, "frames")
+            print(f"{'':<45} {written / args.frames:>12,.0f} bytes/frame, "
+                  f"{elapsed / args.frames * 1000:.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark streaming exports of game sessions in every supported format.
+
+Reports rows/s and, with --trace-memory, the peak Python heap used by each
+export, which should stay flat as --sessions grows.
+
+Usage:
+    python -m benchmarks.bench_session_export --sessions 1000000
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from services.session_export import export_sessions, EXPORT_FORMATS
+from benchmarks.common import temporary_database, seed_sessions, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=500_000, help="Number of sessions to seed")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows fetched per batch")
+    parser.add_argument("--trace-memory", action="store_true", help="Also measure peak Python heap per export")
+    args = parser.parse_args()
+
+    with temporary_database("bench_export.db"), tempfile.TemporaryDirectory() as out_dir:
+        start = time.perf_counter()
+        seed_sessions(args.sessions)
+        report("Seeding game_sessions", args.sessions, time.perf_counter() - start, "rows")
+
+        print()
+        for fmt in EXPORT_FORMATS:
+            output = Path(out_dir) / f"sessions.{fmt}"
+            stats = export_sessions(output, fmt, batch_size=args.batch_size)
+            label = f"export {fmt}"
+
+            if args.trace_memory:
+                # Separate traced run, tracemalloc slows the export down considerably
+                tracemalloc.start()
+                export_sessions(output, fmt, batch_size=args.batch_size)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                label += f" (peak heap {peak / 2**20:.1f} MiB)"
+
+            report(label, stats['rows'], stats['seconds'], "rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark BaseGame's fixed-timestep tick loop: pacing accuracy in real time
+and throughput on the virtual clock used by replays and simulations.
+
+Usage:
+    python -m benchmarks.bench_tick_loop --tick-rate 60 --seconds 3
+"""
+import argparse
+import time
+
+from games.base import BaseGame
+from games.game_io import NullOutput, ScriptedInput
+from benchmarks.common import report
+
+
+class TickGame(BaseGame):
+    """Minimal real-time game: moves a dot with a little work per tick."""
+
+    def __init__(self, tick_rate, ticks, work_us=0):
+        super().__init__(game_id="tick_bench", name="Tick Bench", description="Tick loop benchmark",
+                         input_provider=ScriptedInput([]), output=NullOutput())
+        self.TICK_RATE = tick_rate
+        self.ticks = ticks
+        self.work_ns = work_us * 1_000
+        self.position = 0
+
+    def setup(self):
+        self.position = 0
+
+    def update(self, dt):
+        self.position += self.rng.randint(-1, 1)
+        if self.work_ns:
+            deadline = time.perf_counter_ns() + self.work_ns
+            while time.perf_counter_ns() < deadline:
+                pass
+        if self.tick + 1 >= self.ticks:
+            self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tick-rate", type=int, default=60, help="Updates per second")
+    parser.add_argument("--seconds", type=float, default=3, help="Length of the real-time run")
+    parser.add_argument("--work-us", type=int, default=500, help="Busy work per update, in microseconds")
+    args = parser.parse_args()
+
+    ticks = int(args.tick_rate * args.seconds)
+    print()
+
+    game = TickGame(args.tick_rate, ticks, args.work_us)
+    start = time.perf_counter()
+    game.start(None, seed=1)
+    elapsed = time.perf_counter() - start
+    stats = game.frame_stats()
+    report(f"real time at {args.tick_rate} Hz", stats['ticks'], elapsed, "ticks")
+    print(f"  expected {args.seconds:.3f}s, drift {(elapsed - args.seconds) * 1000:+.1f} ms, "
+          f"{stats['dropped_ticks']} dropped ticks, frame work p50 {stats['frame_ms_p50']} ms, "
+          f"p99 {stats['frame_ms_p99']} ms, max {stats['frame_ms_max']} ms")
+
+    game = TickGame(args.tick_rate, ticks * 100)
+    game.realtime = False
+    start = time.perf_counter()
+    game.start(None, seed=1)
+    report("virtual clock (replays, simulations)", game.frame_stats()['ticks'], time.perf_counter() - start, "ticks")
+
+
+if __name__ == "__main__":
+    main()
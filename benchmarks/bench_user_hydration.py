@@ -0,0 +1,56 @@
+"""
+Benchmark how many users per second can be loaded for admin listings.
+
+Compares the validating constructor (the old hydration path) against the
+trusted `User.from_db_row` path and the `UserRepository.find_all` listing.
+
+Usage:
+    python -m benchmarks.bench_user_hydration --users 100000
+"""
+import argparse
+
+from db.connection import Database
+from models.user import User
+from repositories.user import UserRepository
+from benchmarks.common import temporary_database, seed_users, best_of, report
+
+
+def hydrate_validated(rows):
+    """Old path: every row goes through the validating setters."""
+    return [
+        User(id=row[0], name=row[1], email=row[2], password=row[3],
+             created_at=row[4], password_is_hashed=True)
+        for row in rows
+    ]
+
+
+def hydrate_trusted(rows):
+    """New path: rows are trusted and bypass validation."""
+    return [User.from_db_row(row) for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000, help="Number of users to seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    with temporary_database("bench_users.db"):
+        seed_users(args.users)
+
+        with Database.execute("SELECT id, name, email, password, created_at FROM users") as cursor:
+            rows = cursor.fetchall()
+
+        print()
+        _, elapsed = best_of(args.repeat, hydrate_validated, rows)
+        report("User(...) with validation (before)", len(rows), elapsed, "users")
+
+        _, elapsed = best_of(args.repeat, hydrate_trusted, rows)
+        report("User.from_db_row trusted (after)", len(rows), elapsed, "users")
+
+        users, elapsed = best_of(args.repeat, UserRepository.find_all)
+        report("UserRepository.find_all (query + hydrate)", len(users), elapsed, "users")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import json
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+
+from db.connection import Database
+from db.migration import MigrationManager
+
+
+# Placeholder bcrypt hash used when seeding rows, so seeding doesn't pay for hashing
+FAKE_PASSWORD_HASH = "$2b$12$" + "a" * 53
+
+
+@contextmanager
+def temporary_database(db_name="bench.db"):
+    """
+    Point the Database at a throwaway, fully migrated SQLite file
+
+    Args:
+        db_name (str): File name of the temporary database
+
+    Yields:
+        Path: Path of the temporary database file
+    """
+    data_dir = tempfile.mkdtemp(prefix="gamehub-bench-")
+    Database.close()
+    Database.initialize(db_name, data_dir=data_dir)
+    MigrationManager.migrate()
+    try:
+        yield Database._db_path
+    finally:
+        Database.close()
+        Database._db_path = None
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def seed_users(count):
+    """Insert `count` synthetic users in a single transaction."""
+    with Database.transaction() as connection:
+        connection.executemany(
+            "INSERT INTO users (name, email, password) VALUES (?, ?, ?)",
+            ((f"Player {i}", f"player{i}@example.com", FAKE_PASSWORD_HASH) for i in range(count))
+        )
+
+
+def seed_sessions(count, users=1_000, days=90, seed=42):
+    """Insert `count` synthetic finished number-guessing sessions in batched transactions."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    difficulties = ("Easy", "Medium", "Hard")
+
+    def rows(n):
+        for _ in range(n):
+            started = now - timedelta(seconds=rng.randint(0, days * 86_400))
+            duration = rng.randint(5, 600)
+            yield (
+                rng.randint(1, users), "number_guessing", started.isoformat(),
+                (started + timedelta(seconds=duration)).isoformat(), duration,
+                rng.randint(0, 4_000), 1, rng.choice(difficulties),
+                json.dumps({"attempts_used": rng.randint(1, 10)})
+            )
+
+    remaining = count
+    while remaining > 0:
+        batch = min(remaining, 100_000)
+        with Database.transaction() as connection:
+            connection.executemany(
+                "INSERT INTO game_sessions (user_id, game_id, start_time, end_time, duration, "
+                "score, completed, difficulty_level, session_data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows(batch)
+            )
+        remaining -= batch
+
+
+def best_of(repeat, func, *args, **kwargs):
+    """
+    Run a function several times and keep the fastest run
+
+    Returns:
+        tuple: (result, elapsed) for the fastest run, elapsed in seconds
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return result, best
+
+
+def report(label, count, elapsed, unit="rows"):
+    """Print one aligned throughput line."""
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"{label:<45} {count:>12,} {unit} in {elapsed:8.3f}s  ({rate:>14,.0f} {unit}/s)")
@@ -0,0 +1,228 @@
+import click
+
+from db.connection import Database
+from db.migration import MigrationManager
+from services.session_export import export_sessions as run_export, EXPORT_FORMATS
+from services.bulk_import import bulk_import, BulkImportError, DEFAULT_BATCH_SIZE
+from services.provisioning import provision_users as run_provisioning, DEFAULT_BATCH_SIZE as PROVISION_BATCH_SIZE
+from utils.password import PasswordHandler, MIN_ROUNDS, MAX_ROUNDS
+from utils.config import Config
+from services.login_throttle import prune_idle_buckets
+from services.simulation import simulate as run_simulation, SimulationError, DEFAULT_CHUNK_SIZE as SIMULATION_CHUNK_SIZE
+from games.bots import BOTS
+from services.replay import audit_scores as run_audit, DEFAULT_BATCH_SIZE as AUDIT_BATCH_SIZE
+from services.retention import rollup_old_sessions, purge_deleted_users as run_purge, DEFAULT_CHUNK_SIZE as ROLLUP_CHUNK_SIZE
+
+
+@click.group()
+def cli():
+    """Maintenance commands for the CLI Game Collection."""
+    Database.initialize()
+    MigrationManager.migrate()
+
+
+@cli.command("export-sessions")
+@click.argument("output", type=click.Path(dir_okay=True, writable=True))
+@click.option("--format", "fmt", type=click.Choice(EXPORT_FORMATS), default="csv", show_default=True,
+              help="csv/jsonl write one file; npy writes a directory of memory-mappable column files.")
+@click.option("--user-id", type=int, help="Only export sessions played by this user.")
+@click.option("--game-id", help="Only export sessions of this game.")
+@click.option("--since", type=click.DateTime(), help="Only sessions started at or after this time.")
+@click.option("--until", type=click.DateTime(), help="Only sessions started before this time.")
+@click.option("--batch-size", type=int, default=10_000, show_default=True, help="Rows fetched per batch.")
+def export_sessions(output, fmt, user_id, game_id, since, until, batch_size):
+    """Stream game sessions to OUTPUT."""
+    stats = run_export(output, fmt, user_id=user_id, game_id=game_id,
+                       since=since, until=until, batch_size=batch_size)
+    click.echo(f"Exported {stats['rows']:,} sessions to {stats['output']} "
+               f"in {stats['seconds']:.2f}s ({stats['rows_per_second']:,.0f} rows/s)")
+
+
+def _run_import(path, kind, batch_size, rejects, restart):
+    def progress(stats):
+        click.echo(f"  {stats['read']:,} read, {stats['inserted']:,} inserted, "
+                   f"{stats['rejected']:,} rejected ({stats['rows_per_second']:,.0f} rows/s)")
+
+    try:
+        stats = bulk_import(path, kind, batch_size=batch_size, rejects_path=rejects,
+                            restart=restart, progress=progress)
+    except BulkImportError as e:
+        raise click.ClickException(str(e))
+
+    if stats['resumed_from']:
+        click.echo(f"Resumed after {stats['resumed_from']:,} records from the last checkpoint")
+    click.echo(f"Imported {stats['inserted']:,} {kind} ({stats['skipped']:,} duplicates skipped, "
+               f"{stats['rejected']:,} rejected) in {stats['seconds']:.2f}s "
+               f"({stats['rows_per_second']:,.0f} rows/s)")
+
+
+def _import_options(command):
+    command = click.option("--restart", is_flag=True, help="Ignore the checkpoint and import from the start.")(command)
+    command = click.option("--rejects", type=click.Path(dir_okay=False, writable=True),
+                           help="Write rejected records to this JSONL file.")(command)
+    command = click.option("--batch-size", type=click.IntRange(min=1), default=DEFAULT_BATCH_SIZE, show_default=True,
+                           help="Records per transaction (and checkpoint interval).")(command)
+    return click.argument("path", type=click.Path(exists=True, dir_okay=False))(command)
+
+
+@cli.command("import-users")
+@_import_options
+def import_users(path, batch_size, rejects, restart):
+    """Bulk import users (with existing bcrypt hashes) from a JSONL or CSV file."""
+    _run_import(path, "users", batch_size, rejects, restart)
+
+
+@cli.command("import-sessions")
+@_import_options
+def import_sessions(path, batch_size, rejects, restart):
+    """Bulk import game sessions from a JSONL or CSV file."""
+    _run_import(path, "sessions", batch_size, rejects, restart)
+
+
+@cli.command("purge-deleted-users")
+@click.option("--older-than-days", type=click.FloatRange(min=0),
+              help="Purge accounts deleted at least this long ago (default: ACCOUNT_PURGE_DAYS, 30).")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=ROLLUP_CHUNK_SIZE, show_default=True,
+              help="Game sessions deleted per transaction.")
+def purge_deleted_users(older_than_days, chunk_size):
+    """Permanently remove soft-deleted accounts and their game sessions."""
+    stats = run_purge(older_than_days, chunk_size=chunk_size)
+    click.echo(f"Purged {stats['users_purged']:,} accounts deleted before {stats['cutoff']} UTC "
+               f"and {stats['sessions_deleted']:,} of their sessions in {stats['chunks']} chunks "
+               f"({stats['seconds']:.2f}s)")
+
+
+@cli.command("provision-users")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--workers", type=click.IntRange(min=1), help="Hashing processes (default: one per core).")
+@click.option("--batch-size", type=int, default=PROVISION_BATCH_SIZE, show_default=True,
+              help="Accounts inserted per transaction.")
+@click.option("--rounds", type=click.IntRange(MIN_ROUNDS, MAX_ROUNDS),
+              help="bcrypt cost (default: BCRYPT_ROUNDS).")
+@click.option("--rejects", type=click.Path(dir_okay=False, writable=True),
+              help="Write rejected rows (without passwords) to this JSONL file.")
+def provision_users(path, workers, batch_size, rounds, rejects):
+    """Create accounts from a CSV/JSONL file with name, email and password columns."""
+    def progress(stats):
+        click.echo(f"  {stats['read']:,} read, {stats['provisioned']:,} created, "
+                   f"{stats['rejected']:,} rejected ({stats['rows_per_second']:,.1f} accounts/s)")
+
+    try:
+        stats = run_provisioning(path, workers=workers, batch_size=batch_size, rounds=rounds,
+                                 rejects_path=rejects, progress=progress)
+    except BulkImportError as e:
+        raise click.ClickException(str(e))
+
+    click.echo(f"Created {stats['provisioned']:,} accounts ({stats['rejected']:,} rejected) "
+               f"in {stats['seconds']:.2f}s with {stats['workers']} hashing workers at cost {stats['rounds']}")
+    for name, stage in stats['stages'].items():
+        click.echo(f"  {name:<6} {stage['rows']:>9,} rows {stage['rows_per_second']:>12,.1f} rows/s")
+
+
+@cli.command("simulate")
+@click.option("--game-id", default="number_guessing", show_default=True, help="Game to play.")
+@click.option("--strategy", "strategies", type=click.Choice(sorted(BOTS)), multiple=True,
+              help="Bot strategy; repeat to compare several (default: all).")
+@click.option("--difficulty", help="Difficulty level (default: the game's default).")
+@click.option("--games", type=click.IntRange(min=1), default=10_000, show_default=True,
+              help="Games played per strategy.")
+@click.option("--workers", type=click.IntRange(min=1), help="Worker processes (default: one per core).")
+@click.option("--seed", type=int, default=0, show_default=True, help="Base seed; the same seed replays the same games.")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=SIMULATION_CHUNK_SIZE, show_default=True,
+              help="Games per worker task.")
+@click.option("--record", is_flag=True, help="Also write every session to an in-memory database per worker.")
+def simulate(game_id, strategies, difficulty, games, workers, seed, chunk_size, record):
+    """Play a game many times with bots and report scores, win rates and attempts."""
+    for strategy in strategies or sorted(BOTS):
+        try:
+            stats = run_simulation(game_id, strategy, games, difficulty=difficulty, workers=workers,
+                                   seed=seed, chunk_size=chunk_size, record=record)
+        except SimulationError as e:
+            raise click.ClickException(str(e))
+
+        click.echo(f"{strategy} ({stats['difficulty']}): {stats['games']:,} games, "
+                   f"win rate {stats['win_rate']:.1%}, mean score {stats['mean_score']:,.1f} "
+                   f"(p50 {stats['score_p50']:,}, p90 {stats['score_p90']:,}), "
+                   f"mean attempts {stats['mean_attempts']:.2f}")
+        click.echo(f"  {stats['seconds']:.2f}s with {stats['workers']} workers: "
+                   f"{stats['games_per_second']:,.0f} games/s, "
+                   f"{stats['games_per_second_per_core']:,.0f} games/s per core")
+        for attempts, count in stats['attempts'].items():
+            click.echo(f"  {attempts:>3} attempts {count:>10,} {count / stats['games']:>7.1%}")
+
+
+@cli.command("audit-scores")
+@click.option("--game-id", help="Only audit sessions of this game.")
+@click.option("--since", type=click.DateTime(), help="Only sessions started at or after this time.")
+@click.option("--until", type=click.DateTime(), help="Only sessions started before this time.")
+@click.option("--workers", type=click.IntRange(min=1), help="Replay processes (default: one per core).")
+@click.option("--batch-size", type=click.IntRange(min=1), default=AUDIT_BATCH_SIZE, show_default=True,
+              help="Sessions per worker task.")
+def audit_scores(game_id, since, until, workers, batch_size):
+    """Replay recorded sessions and check they reproduce their stored scores."""
+    stats = run_audit(game_id=game_id, since=since, until=until, workers=workers, batch_size=batch_size)
+    click.echo(f"Replayed {stats['replayed']:,} of {stats['sessions']:,} sessions "
+               f"({stats['skipped']:,} skipped without a seed or recorded inputs) in {stats['seconds']:.2f}s: "
+               f"{stats['sessions_per_second']:,.0f} sessions/s, "
+               f"{stats['sessions_per_second_per_core']:,.0f} per core")
+    for mismatch in stats['mismatches']:
+        click.echo(f"  session {mismatch['id']}: stored {mismatch['stored_score']}, "
+                   f"replayed {mismatch['replayed_score']} ({mismatch['inputs_left']} inputs left)")
+    if stats['mismatched']:
+        raise click.ClickException(f"{stats['mismatched']:,} sessions did not reproduce their stored score")
+    click.echo(f"All {stats['matched']:,} replayed sessions match their stored score")
+
+
+@cli.command("rollup-sessions")
+@click.option("--older-than-days", type=click.IntRange(min=0), required=True,
+              help="Roll up sessions started before midnight this many days ago.")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=ROLLUP_CHUNK_SIZE, show_default=True,
+              help="Sessions rolled up and deleted per transaction.")
+@click.option("--no-vacuum", is_flag=True, help="Skip PRAGMA incremental_vacuum afterwards.")
+def rollup_sessions(older_than_days, chunk_size, no_vacuum):
+    """Compact old game sessions into daily aggregates."""
+    stats = rollup_old_sessions(older_than_days, chunk_size=chunk_size, vacuum=not no_vacuum)
+    click.echo(f"Rolled up {stats['rolled_up']:,} sessions started before {stats['cutoff']} "
+               f"in {stats['chunks']} chunks, freed {stats['pages_freed']:,} pages "
+               f"({stats['seconds']:.2f}s)")
+
+
+@cli.command("prune-login-throttle")
+@click.option("--max-idle-hours", type=float, default=24, show_default=True,
+              help="Drop login throttle buckets untouched for this long.")
+def prune_login_throttle(max_idle_hours):
+    """Delete idle login throttle buckets."""
+    deleted = prune_idle_buckets(max_idle_seconds=max_idle_hours * 3600)
+    click.echo(f"Deleted {deleted:,} idle login throttle buckets")
+
+
+@cli.command("calibrate-bcrypt")
+@click.option("--target-ms", type=float, default=250, show_default=True,
+              help="Maximum time one password hash may take on this machine.")
+@click.option("--samples", type=click.IntRange(min=1), default=3, show_default=True, help="Hashes timed per cost.")
+@click.option("--dry-run", is_flag=True, help="Only report, don't store the chosen cost.")
+def calibrate_bcrypt(target_ms, samples, dry_run):
+    """Pick the highest bcrypt cost that hashes within --target-ms and store it."""
+    current = PasswordHandler.rounds()
+    chosen, timings = PasswordHandler.calibrate_rounds(target_ms, samples=samples)
+
+    for rounds, ms in timings.items():
+        marker = " <- chosen" if rounds == chosen else ""
+        click.echo(f"  cost {rounds:>2}: {ms:8.1f} ms{marker}")
+
+    if chosen == MIN_ROUNDS and timings[MIN_ROUNDS] > target_ms:
+        click.echo(f"Warning: even the minimum cost ({MIN_ROUNDS}) exceeds {target_ms:g} ms on this machine")
+    elif chosen == MAX_ROUNDS:
+        click.echo(f"Capped at the maximum supported cost ({MAX_ROUNDS})")
+
+    if dry_run:
+        click.echo(f"Current cost {current}, calibrated cost {chosen} (not saved)")
+        return
+
+    Config.set("BCRYPT_ROUNDS", chosen)
+    click.echo(f"BCRYPT_ROUNDS set to {chosen} (was {current}) in {Config.ENV_FILE}; "
+               f"weaker hashes are upgraded at the next login")
+
+
+if __name__ == "__main__":
+    cli()
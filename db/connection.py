@@ -1,6 +1,10 @@
 import sqlite3
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+
+
+# Database name for a throwaway database that lives in this process only
+MEMORY = ":memory:"
 
 
 class Database:
@@ -10,10 +14,13 @@ class Database:
     _connection = None
 
     @classmethod
-    def initialize(cls, db_name="archive.db"):
-        """Initialize the database path."""
-        data_dir = Path("db/data")
-        data_dir.mkdir(exist_ok=True)
+    def initialize(cls, db_name="archive.db", data_dir="db/data"):
+        """Initialize the database path (":memory:" for a private in-memory database)."""
+        if db_name == MEMORY:
+            cls._db_path = MEMORY
+            return
+        data_dir = Path(data_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
         cls._db_path = data_dir / db_name
 
     @classmethod
@@ -101,6 +108,134 @@ class Database:
                 cls._connection.rollback()
             raise
 
+    @classmethod
+    @contextmanager
+    def transaction(cls):
+        """
+        Run several statements atomically on the shared connection.
+
+        Statements issued on the yielded connection are committed together when
+        the block exits, or rolled back if it raises. Use it for batched writes
+        (executemany) instead of execute(), which commits every statement.
+
+        Yields:
+            sqlite3.Connection: The shared connection, inside BEGIN IMMEDIATE
+        """
+        connection = cls._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        else:
+            connection.execute("COMMIT")
+
+    @classmethod
+    @contextmanager
+    def readonly(cls):
+        """
+        Open a separate read-only connection for long-running reads.
+
+        Analytics and exports scan large tables; running them on their own
+        read-only connection keeps them from holding up writes on the shared one.
+
+        Yields:
+            sqlite3.Connection: Read-only connection to the database
+        """
+        if cls._db_path is None:
+            cls.initialize()
+
+        uri = f"{Path(cls._db_path).resolve().as_uri()}?mode=ro"
+        connection = sqlite3.connect(uri, uri=True, timeout=30)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @classmethod
+    @contextmanager
+    def snapshot(cls):
+        """
+        Open a read-only connection whose queries all see the same state.
+
+        The connection stays inside one read transaction, so rows committed or
+        deleted by other connections meanwhile are not seen, e.g. between
+        counting rows and reading them.
+
+        Yields:
+            sqlite3.Connection: Read-only connection inside BEGIN
+        """
+        with cls.readonly() as connection:
+            connection.execute("BEGIN")
+            try:
+                yield connection
+            finally:
+                connection.execute("ROLLBACK")
+
+    @classmethod
+    def iter_batches(cls, query, params=None, batch_size=10_000, connection=None):
+        """
+        Stream the results of a query in batches over a read-only connection.
+
+        Args:
+            query (str): SQL query to execute
+            params (tuple, optional): Query parameters
+            batch_size (int): Maximum number of rows per batch
+            connection (sqlite3.Connection, optional): Connection to read with, e.g.
+                from snapshot(); a new read-only connection by default
+
+        Yields:
+            list: Up to `batch_size` row tuples at a time
+        """
+        with nullcontext(connection) if connection is not None else cls.readonly() as connection:
+            cursor = connection.execute(query, params or ())
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                cursor.close()
+
+    @classmethod
+    def incremental_vacuum(cls, pages=None):
+        """
+        Return free pages to the file system (needs auto_vacuum=INCREMENTAL).
+
+        Args:
+            pages (int, optional): Maximum number of pages to free, all if omitted
+
+        Returns:
+            int: Number of pages freed
+        """
+        connection = cls._connect()
+        before = connection.execute("PRAGMA freelist_count").fetchone()[0]
+        # The pragma frees one page per step and execute() only steps once;
+        # executescript() runs it to completion
+        argument = "" if pages is None else f"({int(pages)})"
+        connection.executescript(f"PRAGMA incremental_vacuum{argument};")
+        # Fold the WAL back in so the main file actually shrinks
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        after = connection.execute("PRAGMA freelist_count").fetchone()[0]
+        return before - after
+
+    @classmethod
+    def data_version(cls):
+        """
+        Change counter for commits made by other connections.
+
+        SQLite bumps PRAGMA data_version whenever another connection (or
+        process) commits to the database, so cached reads can tell when they
+        may be stale. Commits on the shared connection itself do not change it.
+
+        Returns:
+            tuple: (connection id, data_version); a reconnect also counts as a change
+        """
+        connection = cls._connect()
+        return id(connection), connection.execute("PRAGMA data_version").fetchone()[0]
+
     @classmethod
     def close(cls):
         """Close the database connection."""
@@ -1,6 +1,6 @@
-def up(cursor):
+def up():
     """Create game_sessions table."""
-    cursor.execute('''
+    return """
     CREATE TABLE IF NOT EXISTS game_sessions (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         user_id INTEGER NOT NULL,
@@ -13,14 +13,16 @@ def up(cursor):
         difficulty_level TEXT,
         session_data TEXT,
         FOREIGN KEY (user_id) REFERENCES users(id)
-    )
-    ''')
-    
-    # Create an index on user_id for faster queries
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_game_sessions_user_id ON game_sessions(user_id)')
+    );
 
+    -- Create an index on user_id for faster queries
+    CREATE INDEX IF NOT EXISTS idx_game_sessions_user_id ON game_sessions(user_id);
+    """
 
-def down(cursor):
+
+def down():
     """Drop game_sessions table."""
-    cursor.execute('DROP TABLE IF EXISTS game_sessions')
-    cursor.execute('DROP INDEX IF EXISTS idx_game_sessions_user_id')
\ No newline at end of file
+    return """
+    DROP INDEX IF EXISTS idx_game_sessions_user_id;
+    DROP TABLE IF EXISTS game_sessions;
+    """
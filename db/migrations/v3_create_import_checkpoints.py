@@ -0,0 +1,20 @@
+def up():
+    """Create import_checkpoints table used to resume bulk imports."""
+    return """
+    CREATE TABLE IF NOT EXISTS import_checkpoints (
+        source TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        records INTEGER NOT NULL DEFAULT 0,
+        deferred_indexes TEXT,
+        completed_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (source, kind)
+    );
+    """
+
+
+def down():
+    """Remove import_checkpoints table."""
+    return """
+    DROP TABLE IF EXISTS import_checkpoints;
+    """
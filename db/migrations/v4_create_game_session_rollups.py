@@ -0,0 +1,47 @@
+def up():
+    """Create rollup tables for retention and switch the file to incremental auto-vacuum."""
+    return """
+    -- Daily aggregates of game sessions removed by the retention job
+    CREATE TABLE IF NOT EXISTS game_session_daily (
+        day TEXT NOT NULL,
+        game_id TEXT NOT NULL,
+        difficulty_level TEXT NOT NULL DEFAULT '',
+        sessions INTEGER NOT NULL DEFAULT 0,
+        completed INTEGER NOT NULL DEFAULT 0,
+        scored INTEGER NOT NULL DEFAULT 0,
+        score_sum INTEGER NOT NULL DEFAULT 0,
+        score_sq_sum REAL NOT NULL DEFAULT 0,
+        score_min INTEGER,
+        score_max INTEGER,
+        timed INTEGER NOT NULL DEFAULT 0,
+        total_duration REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, game_id, difficulty_level)
+    ) WITHOUT ROWID;
+
+    -- Best score per player of rolled-up sessions, so leaderboards survive retention
+    CREATE TABLE IF NOT EXISTS game_user_best (
+        game_id TEXT NOT NULL,
+        difficulty_level TEXT NOT NULL DEFAULT '',
+        user_id INTEGER NOT NULL,
+        best_score INTEGER NOT NULL,
+        PRIMARY KEY (game_id, difficulty_level, user_id)
+    ) WITHOUT ROWID;
+
+    -- The retention job and time-window queries select sessions by start_time
+    CREATE INDEX IF NOT EXISTS idx_game_sessions_start_time ON game_sessions(start_time);
+
+    -- auto_vacuum only changes on an existing file after a VACUUM
+    PRAGMA auto_vacuum = INCREMENTAL;
+    VACUUM;
+    """
+
+
+def down():
+    """Drop rollup tables."""
+    return """
+    DROP INDEX IF EXISTS idx_game_sessions_start_time;
+    DROP TABLE IF EXISTS game_user_best;
+    DROP TABLE IF EXISTS game_session_daily;
+    PRAGMA auto_vacuum = NONE;
+    VACUUM;
+    """
@@ -0,0 +1,89 @@
+def up():
+    """Rebuild users.email as COLLATE NOCASE with a unique index, merging case-only duplicates."""
+    return """
+    BEGIN;
+
+    -- Accounts whose email differs only by case from an older account
+    CREATE TEMP TABLE user_email_duplicates AS
+    SELECT u.id AS duplicate_id, k.keep_id
+    FROM users u
+    JOIN (
+        SELECT lower(email) AS email_key, MIN(id) AS keep_id
+        FROM users
+        GROUP BY lower(email)
+        HAVING COUNT(*) > 1
+    ) k ON lower(u.email) = k.email_key
+    WHERE u.id != k.keep_id;
+
+    -- Their history moves to the oldest account
+    UPDATE game_sessions
+    SET user_id = (SELECT keep_id FROM user_email_duplicates WHERE duplicate_id = game_sessions.user_id)
+    WHERE user_id IN (SELECT duplicate_id FROM user_email_duplicates);
+
+    INSERT INTO game_user_best (game_id, difficulty_level, user_id, best_score)
+    SELECT b.game_id, b.difficulty_level, d.keep_id, MAX(b.best_score)
+    FROM game_user_best b
+    JOIN user_email_duplicates d ON b.user_id = d.duplicate_id
+    WHERE true
+    GROUP BY 1, 2, 3
+    ON CONFLICT (game_id, difficulty_level, user_id) DO UPDATE SET
+        best_score = MAX(best_score, excluded.best_score);
+
+    DELETE FROM game_user_best WHERE user_id IN (SELECT duplicate_id FROM user_email_duplicates);
+
+    -- SQLite cannot change a column's collation in place, so rebuild the table
+    CREATE TABLE users_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL COLLATE NOCASE,
+        password TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    INSERT INTO users_new (id, name, email, password, created_at)
+    SELECT id, name, email, password, created_at
+    FROM users
+    WHERE id NOT IN (SELECT duplicate_id FROM user_email_duplicates);
+
+    -- Keep AUTOINCREMENT from handing out IDs of deleted accounts again
+    UPDATE sqlite_sequence
+    SET seq = MAX(seq, (SELECT seq FROM sqlite_sequence WHERE name = 'users'))
+    WHERE name = 'users_new';
+
+    DROP TABLE users;
+    ALTER TABLE users_new RENAME TO users;
+
+    -- Inherits the column's NOCASE collation, so `email = ?` is a single index seek
+    CREATE UNIQUE INDEX idx_users_email ON users(email);
+
+    DROP TABLE user_email_duplicates;
+
+    COMMIT;
+    """
+
+
+def down():
+    """Restore the case-sensitive UNIQUE email column."""
+    return """
+    BEGIN;
+
+    CREATE TABLE users_old (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        password TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    INSERT INTO users_old (id, name, email, password, created_at)
+    SELECT id, name, email, password, created_at FROM users;
+
+    UPDATE sqlite_sequence
+    SET seq = MAX(seq, (SELECT seq FROM sqlite_sequence WHERE name = 'users'))
+    WHERE name = 'users_old';
+
+    DROP TABLE users;
+    ALTER TABLE users_old RENAME TO users;
+
+    COMMIT;
+    """
@@ -0,0 +1,17 @@
+def up():
+    """Create login_buckets table backing the login throttle."""
+    return """
+    -- One token bucket per throttled key ('email:...' or 'host:...')
+    CREATE TABLE IF NOT EXISTS login_buckets (
+        key TEXT PRIMARY KEY,
+        tokens REAL NOT NULL,
+        updated_at REAL NOT NULL
+    ) WITHOUT ROWID;
+    """
+
+
+def down():
+    """Remove login_buckets table."""
+    return """
+    DROP TABLE IF EXISTS login_buckets;
+    """
@@ -0,0 +1,23 @@
+def up():
+    """Create sessions table tracking "remember me" tokens for revocation."""
+    return """
+    -- One row per issued token; id is the token's jti claim
+    CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY,
+        user_id INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        expires_at REAL NOT NULL,
+        revoked_at TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
+    """
+
+
+def down():
+    """Remove sessions table."""
+    return """
+    DROP INDEX IF EXISTS idx_sessions_user_id;
+    DROP TABLE IF EXISTS sessions;
+    """
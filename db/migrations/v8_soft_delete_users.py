@@ -0,0 +1,26 @@
+def up():
+    """Add users.deleted_at for soft deletes, with partial indexes over active and deleted accounts."""
+    return """
+    ALTER TABLE users ADD COLUMN deleted_at TIMESTAMP;
+
+    -- Email must be unique among active accounts only, so a deleted account
+    -- doesn't block its address; lookups filter on deleted_at IS NULL to use it
+    DROP INDEX IF EXISTS idx_users_email;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email_active ON users(email) WHERE deleted_at IS NULL;
+
+    -- Only deleted accounts are indexed here, for restores and the purge job
+    CREATE INDEX IF NOT EXISTS idx_users_deleted_at ON users(deleted_at) WHERE deleted_at IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS idx_users_deleted_email ON users(email) WHERE deleted_at IS NOT NULL;
+    """
+
+
+def down():
+    """Drop soft-delete support; deleted accounts are removed."""
+    return """
+    DROP INDEX IF EXISTS idx_users_deleted_email;
+    DROP INDEX IF EXISTS idx_users_deleted_at;
+    DROP INDEX IF EXISTS idx_users_email_active;
+    DELETE FROM users WHERE deleted_at IS NOT NULL;
+    ALTER TABLE users DROP COLUMN deleted_at;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users(email);
+    """
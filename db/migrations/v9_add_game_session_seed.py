@@ -0,0 +1,13 @@
+def up():
+    """Add game_sessions.seed, the seed of the game's random numbers, so sessions can be replayed."""
+    return """
+    -- NULL for sessions played before seeds were recorded; those can't be replayed
+    ALTER TABLE game_sessions ADD COLUMN seed INTEGER;
+    """
+
+
+def down():
+    """Drop game_sessions.seed."""
+    return """
+    ALTER TABLE game_sessions DROP COLUMN seed;
+    """
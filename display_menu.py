@@ -1,4 +1,4 @@
-from datetime import time
+from datetime import time, datetime, timedelta
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -6,7 +6,13 @@ from prompt_toolkit import prompt
 from prompt_toolkit.contrib.completers import WordCompleter
 
 from services import user as user_service
-from utils.game_helper import discover_games, select_difficulty_and_run_game
+from services import score_analytics
+from services.retention import DEFAULT_PURGE_DAYS
+from games.registry import GameRegistry
+from games.game_io import ScreenOutput
+from utils.game_helper import select_difficulty_and_run_game
+from utils.screen import Screen
+from utils.config import Config
 from utils.session import Session
 from utils.game_session_tracker import GameSessionTracker
 
@@ -26,7 +32,8 @@ def display_menu(options, user=None, subtitle="Main Menu", border_style="blue",
     Returns:
         int: The selected option index (1-based)
     """
-    console = Console()
+    # Shared differential screen: repaints in place instead of clearing first
+    console = Screen.default()
 
     # Clear the screen for better presentation
     console.clear()
@@ -263,11 +270,15 @@ def show_delete_account_screen():
     console = Console()
     console.clear()
     
+    # The same restore window purge_deleted_users applies
+    purge_days = Config.get_float("ACCOUNT_PURGE_DAYS", DEFAULT_PURGE_DAYS)
+    
     # Create a warning panel
     console.print(Panel(
         "[bold red]⚠️  ACCOUNT DELETION WARNING ⚠️[/bold red]\n\n"
-        "This action will permanently delete your account and all associated data.\n"
-        "This cannot be undone.",
+        "This action will delete your account. You can restore it by logging in\n"
+        f"within {purge_days:g} day{'' if purge_days == 1 else 's'}; "
+        "after that it and all associated data are permanently removed.",
         title="Delete Account",
         border_style="red",
         padding=(1, 2)
@@ -331,8 +342,9 @@ def show_games_menu(user):
     Returns:
         bool: True to continue the session
     """
-    console = Console()
+    console = Screen.default()
     session_tracker = GameSessionTracker()
+    registry = GameRegistry.default()
     
     try:
         while True:
@@ -345,11 +357,11 @@ def show_games_menu(user):
                 subtitle="Choose a game to play"
             ))
             
-            # Dynamically load available games
-            games = discover_games()
+            # Installed games, from the cached manifest (nothing is imported yet)
+            games = registry.games()
             
             # Create menu options from available games
-            game_options = [game.get_info()["name"] for game in games]
+            game_options = [game.name for game in games]
             game_options.append("Return to Main Menu")
             
             # Display menu and get user choice
@@ -367,7 +379,10 @@ def show_games_menu(user):
                 
                 # Get the selected game
                 if 1 <= choice <= len(games):
-                    selected_game = games[choice - 1]
+                    # Only the selected game's module is imported
+                    selected_game = games[choice - 1].create()
+                    # Draw on the same screen, so game updates only rewrite what changed
+                    selected_game.set_io(output=ScreenOutput(console))
                     
                     # Let user select difficulty and play the game
                     select_difficulty_and_run_game(selected_game, user, console, session_tracker)
@@ -386,6 +401,97 @@ def show_games_menu(user):
         return True  # Return to main menu
 
 
+def show_score_analytics_screen():
+    """
+    Display score analytics per game and difficulty for an optional time window
+
+    Returns:
+        bool: Always returns True to continue the session
+    """
+    console = Console()
+    console.clear()
+
+    console.print(Panel("[bold]Score Analytics[/bold]", border_style="magenta"))
+
+    # Optional time window, in days back from now
+    days = prompt("\nLimit to the last N days (leave blank for all time): ").strip()
+    since = None
+    if days:
+        if not days.isdigit() or int(days) == 0:
+            console.print("[red]Please enter a positive whole number of days.[/red]")
+            console.print("\nPress Enter to return to the main menu...")
+            input()
+            return True
+        since = datetime.now() - timedelta(days=int(days))
+
+    with console.status("[cyan]Crunching game sessions...[/cyan]"):
+        results = score_analytics.compute_score_analytics(since=since)
+
+    if not results:
+        console.print("[yellow]No game sessions recorded for this period.[/yellow]")
+        console.print("\nPress Enter to return to the main menu...")
+        input()
+        return True
+
+    window = f"last {days} days" if since else "all time"
+
+    # Score distribution table
+    scores_table = Table(title=f"Scores ({window})", border_style="magenta")
+    if any(row['rolled_up'] for row in results):
+        scores_table.caption = "Percentiles and duration buckets cover sessions not yet rolled up by retention"
+    scores_table.add_column("Game", style="cyan")
+    scores_table.add_column("Difficulty")
+    scores_table.add_column("Sessions", justify="right")
+    scores_table.add_column("Completion", justify="right")
+    scores_table.add_column("Mean", justify="right")
+    scores_table.add_column("Std", justify="right")
+    scores_table.add_column("Min", justify="right")
+    for p in score_analytics.PERCENTILES:
+        scores_table.add_column(f"P{p}", justify="right")
+    scores_table.add_column("Max", justify="right")
+
+    def fmt(value):
+        if value is None:
+            return "-"
+        return f"{value:,.1f}" if isinstance(value, float) else f"{value:,}"
+
+    for row in results:
+        scores_table.add_row(
+            row['game_id'],
+            row['difficulty'] or "-",
+            f"{row['sessions']:,}",
+            f"{row['completion_rate']:.1%}",
+            fmt(row['score_mean']),
+            fmt(row['score_std']),
+            fmt(row['score_min']),
+            *(fmt(row['score_percentiles'][p]) for p in score_analytics.PERCENTILES),
+            fmt(row['score_max'])
+        )
+    console.print(scores_table)
+
+    # Duration histogram table
+    labels = score_analytics.duration_bucket_labels()
+    duration_table = Table(title=f"Session durations ({window})", border_style="magenta")
+    duration_table.add_column("Game", style="cyan")
+    duration_table.add_column("Difficulty")
+    duration_table.add_column("Mean", justify="right")
+    for label in labels:
+        duration_table.add_column(label, justify="right")
+
+    for row in results:
+        duration_table.add_row(
+            row['game_id'],
+            row['difficulty'] or "-",
+            f"{row['duration_mean']:.1f}s" if row['duration_mean'] is not None else "-",
+            *(f"{count:,}" for count in row['duration_histogram'])
+        )
+    console.print(duration_table)
+
+    console.print("\nPress Enter to return to the main menu...")
+    input()
+    return True
+
+
 def show_main_menu():
     """Display main application menu for authenticated users."""
     while True:
@@ -396,6 +502,7 @@ def show_main_menu():
 
         options = [
             "Games",
+            "Score Analytics",
             "View My Profile",
             "Edit My Profile",
             "Delete My Account",
@@ -407,19 +514,21 @@ def show_main_menu():
 
         if choice == 1:  # Games
             show_games_menu(user)
-        elif choice == 2:  # View Profile
+        elif choice == 2:  # Score Analytics
+            show_score_analytics_screen()
+        elif choice == 3:  # View Profile
             display_user_profile(user)
             # return True
-        elif choice == 3:  # Edit Profile
+        elif choice == 4:  # Edit Profile
             show_edit_profile_screen(user)
-        elif choice == 4:  # Delete Account
+        elif choice == 5:  # Delete Account
             if not show_delete_account_screen():
                 # Account was deleted, end session
                 return False
-        elif choice == 5:  # Logout
+        elif choice == 6:  # Logout
             user_service.logout_user()
             return False
-        elif choice == 6:  # Exit
-            user_service.logout_user()
+        elif choice == 7:  # Exit
+            user_service.logout_user(forget=False)
             print("\nExiting application. Goodbye!")
             exit(0)
@@ -0,0 +1,188 @@
+import asyncio
+import inspect
+
+from games.base import BaseGame
+
+
+class AsyncBaseGame(BaseGame):
+    """
+    Base class for games written as coroutines.
+
+    setup(), run() and stop() are async. read_input() and confirm_input()
+    take a timeout, and start_timer()/every() run callbacks (countdowns, live
+    clocks) on the same event loop while the game waits for input; they are
+    cancelled when the game stops. Ctrl+C anywhere in the game ends it through
+    on_interrupt(), so games don't need their own KeyboardInterrupt handling.
+
+    start() keeps the synchronous BaseGame interface by running the game in
+    asyncio.run, so the menu, simulations and replays treat async games like
+    any other. From async code use play(), which also runs synchronous games.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tasks = set()
+        self._run_task = None
+        self._error = None
+
+    def start(self, user_id, session_tracker=None, seed=None):
+        """Set up and run the game to the end on a new event loop (see BaseGame.start)."""
+        try:
+            asyncio.run(self.start_async(user_id, session_tracker, seed))
+        except KeyboardInterrupt:
+            pass  # Ctrl+C outside a prompt; on_interrupt() already ended the game
+        return self.score
+
+    async def start_async(self, user_id, session_tracker=None, seed=None):
+        """
+        Set up and run the game on the running event loop.
+
+        Returns:
+            int: The final score
+        """
+        self._begin(user_id, session_tracker, seed)
+        self._error = None
+        self._run_task = asyncio.ensure_future(self._play())
+        try:
+            await self._run_task
+        except asyncio.CancelledError:
+            if self._error:
+                raise self._error
+            if self.is_running:
+                # Cancelled from outside, e.g. Ctrl+C while no prompt was active
+                await self.on_interrupt()
+                raise
+            # Otherwise stop() was called from a timer while run() was waiting
+        finally:
+            self._cancel_tasks()
+        return self.score
+
+    async def _play(self):
+        try:
+            await self.setup()
+            await self.run()
+        except KeyboardInterrupt:
+            await self.on_interrupt()
+
+    async def setup(self):
+        """Set up the game environment before running.
+        Should be implemented by child classes."""
+        raise NotImplementedError("Game classes must implement setup method")
+
+    async def run(self):
+        """Main game loop.
+        Should be implemented by child classes."""
+        raise NotImplementedError("Game classes must implement run method")
+
+    async def stop(self, completed=True, session_data=None):
+        """Cancel the game's timers and stop it (see BaseGame.stop).
+
+        Returns:
+            int: The final score from the game session
+        """
+        self._cancel_tasks()
+        return super().stop(completed, session_data)
+
+    async def on_interrupt(self):
+        """Handle Ctrl+C. Ends the game as not completed; override to ask first."""
+        self.output.print("\n[yellow]Game interrupted.[/yellow]")
+        await self.stop(completed=False)
+
+    async def read_input(self, prompt, timeout=None):
+        """Read one line of player input and record it for replays.
+
+        Args:
+            prompt (str): Prompt shown to the player
+            timeout (float, optional): Seconds the player has to answer
+
+        Returns:
+            str: The entered text, or None if the time ran out
+        """
+        value = await self.input_provider.read_async(prompt, timeout)
+        self.inputs.append(value)
+        if value is not None:
+            self.output.echo(f"{prompt}: {value}")
+        return value
+
+    async def confirm_input(self, message, timeout=None):
+        """Ask a yes/no question and record the answer for replays.
+
+        Returns:
+            bool: True for yes, None if the time ran out
+        """
+        answer = await self.input_provider.confirm_async(message, timeout)
+        answer = None if answer is None else bool(answer)
+        self.inputs.append(answer)
+        return answer
+
+    def start_timer(self, delay, callback, *args):
+        """Call `callback(*args)` once after `delay` seconds, alongside the game.
+
+        The callback may be a plain function or a coroutine function.
+
+        Returns:
+            asyncio.Task: Cancel it to drop the timer
+        """
+        return self._spawn(self._after(delay, callback, args))
+
+    def every(self, interval, callback, *args):
+        """Call `callback(*args)` every `interval` seconds until the game stops.
+
+        Calls are scheduled on a fixed grid, so a slow callback doesn't make the
+        ticker drift.
+
+        Returns:
+            asyncio.Task: Cancel it to stop the ticker
+        """
+        return self._spawn(self._ticker(interval, callback, args))
+
+    def _spawn(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _after(self, delay, callback, args):
+        await asyncio.sleep(delay)
+        await self._call(callback, args)
+
+    async def _ticker(self, interval, callback, args):
+        loop = asyncio.get_running_loop()
+        due = loop.time() + interval
+        while self.is_running:
+            await asyncio.sleep(due - loop.time())
+            await self._call(callback, args)
+            due += interval
+
+    async def _call(self, callback, args):
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            # Fail the game like an error in run() would
+            self._error = e
+            if self._run_task:
+                self._run_task.cancel()
+
+    def _cancel_tasks(self):
+        current = asyncio.current_task()
+        for task in [*self._tasks, self._run_task]:
+            if task is not None and task is not current and not task.done():
+                task.cancel()
+
+
+async def play(game, user_id, session_tracker=None, seed=None):
+    """
+    Run any game from async code.
+
+    Async games run on the current event loop; synchronous games run in a
+    worker thread, so their blocking input() calls don't stall the loop.
+
+    Returns:
+        int: The final score
+    """
+    if isinstance(game, AsyncBaseGame):
+        return await game.start_async(user_id, session_tracker, seed)
+    await asyncio.to_thread(game.start, user_id, session_tracker, seed)
+    return game.score
@@ -1,10 +1,31 @@
-from datetime import time
+import random
+import secrets
+import sys
+import time
+from pathlib import Path
+
+from games.difficulty import PROFILE_FILE, load_profiles
+from games.game_io import TerminalInput, TerminalOutput
 
 
 class BaseGame:
     """Base class that all games in the collection should inherit from."""
+
+    # Difficulty levels offered in the menu; games may override with a literal tuple,
+    # or declare their levels in a difficulty.yaml next to the game module instead
+    DIFFICULTY_LEVELS = ("Easy", "Medium", "Hard")
+    # JSON schema the level settings in the game's difficulty.yaml must match
+    DIFFICULTY_SCHEMA = None
+    # score_formula(level, attempts_used) -> int; tabulated per level of difficulty.yaml
+    score_formula = None
+    
+    # Real-time games set a fixed number of update() calls per second to get
+    # the tick loop (run_ticks) instead of implementing run() themselves
+    TICK_RATE = None
+    # Most updates run back to back to catch up after a slow frame; the rest of the lag is dropped
+    MAX_CATCH_UP_TICKS = 5
     
-    def __init__(self, game_id, name, description, difficulty="Medium"):
+    def __init__(self, game_id, name, description, difficulty="Medium", input_provider=None, output=None):
         """Initialize the base game with common properties.
         
         Args:
@@ -12,25 +33,60 @@ class BaseGame:
             name (str): The name of the game
             description (str): A short description of the game
             difficulty (str): Game difficulty level (Easy, Medium, Hard)
+            input_provider (InputProvider, optional): Where player input comes from, the terminal by default
+            output (OutputSink, optional): Where the game renders to, the terminal by default
         """
         self.game_id = game_id
         self.name = name
         self.description = description
         self.difficulty = difficulty
+        self.level = None  # DifficultyLevel of self.difficulty, for games with a difficulty.yaml
+        self.input_provider = input_provider or TerminalInput()
+        self.output = output or TerminalOutput()
         self.score = 0  # Current game score
         self.is_running = False
         self.session = None
         
+        # Games draw all their random numbers from self.rng, seeded per session
+        self.rng = random.Random()
+        self.seed = None
+        # Everything read from the input provider this session, for replays
+        self.inputs = []
+        
         # Basic metrics tracking
         self.start_time = None
         self.attempts = 0
+        
+        # Tick loop state: False runs ticks back to back on a virtual clock (replays, simulations)
+        self.realtime = True
+        self.tick = 0
+        self._frame_stats = None
+    
+    def start(self, user_id, session_tracker=None, seed=None):
+        """Set up and start the game.
+        
+        Args:
+            user_id (int): ID of the player
+            session_tracker (GameSessionTracker, optional): Records the session
+            seed (int, optional): Seed for self.rng, a fresh random one if omitted;
+                replaying the same inputs with the same seed reproduces the game
+        """
+        self._begin(user_id, session_tracker, seed)
+        
+        # Game-specific setup and run
+        self.setup()
+        self.run()
     
-    def start(self, user_id, session_tracker=None):
-        """Set up and start the game."""
+    def _begin(self, user_id, session_tracker=None, seed=None):
+        """Reset the game, open the session and apply the difficulty (see start)."""
         # Reset game state and metrics
         self.score = 0
         self.attempts = 0
         self.is_running = True
+        self.seed = secrets.randbits(63) if seed is None else seed  # Fits an SQLite INTEGER
+        self.rng.seed(self.seed)
+        self.inputs = []
+        self._frame_stats = None
         
         # Start timing
         self.start_time = time.time()
@@ -38,21 +94,90 @@ class BaseGame:
         # Track session if tracker is provided
         self.session = session_tracker
         if self.session:
-            self.session.start_session(user_id, self.game_id, self.difficulty)
-            # Initialize metrics
+            self.session.start_session(user_id, self.game_id, self.difficulty, seed=self.seed)
+            # Initialize metrics; the input log is filled in as the game goes
             self._update_metrics()
+            self.session.update_session_data('inputs', self.inputs)
         
         # Configure game based on difficulty before setup
+        profiles = self.difficulty_profiles()
+        self.level = profiles.get(self.difficulty) if profiles else None
         self.configure_difficulty()
+    
+    @classmethod
+    def difficulty_profiles(cls):
+        """The game's compiled difficulty profiles, loaded once per class.
         
-        # Game-specific setup and run
-        self.setup()
-        self.run()
+        Returns:
+            DifficultyProfiles: Levels from the game's difficulty.yaml, or None
+                if the game has no difficulty file
+        
+        Raises:
+            DifficultyProfileError: If the difficulty file is invalid
+        """
+        if '_difficulty_profiles' not in cls.__dict__:
+            module_file = getattr(sys.modules.get(cls.__module__), '__file__', None)
+            path = Path(module_file).with_name(PROFILE_FILE) if module_file else None
+            cls._difficulty_profiles = load_profiles(path, cls.score_formula, cls.DIFFICULTY_SCHEMA) \
+                if path and path.exists() else None
+        return cls._difficulty_profiles
+    
+    @classmethod
+    def difficulty_levels(cls):
+        """Names of the difficulty levels offered in the menu, in order."""
+        profiles = cls.difficulty_profiles()
+        return profiles.names if profiles else cls.DIFFICULTY_LEVELS
+    
+    def set_io(self, input_provider=None, output=None):
+        """Swap the input provider and/or output sink, e.g. to run the game headless.
+        
+        Args:
+            input_provider (InputProvider, optional): New input provider
+            output (OutputSink, optional): New output sink
+        """
+        if input_provider is not None:
+            self.input_provider = input_provider
+        if output is not None:
+            self.output = output
+
+    def read_input(self, prompt):
+        """Read one line from the input provider and record it for replays.
+        
+        Args:
+            prompt (str): Prompt shown to the player
+        
+        Returns:
+            str: The entered text
+        """
+        value = self.input_provider.read(prompt)
+        self.inputs.append(value)
+        self.output.echo(f"{prompt}: {value}")
+        return value
+    
+    def confirm_input(self, message):
+        """Ask the input provider a yes/no question and record the answer for replays.
+        
+        Returns:
+            bool: True for yes
+        """
+        answer = bool(self.input_provider.confirm(message))
+        self.inputs.append(answer)
+        return answer
+
+    def notify(self, event, **data):
+        """Report a game event to the input provider, so scripted players and bots can react.
+        
+        Args:
+            event (str): Event name, e.g. "guess_result"
+            **data: Event details
+        """
+        self.input_provider.observe(event, data)
     
     def configure_difficulty(self):
         """
         Configure game parameters based on selected difficulty.
-        Child classes should override this to implement difficulty-specific settings.
+        Child classes should override this to implement difficulty-specific settings,
+        e.g. from self.level when the game has a difficulty.yaml.
         """
         pass
     
@@ -63,9 +188,123 @@ class BaseGame:
     
     def run(self):
         """Main game loop.
-        Should be implemented by child classes."""
+        Should be implemented by child classes, unless they set TICK_RATE."""
+        if self.TICK_RATE:
+            return self.run_ticks()
         raise NotImplementedError("Game classes must implement run method")
     
+    def run_ticks(self):
+        """Fixed-timestep game loop for real-time games.
+        
+        Time is measured with the monotonic perf_counter_ns clock. Every
+        1/TICK_RATE seconds of elapsed time, pending input is polled and passed
+        to handle_input(), then update() advances the game by exactly one step,
+        so game logic doesn't depend on the frame rate. After a slow frame at
+        most MAX_CATCH_UP_TICKS updates run back to back and the remaining lag is
+        dropped. render() is called once per frame, then the loop sleeps until
+        the next tick is due. The loop ends when the game calls stop().
+        
+        With self.realtime False, the clock is virtual: one tick per frame and
+        no sleeping, so headless runs go as fast as the CPU allows.
+        """
+        step = 1_000_000_000 // self.TICK_RATE
+        self.tick = 0
+        stats = self._frame_stats = {
+            'work_ns': [], 'ticks': 0, 'dropped_ticks': 0, 'start_ns': time.perf_counter_ns()
+        }
+        lag = 0
+        previous = time.perf_counter_ns()
+        
+        with self.input_provider.key_mode():
+            while self.is_running:
+                frame_start = time.perf_counter_ns()
+                lag += frame_start - previous if self.realtime else step
+                previous = frame_start
+                
+                ticks = 0
+                while lag >= step and ticks < self.MAX_CATCH_UP_TICKS and self.is_running:
+                    for key in self.poll_input():
+                        self.handle_input(key)
+                    stats['ticks'] += 1  # Counted first, update() may stop the game
+                    self.update(step / 1_000_000_000)
+                    self.tick += 1
+                    ticks += 1
+                    lag -= step
+                if lag >= step:
+                    stats['dropped_ticks'] += lag // step
+                    lag %= step
+                
+                if self.is_running:
+                    self.render(lag / step)
+                stats['work_ns'].append(time.perf_counter_ns() - frame_start)
+                
+                if self.realtime and self.is_running:
+                    wait = step - lag - (time.perf_counter_ns() - frame_start)
+                    if wait > 0:
+                        time.sleep(wait / 1_000_000_000)
+    
+    def poll_input(self):
+        """Collect the input that arrived since the last tick, without blocking.
+        
+        Keys are recorded with the current tick for replays.
+        
+        Returns:
+            list: Pending keys
+        """
+        keys = self.input_provider.poll()
+        self.inputs.extend([self.tick, key] for key in keys)
+        return keys
+    
+    def handle_input(self, key):
+        """React to one key in the tick loop. Override in real-time games."""
+        pass
+    
+    def update(self, dt):
+        """Advance the game by one fixed step in the tick loop.
+        Must be implemented by games that set TICK_RATE.
+        
+        Args:
+            dt (float): Length of the step in seconds (1 / TICK_RATE)
+        """
+        raise NotImplementedError("Real-time games must implement update method")
+    
+    def render(self, alpha):
+        """Draw a frame in the tick loop. Override in real-time games.
+        
+        Args:
+            alpha (float): How far (0-1) the clock is into the next tick, for interpolation
+        """
+        pass
+    
+    def frame_stats(self):
+        """Summarize the timing of the last tick loop.
+        
+        Returns:
+            dict: ticks, frames, dropped ticks, tick rate, frames per second and
+                frame work time (update + render) percentiles in milliseconds,
+                or None if the game didn't run a tick loop
+        """
+        stats = self._frame_stats
+        if not stats or not stats['work_ns']:
+            return None
+        work = sorted(stats['work_ns'])
+        elapsed = (time.perf_counter_ns() - stats['start_ns']) / 1_000_000_000
+        
+        def percentile(fraction):
+            return round(work[min(int(fraction * len(work)), len(work) - 1)] / 1_000_000, 3)
+        
+        return {
+            'tick_rate': self.TICK_RATE,
+            'ticks': stats['ticks'],
+            'frames': len(work),
+            'dropped_ticks': stats['dropped_ticks'],
+            'fps': round(len(work) / elapsed, 1) if elapsed else None,
+            'frame_ms_p50': percentile(0.5),
+            'frame_ms_p95': percentile(0.95),
+            'frame_ms_p99': percentile(0.99),
+            'frame_ms_max': round(work[-1] / 1_000_000, 3),
+        }
+    
     def stop(self, completed=True, session_data=None):
         """Stop the game and perform cleanup.
         
@@ -79,6 +318,9 @@ class BaseGame:
 
         # Track session end using the internal score
         if self.session:
+            frame_stats = self.frame_stats()
+            if frame_stats:
+                self.track_progress('frame_stats', frame_stats)
             self.session.end_session(self.score, completed, session_data)
         
         self.is_running = False
@@ -114,6 +356,22 @@ class BaseGame:
         if self.session:
             self.session.update_session_data(key, value)
     
+    def log_attempt(self):
+        """Count one player attempt (e.g. a guess) and record it in the session data.
+        
+        Returns:
+            int: Number of attempts so far
+        """
+        self.attempts += 1
+        self._update_metrics()
+        return self.attempts
+    
+    def _update_metrics(self):
+        """Record the basic metrics (score and attempts) in the session data."""
+        if self.session:
+            self.session.update_session_data('score', self.score)
+            self.session.update_session_data('attempts', self.attempts)
+    
     def cleanup(self):
         """Clean up any resources. Can be overridden by child classes."""
         pass
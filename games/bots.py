@@ -0,0 +1,92 @@
+import random
+
+from games.game_io import InputProvider
+
+
+class GuessingBot(InputProvider):
+    """
+    Headless player for the Number Guessing Game.
+
+    The bot learns the range from the "game_start" event and narrows it on
+    every "guess_result" ("higher"/"lower"), so one bot can play any number of
+    games in a row. Subclasses choose the next guess inside the range that is
+    still possible. The bot never quits.
+    """
+
+    name = None
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng (random.Random, optional): Source of randomness, seed it for reproducible runs
+        """
+        self.rng = rng or random.Random()
+        self.low = self.high = None
+
+    def observe(self, event, data):
+        if event == "game_start":
+            self.low, self.high = data['min_number'], data['max_number']
+        elif event == "guess_result":
+            if data['result'] == "higher":
+                self.low = data['guess'] + 1
+            elif data['result'] == "lower":
+                self.high = data['guess'] - 1
+
+    def read(self, prompt):
+        return str(self.choose(self.low, self.high))
+
+    def confirm(self, message):
+        return False
+
+    def choose(self, low, high):
+        """
+        Pick the next guess.
+
+        Args:
+            low (int): Smallest number still possible
+            high (int): Largest number still possible
+
+        Returns:
+            int: The guess
+        """
+        raise NotImplementedError("Bots must implement choose method")
+
+
+class BinarySearchBot(GuessingBot):
+    """Always guesses the middle of the remaining range (the optimal strategy)."""
+
+    name = "binary"
+
+    def choose(self, low, high):
+        return (low + high) // 2
+
+
+class RandomBot(GuessingBot):
+    """Guesses uniformly at random, but never outside the remaining range."""
+
+    name = "random"
+
+    def choose(self, low, high):
+        return self.rng.randint(low, high)
+
+
+class BiasedBot(GuessingBot):
+    """Splits the remaining range off-centre, like a player who keeps guessing low."""
+
+    name = "biased"
+
+    def __init__(self, rng=None, bias=0.25):
+        """
+        Args:
+            rng (random.Random, optional): Source of randomness
+            bias (float): Where in the remaining range to guess, 0 (lowest) to 1 (highest)
+        """
+        super().__init__(rng)
+        self.bias = bias
+
+    def choose(self, low, high):
+        return low + int((high - low) * self.bias)
+
+
+# Strategy name -> bot class
+BOTS = {bot.name: bot for bot in (BinarySearchBot, RandomBot, BiasedBot)}
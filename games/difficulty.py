@@ -0,0 +1,175 @@
+import os
+from pathlib import Path
+
+
+# Difficulty profiles file looked up in each game's package (games/<game>/difficulty.yaml)
+PROFILE_FILE = "difficulty.yaml"
+
+# Layout every difficulty file must follow; games add the schema of their level settings
+PROFILE_SCHEMA = {
+    'type': 'object',
+    'required': ['levels'],
+    'additionalProperties': False,
+    'properties': {
+        'default': {'type': 'string'},
+        'levels': {
+            'type': 'object',
+            'minProperties': 1,
+            'additionalProperties': {
+                'type': 'object',
+                'properties': {
+                    'multiplier': {'type': 'number', 'exclusiveMinimum': 0},
+                    'max_attempts': {'type': 'integer', 'minimum': 1},
+                },
+            },
+        },
+    },
+}
+
+# Compiled profiles by (path, modification time, score function)
+_cache = {}
+
+
+class DifficultyProfileError(Exception):
+    """Raised when a difficulty file is missing, malformed or fails validation."""
+    pass
+
+
+class DifficultyLevel:
+    """
+    One compiled difficulty level: its settings and its score table.
+
+    Settings are read like a dict (level['max_attempts']). When the game has a
+    score function and the level sets max_attempts, the score of every
+    possible number of attempts is computed once, so score() is a lookup.
+    """
+
+    __slots__ = ('name', 'settings', 'multiplier', 'scores', '_score')
+
+    def __init__(self, name, settings, score=None):
+        """
+        Args:
+            name (str): Level name, as shown in the menu
+            settings (dict): The level's settings from the difficulty file
+            score (callable, optional): score(level, attempts_used) -> int
+        """
+        self.name = name
+        self.settings = settings
+        self.multiplier = settings.get('multiplier', 1.0)
+        self._score = score
+        max_attempts = settings.get('max_attempts')
+        self.scores = ()
+        if score and max_attempts:
+            self.scores = tuple(score(self, attempts_used) for attempts_used in range(max_attempts + 1))
+
+    def __getitem__(self, key):
+        return self.settings[key]
+
+    def get(self, key, default=None):
+        return self.settings.get(key, default)
+
+    def score(self, attempts_used):
+        """
+        Score of a game won in `attempts_used` attempts at this level.
+
+        Returns:
+            int: The precomputed score, or the score function's result outside the table
+        """
+        if 0 <= attempts_used < len(self.scores):
+            return self.scores[attempts_used]
+        return self._score(self, attempts_used) if self._score else 0
+
+
+class DifficultyProfiles:
+    """The compiled difficulty levels of one game, in menu order."""
+
+    __slots__ = ('levels', 'names', 'default')
+
+    def __init__(self, levels, default):
+        """
+        Args:
+            levels (dict): DifficultyLevel by name, in menu order
+            default (str): Level used when a game is started without a known difficulty
+        """
+        self.levels = levels
+        self.names = tuple(levels)
+        self.default = default
+
+    def get(self, name):
+        """
+        Look up a level, falling back to the default one for unknown names.
+
+        Returns:
+            DifficultyLevel: The level
+        """
+        level = self.levels.get(name)
+        return level if level is not None else self.levels[self.default]
+
+    def __contains__(self, name):
+        return name in self.levels
+
+
+def load_profiles(path, score=None, level_schema=None):
+    """
+    Load, validate and compile a game's difficulty file.
+
+    The file is parsed and validated once per modification; later calls
+    return the same compiled profiles.
+
+    Args:
+        path (str|Path): The difficulty YAML file
+        score (callable, optional): score(level, attempts_used) -> int, tabulated per level
+        level_schema (dict, optional): JSON schema every level's settings must also match
+
+    Returns:
+        DifficultyProfiles: The compiled profiles
+
+    Raises:
+        DifficultyProfileError: If the file can't be read or is invalid
+    """
+    path = Path(path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError as e:
+        raise DifficultyProfileError(f"Cannot read difficulty file {path}: {e}") from None
+
+    key = (str(path), mtime_ns, score)
+    profiles = _cache.get(key)
+    if profiles is None:
+        profiles = _cache[key] = _compile(path, score, level_schema)
+    return profiles
+
+
+def _compile(path, score, level_schema):
+    # Imported here: only needed when a file changed, and jsonschema is slow to import
+    import jsonschema
+    import yaml
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as e:
+        raise DifficultyProfileError(f"Cannot read difficulty file {path}: {e}") from None
+
+    schema = PROFILE_SCHEMA
+    if level_schema:
+        schema = {**PROFILE_SCHEMA, 'properties': {
+            **PROFILE_SCHEMA['properties'],
+            'levels': {**PROFILE_SCHEMA['properties']['levels'],
+                       'additionalProperties': {'allOf': [
+                           PROFILE_SCHEMA['properties']['levels']['additionalProperties'], level_schema]}},
+        }}
+    try:
+        jsonschema.validate(data, schema)
+    except jsonschema.ValidationError as e:
+        location = "/".join(str(part) for part in e.absolute_path) or "top level"
+        raise DifficultyProfileError(f"Invalid difficulty file {path} at {location}: {e.message}") from None
+
+    names = list(data['levels'])
+    default = data.get('default', "Medium" if "Medium" in names else names[0])
+    if default not in data['levels']:
+        raise DifficultyProfileError(
+            f"Invalid difficulty file {path}: default '{default}' is not one of {', '.join(names)}"
+        )
+    levels = {name: DifficultyLevel(name, settings, score) for name, settings in data['levels'].items()}
+    return DifficultyProfiles(levels, default)
@@ -1,9 +1,6 @@
 import datetime
-import random
-from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from prompt_toolkit.shortcuts import confirm
 
 from games.base import BaseGame
 
@@ -11,13 +8,31 @@ class NumberGuessingGame(BaseGame):
     """A simple number guessing game where the player tries to 
     guess a randomly generated number within a limited number of attempts."""
     
-    def __init__(self):
-        """Initialize the Number Guessing Game with default settings."""
+    # Settings every level in difficulty.yaml must have
+    DIFFICULTY_SCHEMA = {
+        'type': 'object',
+        'required': ['min_number', 'max_number', 'max_attempts'],
+        'properties': {
+            'min_number': {'type': 'integer'},
+            'max_number': {'type': 'integer'},
+            'max_attempts': {'type': 'integer', 'minimum': 1},
+        },
+    }
+    
+    def __init__(self, input_provider=None, output=None):
+        """Initialize the Number Guessing Game with default settings.
+        
+        Args:
+            input_provider (InputProvider, optional): Where guesses come from, the terminal by default
+            output (OutputSink, optional): Where the game renders to, the terminal by default
+        """
         super().__init__(
             game_id="number_guessing",
             name="Number Guessing Game",
             description="Guess the secret number within the given range and attempts",
-            difficulty="Medium"  # Default difficulty
+            difficulty="Medium",  # Default difficulty
+            input_provider=input_provider,
+            output=output
         )
         
         # Default game parameters will be set in configure_difficulty
@@ -27,28 +42,12 @@ class NumberGuessingGame(BaseGame):
         self.secret_number = None
         self.attempts_made = 0
         self.guesses = []
-        self.console = Console()
         
     def configure_difficulty(self):
-        """Configure game parameters based on the selected difficulty level."""
-        # Set game parameters based on difficulty
-        if self.difficulty == "Easy":
-            self.min_number = 1
-            self.max_number = 50
-            self.max_attempts = 10
-        elif self.difficulty == "Medium":
-            self.min_number = 1
-            self.max_number = 100
-            self.max_attempts = 7
-        elif self.difficulty == "Hard":
-            self.min_number = 1
-            self.max_number = 200
-            self.max_attempts = 5
-        else:
-            # Fallback to Medium if an unknown difficulty is provided
-            self.min_number = 1
-            self.max_number = 100
-            self.max_attempts = 7
+        """Configure game parameters from the selected level in difficulty.yaml."""
+        self.min_number = self.level['min_number']
+        self.max_number = self.level['max_number']
+        self.max_attempts = self.level['max_attempts']
             
         # Record difficulty parameters as metrics
         if self.session:
@@ -63,12 +62,14 @@ class NumberGuessingGame(BaseGame):
         # Reset game state
         self.attempts_made = 0
         self.guesses = []
-        self.secret_number = random.randint(self.min_number, self.max_number)
+        self.secret_number = self.rng.randint(self.min_number, self.max_number)
         
         # Record initial game parameters as metrics
         self.record_metric("range", f"{self.min_number}-{self.max_number}")
         self.record_metric("max_attempts", self.max_attempts)
-    
+        self.notify("game_start", min_number=self.min_number, max_number=self.max_number,
+                    max_attempts=self.max_attempts)
+
     def record_metric(self, key, value):
         """Helper method to record game metrics."""
         if self.session:
@@ -103,12 +104,12 @@ class NumberGuessingGame(BaseGame):
                     self.handle_defeat()
         except KeyboardInterrupt:
             # Final fallback for Ctrl+C if it bubbles up here
-            self.console.print("\n[yellow]Game forcefully interrupted.[/yellow]")
+            self.output.print("\n[yellow]Game forcefully interrupted.[/yellow]")
             return self.stop(completed=False)
         
         except Exception as e:
             # Handle unexpected errors, ensuring we stop the game properly
-            self.console.print(f"\n[red]An error occurred: {str(e)}[/red]")
+            self.output.print(f"\n[red]An error occurred: {str(e)}[/red]")
             return self.stop(completed=False)
         
     def display_welcome(self):
@@ -119,7 +120,7 @@ class NumberGuessingGame(BaseGame):
             f"I'm thinking of a number between {self.min_number} and {self.max_number}.\n"
             f"You have {self.max_attempts} attempts to guess it correctly."
         )
-        self.console.print(Panel(
+        self.output.print(Panel(
             instructions, 
             title=title, 
             subtitle=difficulty_text,
@@ -136,7 +137,7 @@ class NumberGuessingGame(BaseGame):
         while True:
             try:
                 # Get input as a string first to check for quit command
-                input_value = input(prompt_text + ": ")
+                input_value = self.read_input(prompt_text)
                 
                 # Check for quit command
                 if input_value.lower() == 'q':
@@ -152,7 +153,7 @@ class NumberGuessingGame(BaseGame):
                 
                 # Validate guess is in range
                 if guess < self.min_number or guess > self.max_number:
-                    self.console.print(
+                    self.output.print(
                         f"[red]Please enter a number between {self.min_number} and {self.max_number}.[/red]"
                     )
                     continue
@@ -175,10 +176,10 @@ class NumberGuessingGame(BaseGame):
                 return guess
             except ValueError:
                 if input_value.lower() != 'q':  # Only show error if it wasn't a quit attempt
-                    self.console.print("[red]Please enter a valid number.[/red]")
+                    self.output.print("[red]Please enter a valid number.[/red]")
             except KeyboardInterrupt:
                 # Handle Ctrl+C interruption
-                self.console.print("\n[yellow]Game interrupted. Would you like to quit?[/yellow]")
+                self.output.print("\n[yellow]Game interrupted. Would you like to quit?[/yellow]")
                 if self._confirm_quit():
                     return None
                 else:
@@ -188,13 +189,15 @@ class NumberGuessingGame(BaseGame):
     def process_guess(self, guess):
         """Process the player's guess and provide feedback."""
         if guess < self.secret_number:
-            self.console.print("[yellow]Too low! Try a higher number.[/yellow]")
-            return "higher"
+            result = "higher"
+            self.output.print("[yellow]Too low! Try a higher number.[/yellow]")
         elif guess > self.secret_number:
-            self.console.print("[yellow]Too high! Try a lower number.[/yellow]")
-            return "lower"
+            result = "lower"
+            self.output.print("[yellow]Too high! Try a lower number.[/yellow]")
         else:
-            return "correct"
+            result = "correct"
+        self.notify("guess_result", guess=guess, result=result)
+        return result
     
     def handle_victory(self):
         """Handle player victory."""
@@ -217,33 +220,36 @@ class NumberGuessingGame(BaseGame):
             f"in [bold]{attempts_used}[/bold] attempts.\n"
             f"Your score: [bold]{score}[/bold] points"
         )
-        self.console.print(Panel(message, border_style="green"))
+        self.output.print(Panel(message, border_style="green"))
         
         # Stop game
         self.stop(completed=True)
     
     def calculate_score(self, attempts_used):
-        """Calculate score based on difficulty level and attempts used."""
+        """Calculate score based on difficulty level and attempts used (a score table lookup)."""
+        return self.level.score(attempts_used)
+    
+    @staticmethod
+    def score_formula(level, attempts_used):
+        """Score of a win at `level` in `attempts_used` attempts; tabulated once per level.
+        
+        Args:
+            level (DifficultyLevel): Level from difficulty.yaml
+            attempts_used (int): Guesses taken, including the correct one
+        
+        Returns:
+            int: The score
+        """
         # Base score calculations
         max_possible_score = 1000
-        attempts_factor = (self.max_attempts - attempts_used + 1) / self.max_attempts
-        range_size = self.max_number - self.min_number + 1
-        
-        # Difficulty multipliers
-        if self.difficulty == "Easy":
-            difficulty_multiplier = 1.0
-        elif self.difficulty == "Medium":
-            difficulty_multiplier = 1.5
-        elif self.difficulty == "Hard":
-            difficulty_multiplier = 2.0
-        else:
-            difficulty_multiplier = 1.0
+        attempts_factor = (level['max_attempts'] - attempts_used + 1) / level['max_attempts']
+        range_size = level['max_number'] - level['min_number'] + 1
             
         # Calculate final score: More attempts left = higher score
         # Wider number range = higher score
         # Higher difficulty = higher score multiplier
         base_score = max_possible_score * attempts_factor
-        adjusted_score = base_score * (range_size / 100) * difficulty_multiplier
+        adjusted_score = base_score * (range_size / 100) * level.multiplier
         
         return int(adjusted_score)
     
@@ -262,7 +268,7 @@ class NumberGuessingGame(BaseGame):
             f"You've used all {self.max_attempts} attempts.\n"
             f"The secret number was [bold]{self.secret_number}[/bold]."
         )
-        self.console.print(Panel(message, border_style="red"))
+        self.output.print(Panel(message, border_style="red"))
         
         # Stop game
         self.stop(completed=True)
@@ -270,8 +276,8 @@ class NumberGuessingGame(BaseGame):
     def _confirm_quit(self):
         """Confirm if the player wants to quit."""
         try:
-            self.console.print("[yellow]Are you sure you want to quit the game?[/yellow]")
-            return confirm("Quit game?")
+            self.output.print("[yellow]Are you sure you want to quit the game?[/yellow]")
+            return self.confirm_input("Quit game?")
         except KeyboardInterrupt:
             # If they press Ctrl+C during confirmation, interpret as Yes
             return True
@@ -288,7 +294,7 @@ class NumberGuessingGame(BaseGame):
             f"You used {len(self.guesses)} out of {self.max_attempts} attempts.\n"
             f"The secret number was [bold]{self.secret_number}[/bold]."
         )
-        self.console.print(Panel(message, border_style="yellow"))
+        self.output.print(Panel(message, border_style="yellow"))
         
         # Stop game with incomplete status
         return self.stop(completed=False)
@@ -0,0 +1,331 @@
+import asyncio
+import os
+import sys
+from contextlib import contextmanager, nullcontext
+from io import StringIO
+
+from prompt_toolkit import PromptSession
+from prompt_toolkit.patch_stdout import patch_stdout
+from prompt_toolkit.shortcuts import confirm as confirm_prompt, create_confirm_session
+from rich.console import Console
+from rich.text import Text
+
+from utils.screen import Screen
+
+
+class InputProvider:
+    """Where a game reads player input from. Subclasses implement `read` and `confirm`."""
+
+    def read(self, prompt):
+        """
+        Read one line of player input.
+
+        Args:
+            prompt (str): Prompt shown to the player
+
+        Returns:
+            str: The entered text
+
+        Raises:
+            EOFError: When no more input is available
+        """
+        raise NotImplementedError("Input providers must implement read method")
+
+    def confirm(self, message):
+        """
+        Ask a yes/no question.
+
+        Returns:
+            bool: True for yes
+        """
+        raise NotImplementedError("Input providers must implement confirm method")
+
+    async def read_async(self, prompt, timeout=None):
+        """
+        Read one line of player input without blocking the event loop (AsyncBaseGame).
+
+        The default answers from read(), which suits providers that never wait
+        (scripted input, replays, bots).
+
+        Args:
+            prompt (str): Prompt shown to the player
+            timeout (float, optional): Seconds to wait for an answer
+
+        Returns:
+            str: The entered text, or None if the timeout expired
+        """
+        return self.read(prompt)
+
+    async def confirm_async(self, message, timeout=None):
+        """
+        Ask a yes/no question without blocking the event loop (AsyncBaseGame).
+
+        Returns:
+            bool: True for yes, None if the timeout expired
+        """
+        return self.confirm(message)
+
+    def poll(self):
+        """
+        Return the keys pressed since the last poll, without blocking (for the tick loop).
+
+        Returns:
+            list: Pending keys, possibly empty
+        """
+        return []
+
+    def key_mode(self):
+        """
+        Context manager active while a tick loop runs, e.g. to read single keys.
+
+        Returns:
+            contextmanager: Restores the normal input mode on exit
+        """
+        return nullcontext()
+
+    def observe(self, event, data):
+        """
+        Receive a game event (see BaseGame.notify), so scripted players can react.
+
+        Args:
+            event (str): Event name, e.g. "guess_result"
+            data (dict): Event details
+        """
+        pass
+
+
+class TerminalInput(InputProvider):
+    """Interactive input from the terminal (the default)."""
+
+    def read(self, prompt):
+        return input(prompt + ": ")
+
+    def confirm(self, message):
+        return confirm_prompt(message)
+
+    async def read_async(self, prompt, timeout=None):
+        return await self._prompt_async(PromptSession(prompt + ": "), timeout)
+
+    async def confirm_async(self, message, timeout=None):
+        return await self._prompt_async(create_confirm_session(message), timeout)
+
+    @staticmethod
+    async def _prompt_async(session, timeout):
+        # patch_stdout redraws the prompt below anything timers print meanwhile
+        with patch_stdout(raw=True):
+            try:
+                return await asyncio.wait_for(session.prompt_async(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+    def poll(self):
+        if os.name == 'nt':
+            import msvcrt
+            keys = []
+            while msvcrt.kbhit():
+                keys.append(msvcrt.getwch())
+            return keys
+
+        import select
+        if not select.select([sys.stdin], [], [], 0)[0]:
+            return []
+        return list(os.read(sys.stdin.fileno(), 1024).decode(errors='ignore'))
+
+    @contextmanager
+    def key_mode(self):
+        """Switch the terminal to cbreak mode, so keys arrive without Enter and aren't echoed."""
+        if os.name == 'nt' or not sys.stdin.isatty():
+            yield
+            return
+
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        try:
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+class ScriptedInput(InputProvider):
+    """Input replayed from a list of lines, for tests and replays."""
+
+    def __init__(self, lines, confirm=True):
+        """
+        Args:
+            lines (iterable): Lines returned by successive reads
+            confirm (bool): Answer given to every confirmation
+        """
+        self._lines = iter(lines)
+        self._confirm = confirm
+        self.prompts = 0
+
+    def read(self, prompt):
+        self.prompts += 1
+        try:
+            return str(next(self._lines))
+        except StopIteration:
+            raise EOFError("scripted input exhausted") from None
+
+    def confirm(self, message):
+        return self._confirm
+
+    def poll(self):
+        # One scripted line per tick; an empty line (or the end of the script) is no key
+        line = next(self._lines, None)
+        return [str(line)] if line else []
+
+
+class ReplayInput(InputProvider):
+    """
+    Replays the inputs a game recorded (BaseGame.inputs): strings for reads,
+    booleans for confirms, None for timed-out async reads and [tick, key]
+    pairs for keys polled in the tick loop.
+    """
+
+    def __init__(self, inputs):
+        """
+        Args:
+            inputs (list): Recorded inputs, in order
+        """
+        self._inputs = inputs
+        self.position = 0
+        self._polls = 0
+
+    def _next(self, kind):
+        if self.position >= len(self._inputs):
+            raise EOFError("recorded inputs exhausted")
+        value = self._inputs[self.position]
+        if not isinstance(value, kind):
+            raise EOFError(f"recorded input {self.position} is a {type(value).__name__}, not the expected kind")
+        self.position += 1
+        return value
+
+    def read(self, prompt):
+        return self._next(str)
+
+    def confirm(self, message):
+        return self._next(bool)
+
+    async def read_async(self, prompt, timeout=None):
+        return self._next((str, type(None)))
+
+    async def confirm_async(self, message, timeout=None):
+        return self._next((bool, type(None)))
+
+    def poll(self):
+        # The tick loop polls once per tick, so the poll count is the tick number
+        keys = []
+        while self.position < len(self._inputs):
+            value = self._inputs[self.position]
+            if not (isinstance(value, list) and value[0] == self._polls):
+                break
+            keys.append(value[1])
+            self.position += 1
+        self._polls += 1
+        return keys
+
+    @property
+    def remaining(self):
+        """Number of recorded inputs not replayed yet."""
+        return len(self._inputs) - self.position
+
+
+class OutputSink:
+    """Where a game renders to. Subclasses implement `print`."""
+
+    def print(self, *renderables, **kwargs):
+        """Render Rich renderables or markup strings, like Console.print."""
+        raise NotImplementedError("Output sinks must implement print method")
+
+    def clear(self):
+        """Clear the screen before drawing a new one."""
+        pass
+
+    def frame(self, *renderables):
+        """Replace the whole screen with these renderables, e.g. once per frame of an animation."""
+        self.clear()
+        self.print(*renderables)
+
+    def echo(self, text):
+        """Show a line the player typed, for sinks that redraw the screen themselves."""
+        pass
+
+
+class TerminalOutput(OutputSink):
+    """Renders to the terminal through a Rich Console (the default)."""
+
+    def __init__(self, console=None):
+        self._console = console
+
+    @property
+    def console(self):
+        """The Rich Console, created on first use."""
+        if self._console is None:
+            self._console = Console()
+        return self._console
+
+    def print(self, *renderables, **kwargs):
+        self.console.print(*renderables, **kwargs)
+
+    def clear(self):
+        self.console.clear()
+
+
+class ScreenOutput(OutputSink):
+    """
+    Renders through a differential Screen (utils/screen.py): frame() and
+    successive prints only rewrite the terminal cells that changed.
+    """
+
+    def __init__(self, screen=None):
+        """
+        Args:
+            screen (Screen, optional): Screen to draw on, the shared one by default
+        """
+        self.screen = screen or Screen.default()
+
+    def print(self, *renderables, **kwargs):
+        self.screen.print(*renderables, **kwargs)
+
+    def clear(self):
+        self.screen.clear()
+
+    def frame(self, *renderables):
+        self.screen.frame(*renderables)
+
+    def echo(self, text):
+        # Keep the answer on screen; it is typed where the next update would wipe it
+        self.screen.print(Text(text))
+
+
+class MemoryOutput(OutputSink):
+    """Keeps renderables in memory; they are only rendered when `text()` is called."""
+
+    def __init__(self):
+        self.items = []
+
+    def print(self, *renderables, **kwargs):
+        self.items.extend(renderables)
+
+    def text(self, width=80):
+        """
+        Render everything printed so far as plain text.
+
+        Returns:
+            str: The rendered output
+        """
+        buffer = StringIO()
+        console = Console(file=buffer, width=width, color_system=None, force_terminal=False)
+        for item in self.items:
+            console.print(item)
+        return buffer.getvalue()
+
+
+class NullOutput(OutputSink):
+    """Discards all output, for simulations."""
+
+    def print(self, *renderables, **kwargs):
+        pass
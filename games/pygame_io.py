@@ -0,0 +1,427 @@
+import bisect
+import os
+import sys
+import time
+import warnings
+
+from rich.console import Console, Group
+from rich.text import Text
+
+from games.game_io import InputProvider, OutputSink
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+import pygame  # noqa: E402  (after hiding the import banner)
+
+
+# Upper bounds, in milliseconds, of the frame time histogram buckets; the last bucket is open-ended
+FRAME_HISTOGRAM_MS = (1, 2, 4, 8, 12, 16, 17, 18, 20, 25, 33.3, 50, 100)
+
+DEFAULT_SIZE = (800, 600)
+BACKGROUND = (0, 0, 0)
+FOREGROUND = (204, 204, 204)
+
+# Platforms whose windows need an X11 or Wayland display; elsewhere (macOS, Windows)
+# SDL opens windows without one
+X11_PLATFORMS = ('linux', 'freebsd', 'openbsd', 'netbsd', 'dragonfly')
+
+# System fonts tried, in order, when no font is given; text is laid out on a grid of cells
+MONOSPACE_FONTS = "dejavusansmono,liberationmono,menlo,consolas,couriernew,monospace"
+
+# Rendered text runs kept for reuse; most frames redraw the same labels
+MAX_CACHED_RUNS = 4096
+
+
+class FrameHistogram:
+    """Counts frame times in the FRAME_HISTOGRAM_MS buckets."""
+
+    def __init__(self):
+        self.counts = [0] * (len(FRAME_HISTOGRAM_MS) + 1)
+        self.frames = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, elapsed_ns):
+        """Count one frame that took `elapsed_ns` nanoseconds."""
+        self.counts[bisect.bisect_left(FRAME_HISTOGRAM_MS, elapsed_ns / 1_000_000)] += 1
+        self.frames += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+
+    def percentile(self, fraction):
+        """
+        Upper bound of the bucket holding the given fraction of frames.
+
+        Returns:
+            float: Milliseconds, or None when the frame falls in the open-ended bucket
+        """
+        target = fraction * self.frames
+        seen = 0
+        for bound, count in zip(FRAME_HISTOGRAM_MS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return None
+
+    def summary(self):
+        """
+        Returns:
+            dict: frames, mean and max milliseconds, p50/p99 bucket bounds and
+                'buckets' mapping "<N ms" labels to frame counts
+        """
+        labels = [f"<{bound} ms" for bound in FRAME_HISTOGRAM_MS] + [f">={FRAME_HISTOGRAM_MS[-1]} ms"]
+        return {
+            'frames': self.frames,
+            'frame_ms_mean': round(self.total_ns / self.frames / 1_000_000, 3) if self.frames else None,
+            'frame_ms_max': round(self.max_ns / 1_000_000, 3),
+            'frame_ms_p50': self.percentile(0.5),
+            'frame_ms_p99': self.percentile(0.99),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class PygameWindow:
+    """
+    A pygame window shared by PygameOutput and PygameInput.
+
+    Drawing only marks rectangles dirty; present() pushes just those to the
+    display with pygame.display.update(rects) instead of flipping the whole
+    window. With max_fps set, present() paces frames to that rate. Every
+    presented frame is timed into a FrameHistogram.
+
+    Headless, the window uses SDL's dummy video driver: no display or GPU is
+    needed, so pygame games run and can be benchmarked in CI.
+    """
+
+    def __init__(self, size=DEFAULT_SIZE, title="CLI Game Collection", headless=None, max_fps=None,
+                 font_name=None, font_size=18):
+        """
+        Args:
+            size (tuple): Window size in pixels
+            title (str): Window caption
+            headless (bool, optional): Use the dummy video driver; by default only
+                on Linux/BSD when neither DISPLAY nor WAYLAND_DISPLAY is set
+            max_fps (int, optional): Cap on presented frames per second, for games
+                that don't already run in the tick loop (which paces itself)
+            font_name (str, optional): Font file, or system font names separated by
+                commas; a monospace system font (MONOSPACE_FONTS) by default, else pygame's own
+            font_size (int): Text size in pixels
+        """
+        if headless is None:
+            headless = (sys.platform.startswith(X11_PLATFORMS)
+                        and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')))
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        self.headless = headless
+
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_caption(title)
+        self.surface = pygame.display.set_mode(size)
+        self.rect = self.surface.get_rect()
+        self.surface.fill(BACKGROUND)
+
+        if not (font_name and os.path.exists(font_name)):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # pygame warns when fc-list is missing
+                font_name = pygame.font.match_font(font_name or MONOSPACE_FONTS)
+        self.font = pygame.font.Font(font_name, font_size)
+        self.cell_width = self.font.size("M")[0]
+        self.line_height = self.font.get_linesize()
+        self.columns = max(self.rect.width // self.cell_width, 1)
+        self.rows = max(self.rect.height // self.line_height, 1)
+        self._runs = {}
+
+        self.max_fps = max_fps
+        self.histogram = FrameHistogram()
+        self.pixels_updated = 0
+        self._dirty = [self.rect.copy()]
+        self._last_present = None
+
+    def mark_dirty(self, *rects):
+        """Queue areas of the window to be pushed on the next present()."""
+        self._dirty.extend(pygame.Rect(rect) for rect in rects)
+
+    def blit(self, source, position):
+        """
+        Draw a surface onto the window and mark its area dirty.
+
+        Returns:
+            pygame.Rect: The area drawn
+        """
+        rect = self.surface.blit(source, position)
+        self._dirty.append(rect)
+        return rect
+
+    def fill(self, color, rect=None):
+        """Fill an area (the whole window by default) and mark it dirty."""
+        rect = self.surface.fill(color, rect)
+        self._dirty.append(rect)
+        return rect
+
+    def draw_row(self, row, runs):
+        """
+        Draw one row of text, replacing whatever was on it.
+
+        Args:
+            row (int): Text row, from the top
+            runs (tuple): (column, text, style) runs; style is a Rich Style or None
+        """
+        top = row * self.line_height
+        area = pygame.Rect(0, top, self.rect.width, self.line_height)
+        self.surface.fill(BACKGROUND, area)
+        for column, text, style in runs:
+            self.surface.blit(self._render_run(text, style), (column * self.cell_width, top))
+        self._dirty.append(area)
+
+    def _render_run(self, text, style):
+        key = (text, style)
+        rendered = self._runs.get(key)
+        if rendered is None:
+            if len(self._runs) >= MAX_CACHED_RUNS:
+                self._runs.clear()
+            foreground, background = _colors(style)
+            rendered = self._runs[key] = self.font.render(text, True, foreground, background)
+        return rendered
+
+    def present(self):
+        """
+        Push the dirty areas to the display and time the frame.
+
+        Returns:
+            int: Number of rectangles updated
+        """
+        if self.max_fps and self._last_present is not None:
+            wait = self._last_present + 1_000_000_000 // self.max_fps - time.perf_counter_ns()
+            if wait > 0:
+                time.sleep(wait / 1_000_000_000)
+
+        dirty = [rect.clip(self.rect) for rect in self._dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        if dirty:
+            if len(dirty) > 1:
+                dirty = _merge_rects(dirty)
+            pygame.display.update(dirty)
+            self.pixels_updated += sum(rect.width * rect.height for rect in dirty)
+        self._dirty = []
+
+        now = time.perf_counter_ns()
+        if self._last_present is not None:
+            self.histogram.add(now - self._last_present)
+        self._last_present = now
+        return len(dirty)
+
+    def events(self):
+        """
+        Take the pending window events.
+
+        Returns:
+            list: pygame events
+        """
+        return pygame.event.get()
+
+    def frame_stats(self):
+        """
+        Returns:
+            dict: The frame time histogram summary, plus pixels updated per frame
+        """
+        stats = self.histogram.summary()
+        stats['pixels_per_frame'] = self.pixels_updated // max(stats['frames'], 1)
+        return stats
+
+    def screenshot(self, path):
+        """Save the window contents to an image file (PNG, BMP, ...)."""
+        pygame.image.save(self.surface, str(path))
+
+    def close(self):
+        pygame.display.quit()
+
+
+class PygameOutput(OutputSink):
+    """
+    Renders Rich renderables as text in a pygame window.
+
+    Like Screen (utils/screen.py), the page is kept as rows of text runs and
+    only rows that changed since the last update are redrawn and pushed as
+    dirty rectangles. Games can also draw sprites through blit()/fill() and
+    push them with present().
+    """
+
+    def __init__(self, window=None):
+        """
+        Args:
+            window (PygameWindow, optional): Window to draw in, a new one by default
+        """
+        self.window = window or PygameWindow()
+        self.items = []
+        self._rows = []
+        # Renders markup to styled segments; the row count is the window's
+        self._console = Console(width=self.window.columns, color_system="truecolor",
+                                force_terminal=True, legacy_windows=False)
+
+    @property
+    def surface(self):
+        return self.window.surface
+
+    def print(self, *renderables, **kwargs):
+        self.items.extend(renderables)
+        self.flush()
+
+    def clear(self):
+        self.items = []
+
+    def frame(self, *renderables):
+        self.items = list(renderables)
+        self.flush()
+
+    def echo(self, text):
+        self.print(Text(text))
+
+    def blit(self, source, position):
+        return self.window.blit(source, position)
+
+    def fill(self, color, rect=None):
+        return self.window.fill(color, rect)
+
+    def present(self):
+        return self.window.present()
+
+    def flush(self):
+        """Draw the rows of the page that changed and present them."""
+        rows = self.render_rows(self.items)
+        for index, runs in enumerate(rows):
+            if index >= len(self._rows) or self._rows[index] != runs:
+                self.window.draw_row(index, runs)
+        for index in range(len(rows), len(self._rows)):
+            self.window.draw_row(index, ())
+        self._rows = rows
+        self.window.present()
+
+    def render_rows(self, renderables):
+        """
+        Render to rows of (column, text, style) runs.
+
+        Only the bottom rows that fit above the prompt row are kept.
+
+        Returns:
+            list: Rows, each a tuple of runs
+        """
+        console = self._console
+        lines = console.render_lines(Group(*renderables), console.options, pad=False)
+        rows = []
+        for line in lines:
+            runs = []
+            column = 0
+            for segment in line:
+                if segment.control or not segment.text:
+                    continue
+                if segment.text.strip() or (segment.style and segment.style.bgcolor):
+                    runs.append((column, segment.text, segment.style))
+                column += segment.cell_length
+            rows.append(tuple(runs))
+        return rows[-max(self.window.rows - 1, 1):]
+
+
+class PygameInput(InputProvider):
+    """
+    Keyboard input from a pygame window.
+
+    poll() returns the characters typed and the names pygame gives other keys
+    ("up", "left", "space", "return", "escape"). read() edits a line in the
+    window's bottom row. Closing the window raises KeyboardInterrupt, like
+    Ctrl+C in the terminal.
+    """
+
+    def __init__(self, window):
+        """
+        Args:
+            window (PygameWindow): Window to read keys from, usually the output's
+        """
+        self.window = window
+
+    def poll(self):
+        keys = []
+        for event in self.window.events():
+            if event.type == pygame.QUIT:
+                raise KeyboardInterrupt
+            if event.type == pygame.KEYDOWN:
+                keys.append(_key_name(event))
+        return keys
+
+    def read(self, prompt):
+        text = ""
+        row = self.window.rows - 1
+        while True:
+            self.window.draw_row(row, ((0, f"{prompt}: {text}", None),))
+            self.window.present()
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                raise KeyboardInterrupt
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                break
+            if event.key == pygame.K_BACKSPACE:
+                text = text[:-1]
+            elif event.key == pygame.K_c and event.mod & pygame.KMOD_CTRL:
+                raise KeyboardInterrupt
+            elif event.unicode and event.unicode.isprintable():
+                text += event.unicode
+        self.window.draw_row(row, ())
+        return text
+
+    def confirm(self, message):
+        return self.read(f"{message} (y/n)").strip().lower().startswith("y")
+
+
+def _key_name(event):
+    if event.unicode and event.unicode.isprintable():
+        return event.unicode
+    return pygame.key.name(event.key)
+
+
+def _colors(style):
+    """Foreground and background RGB of a Rich style (background None when transparent)."""
+    foreground, background = FOREGROUND, None
+    if style:
+        if style.color and not style.color.is_default:
+            foreground = tuple(style.color.get_truecolor())
+        if style.bgcolor and not style.bgcolor.is_default:
+            background = tuple(style.bgcolor.get_truecolor(foreground=False))
+        if style.dim:
+            foreground = tuple(channel // 2 for channel in foreground)
+        if style.reverse:
+            foreground, background = background or BACKGROUND, foreground
+    return foreground, background
+
+
+def _merge_rects(rects):
+    """Merge overlapping rectangles whose union is not much bigger than they are."""
+    merged = []
+    for rect in rects:
+        index = rect.collidelist(merged)
+        if index >= 0:
+            other = merged[index]
+            union = other.union(rect)
+            if union.width * union.height <= (other.width * other.height + rect.width * rect.height) * 1.25:
+                merged[index] = union
+                continue
+        merged.append(rect)
+    return merged
+
+
+def attach(game, window=None, **options):
+    """
+    Switch a game to a pygame window for both input and output.
+
+    Args:
+        game (BaseGame): Game to switch
+        window (PygameWindow, optional): Window to use, a new one by default
+        **options: PygameWindow arguments for the new window (size, headless, max_fps, ...)
+
+    Returns:
+        PygameWindow: The window, e.g. for frame_stats() or screenshot()
+    """
+    window = window or PygameWindow(**options)
+    game.set_io(PygameInput(window), PygameOutput(window))
+    return window
@@ -0,0 +1,360 @@
+import ast
+import importlib
+import importlib.metadata
+import json
+import os
+from pathlib import Path
+
+from games.base import BaseGame
+from games.difficulty import PROFILE_FILE, load_profiles
+
+
+# Bump when the manifest layout changes so stale caches are rebuilt
+MANIFEST_VERSION = 3
+
+GAMES_DIR = Path(__file__).resolve().parent
+
+# Entry point group third-party packages register BaseGame subclasses under
+ENTRY_POINT_GROUP = "cli_game_collection.games"
+
+# Metadata arguments of BaseGame.__init__, in positional order
+_INIT_FIELDS = ('game_id', 'name', 'description', 'difficulty')
+
+
+class GameDescriptor:
+    """Lightweight description of an installed game; the game module is imported on demand."""
+
+    __slots__ = ('game_id', 'name', 'description', 'module', 'class_name',
+                 'difficulty_levels', 'default_difficulty', 'source', '_game_class')
+
+    def __init__(self, game_id, name, description, module, class_name,
+                 difficulty_levels=BaseGame.DIFFICULTY_LEVELS, default_difficulty="Medium", source="directory"):
+        self.game_id = game_id
+        self.name = name
+        self.description = description
+        self.module = module
+        self.class_name = class_name
+        self.difficulty_levels = tuple(difficulty_levels)
+        self.default_difficulty = default_difficulty
+        self.source = source
+        self._game_class = None
+
+    def load(self):
+        """
+        Import the game module (once) and return the game class.
+
+        Returns:
+            type: The BaseGame subclass
+
+        Raises:
+            TypeError: If the target is not a BaseGame subclass
+        """
+        if self._game_class is None:
+            game_class = importlib.import_module(self.module)
+            for attr in self.class_name.split('.'):
+                game_class = getattr(game_class, attr)
+            if not (isinstance(game_class, type) and issubclass(game_class, BaseGame)):
+                raise TypeError(f"{self.module}:{self.class_name} is not a BaseGame subclass")
+            self._game_class = game_class
+        return self._game_class
+
+    def create(self):
+        """
+        Instantiate the game, importing it if needed.
+
+        Returns:
+            BaseGame: A fresh game instance
+        """
+        return self.load()()
+
+    def get_info(self):
+        """Return a dictionary with game information, like BaseGame.get_info."""
+        return {
+            "game_id": self.game_id,
+            "name": self.name,
+            "description": self.description,
+            "difficulty": self.default_difficulty
+        }
+
+    def to_dict(self):
+        """Convert the descriptor to a JSON-serializable manifest entry."""
+        return {
+            'game_id': self.game_id,
+            'name': self.name,
+            'description': self.description,
+            'module': self.module,
+            'class_name': self.class_name,
+            'difficulty_levels': list(self.difficulty_levels),
+            'default_difficulty': self.default_difficulty,
+            'source': self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a descriptor from a manifest entry."""
+        return cls(**data)
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+
+# Base classes a game module may subclass directly
+_BASE_CLASSES = ('BaseGame', 'AsyncBaseGame')
+
+
+def _is_base_game(base):
+    return (isinstance(base, ast.Name) and base.id in _BASE_CLASSES) or \
+        (isinstance(base, ast.Attribute) and base.attr in _BASE_CLASSES)
+
+
+def _describe_from_source(path, module):
+    """
+    Read a game's metadata from its source without importing it.
+
+    Looks for a direct BaseGame (or AsyncBaseGame) subclass whose __init__
+    passes literal metadata to super().__init__. Its difficulty levels come
+    from a difficulty.yaml next to the module, else an optional literal
+    DIFFICULTY_LEVELS.
+
+    Returns:
+        GameDescriptor: The descriptor, or None if the metadata isn't literal
+    """
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and any(_is_base_game(base) for base in node.bases)):
+            continue
+
+        fields = {}
+        levels = BaseGame.DIFFICULTY_LEVELS
+        for item in node.body:
+            if isinstance(item, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id == 'DIFFICULTY_LEVELS' for target in item.targets):
+                levels = _literal(item.value) or levels
+            elif isinstance(item, ast.FunctionDef) and item.name == '__init__':
+                for call in ast.walk(item):
+                    if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                            and call.func.attr == '__init__' and isinstance(call.func.value, ast.Call)
+                            and isinstance(call.func.value.func, ast.Name) and call.func.value.func.id == 'super'):
+                        fields.update(zip(_INIT_FIELDS, (_literal(arg) for arg in call.args)))
+                        fields.update((kw.arg, _literal(kw.value)) for kw in call.keywords if kw.arg in _INIT_FIELDS)
+
+        if not (fields.get('game_id') and fields.get('name')):
+            return None
+        profile_path = path.with_name(PROFILE_FILE)
+        if profile_path.exists():
+            levels = load_profiles(profile_path).names
+        return GameDescriptor(
+            game_id=fields['game_id'],
+            name=fields['name'],
+            description=fields.get('description') or '',
+            module=module,
+            class_name=node.name,
+            difficulty_levels=levels,
+            default_difficulty=fields.get('difficulty') or "Medium"
+        )
+    return None
+
+
+def _describe_entry_point(entry_point):
+    """
+    Describe a plugin game from its entry point metadata alone.
+
+    The entry point name is the game ID; the display name is derived from it and
+    the description is the distribution's summary. The game's own metadata
+    takes over once it is created.
+
+    Returns:
+        GameDescriptor: The descriptor (nothing is imported)
+    """
+    module, _, class_name = entry_point.value.partition(':')
+    dist = getattr(entry_point, 'dist', None)  # Python 3.10+
+    summary = dist.metadata.get('Summary') if dist is not None else None
+    return GameDescriptor(
+        game_id=entry_point.name,
+        name=entry_point.name.replace('_', ' ').replace('-', ' ').title(),
+        description=summary or '',
+        module=module.strip(),
+        class_name=class_name.strip(),
+        source=f"entry_point:{dist.metadata['Name']}" if dist is not None else "entry_point"
+    )
+
+
+def _game_entry_points():
+    """Installed entry points of the game plugin group."""
+    entry_points = importlib.metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        return list(entry_points.select(group=ENTRY_POINT_GROUP))
+    return list(entry_points.get(ENTRY_POINT_GROUP, []))  # Python 3.9
+
+
+def _describe_by_import(module):
+    """Fallback for games with computed metadata: import and instantiate once."""
+    game_module = importlib.import_module(module)
+    for attr in vars(game_module).values():
+        if isinstance(attr, type) and issubclass(attr, BaseGame) and attr is not BaseGame \
+                and attr.__module__ == module:
+            info = attr().get_info()
+            return GameDescriptor(
+                game_id=info['game_id'],
+                name=info['name'],
+                description=info['description'],
+                module=module,
+                class_name=attr.__name__,
+                difficulty_levels=attr.difficulty_levels(),
+                default_difficulty=info['difficulty']
+            )
+    return None
+
+
+class GameRegistry:
+    """
+    Catalog of the games under games/ and of plugin games, backed by a manifest cached on disk.
+
+    The manifest (id, name, description, module path and difficulty levels of
+    every game) is built from the games' source, without importing them, and
+    stored in games/__pycache__. It is keyed by the modification times of the
+    game directories and their game.py and difficulty.yaml files, so it is only
+    rebuilt when a game is added, removed or edited. Game modules are imported when a game is
+    selected (GameDescriptor.create).
+
+    Installed packages can add games through the `cli_game_collection.games`
+    entry point group (`game_id = "package.module:GameClass"`). Those are read
+    from package metadata once per process and never imported until selected.
+    """
+
+    _default = None
+
+    def __init__(self, games_dir=GAMES_DIR, cache_path=None):
+        """
+        Args:
+            games_dir (str|Path): Directory holding one package per game
+            cache_path (str|Path, optional): Manifest file, defaults to games/__pycache__/game_manifest.json
+        """
+        self.games_dir = Path(games_dir)
+        self.cache_path = Path(cache_path) if cache_path else self.games_dir / "__pycache__" / "game_manifest.json"
+        self.package = self.games_dir.name
+        self._signature = None
+        self._games = []
+        self._plugins = None
+
+    @classmethod
+    def default(cls):
+        """The shared registry of the built-in games directory."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def _scan(self):
+        """
+        Stat the game directories.
+
+        Returns:
+            dict: {directory name: [directory mtime_ns, game.py mtime_ns, difficulty.yaml mtime_ns or None]}
+        """
+        signature = {}
+        with os.scandir(self.games_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir() or entry.name.startswith(('.', '_')):
+                    continue
+                try:
+                    source = os.stat(os.path.join(entry.path, "game.py"))
+                except FileNotFoundError:
+                    continue
+                try:
+                    profile = os.stat(os.path.join(entry.path, PROFILE_FILE)).st_mtime_ns
+                except FileNotFoundError:
+                    profile = None
+                signature[entry.name] = [entry.stat().st_mtime_ns, source.st_mtime_ns, profile]
+        return signature
+
+    def _read_cache(self, signature):
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != MANIFEST_VERSION or data.get('signature') != signature:
+            return None
+        return [GameDescriptor.from_dict(entry) for entry in data['games']]
+
+    def _write_cache(self, signature, games):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({
+                'version': MANIFEST_VERSION,
+                'signature': signature,
+                'games': [game.to_dict() for game in games],
+            }), encoding='utf-8')
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass  # A read-only install just rebuilds the manifest each launch
+
+    def _build(self, signature):
+        games = []
+        for name in sorted(signature):
+            module = f"{self.package}.{name}.game"
+            try:
+                descriptor = _describe_from_source(self.games_dir / name / "game.py", module) \
+                    or _describe_by_import(module)
+            except Exception as e:
+                print(f"Error loading game {name}: {str(e)}")
+                continue
+            if descriptor:
+                games.append(descriptor)
+        return games
+
+    def plugins(self):
+        """
+        List games registered through entry points (read once per process).
+
+        Returns:
+            list: GameDescriptor objects, ordered by game ID
+        """
+        if self._plugins is None:
+            plugins = {}
+            for entry_point in _game_entry_points():
+                try:
+                    plugins.setdefault(entry_point.name, _describe_entry_point(entry_point))
+                except Exception as e:
+                    print(f"Error loading game plugin {entry_point.name}: {str(e)}")
+            self._plugins = [plugins[game_id] for game_id in sorted(plugins)]
+        return self._plugins
+
+    def refresh(self):
+        """Forget what was loaded, so the next games() call rescans directories and plugins."""
+        self._signature = None
+        self._plugins = None
+
+    def games(self):
+        """
+        List the installed games: the games/ directories first, then plugins.
+
+        Only the game directories are stat'ed; the manifest is re-read or
+        rebuilt when they changed. A plugin whose ID is already taken is skipped.
+
+        Returns:
+            list: GameDescriptor objects
+        """
+        signature = self._scan()
+        if signature != self._signature:
+            games = self._read_cache(signature)
+            if games is None:
+                games = self._build(signature)
+                self._write_cache(signature, games)
+            self._signature, self._games = signature, games
+
+        known = {game.game_id for game in self._games}
+        return self._games + [game for game in self.plugins() if game.game_id not in known]
+
+    def get(self, game_id):
+        """
+        Find a game by ID.
+
+        Returns:
+            GameDescriptor: The game, or None
+        """
+        return next((game for game in self.games() if game.game_id == game_id), None)
@@ -1,6 +1,7 @@
 from db.connection import Database
 from db.migration import MigrationManager
 from utils.session import Session
+from services.remember_me import restore_remembered_user
 from display_menu import show_auth_menu, show_main_menu
 
 
@@ -11,6 +12,12 @@ def main():
     print("Initializing database...")
     MigrationManager.migrate()
 
+    # Log straight back in if this device was remembered
+    user = restore_remembered_user()
+    if user:
+        Session.login(user)
+        print(f"\nWelcome back, {user.name}!")
+
     # Authentication loop
     while True:
         while not Session.is_authenticated():
@@ -5,7 +5,7 @@ class GameSession:
     
     def __init__(self, id=None, user_id=None, game_id=None, start_time=None, 
                 end_time=None, duration=None, score=None, completed=False, 
-                difficulty_level="Medium", session_data=None):
+                difficulty_level="Medium", session_data=None, seed=None):
         """Initialize a game session instance.
         
         Args:
@@ -19,6 +19,7 @@ class GameSession:
             completed (bool): Whether the game was completed or abandoned
             difficulty_level (str): The difficulty level the game was played at
             session_data (dict, optional): Additional game-specific session data
+            seed (int, optional): Seed of the game's random numbers, for replays
         """
         self.id = id
         self.user_id = user_id
@@ -30,6 +31,7 @@ class GameSession:
         self.completed = completed
         self.difficulty_level = difficulty_level
         self.session_data = session_data or {}
+        self.seed = seed
     
     def end(self, score=None, completed=True, session_data=None):
         """End the current session and calculate duration.
@@ -59,5 +61,6 @@ class GameSession:
             'score': self.score,
             'completed': self.completed,
             'difficulty_level': self.difficulty_level,
-            'session_data': self.session_data
+            'session_data': self.session_data,
+            'seed': self.seed
         }
\ No newline at end of file
@@ -3,18 +3,82 @@ from datetime import datetime
 from utils.password import PasswordHandler
 
 
+# Validation rules, compiled once at import time
+NAME_MIN_LENGTH = 3
+PASSWORD_MIN_LENGTH = 6
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+
+
 class ValidationError(Exception):
     """Exception raised for validation errors in the model."""
     pass
 
 
+def validate_name(value):
+    """
+    Validate a user name.
+
+    Returns:
+        str: The normalized (stripped) name
+
+    Raises:
+        ValidationError: If the name is too short
+    """
+    if not value or len(value.strip()) < NAME_MIN_LENGTH:
+        raise ValidationError(f"Name must be at least {NAME_MIN_LENGTH} characters long.")
+    return value.strip()
+
+
+def validate_email(value):
+    """
+    Validate an email address.
+
+    Returns:
+        str: The normalized (lowercased) email
+
+    Raises:
+        ValidationError: If the email is malformed
+    """
+    if not value or not EMAIL_PATTERN.match(value):
+        raise ValidationError("Invalid email format.")
+    return value.lower()
+
+
+def validate_password(value):
+    """
+    Validate a plaintext password's strength.
+
+    Returns:
+        str: The password, unchanged
+
+    Raises:
+        ValidationError: If the password is too weak
+    """
+    if not value or len(value) < PASSWORD_MIN_LENGTH:
+        raise ValidationError(f"Password must be at least {PASSWORD_MIN_LENGTH} characters long")
+    # if not any(char.isdigit() for char in value):
+    #     raise ValidationError("Password must contain at least one number")
+    # if not any(char.isupper() for char in value):
+    #     raise ValidationError("Password must contain at least one uppercase letter")
+    return value
+
+
 class User:
-    """User model with validation."""
+    """User model with validation.
+
+    A plaintext password is validated on assignment but only hashed when the
+    user is persisted (see `hash_pending_password`), so building or editing a
+    model never pays for bcrypt by itself.
+    """
+
+    __slots__ = ('id', '_name', '_email', '_password', '_pending_password', '_created_at', '_password_is_hashed')
+
     def __init__(self, name, email, password, id=None, created_at=None, password_is_hashed=False):
         self.id = id
         self._name = None
         self._email = None
         self._password = None
+        self._pending_password = None
         self._created_at = created_at or datetime.now()
         self._password_is_hashed = password_is_hashed
 
@@ -26,7 +90,7 @@ class User:
         if password_is_hashed:
             self._password = password  # Already hashed, store directly
         else:
-            self.password = password  # Not hashed, validate and hash
+            self.password = password  # Not hashed, validate and hash on save
 
     @property
     def name(self):
@@ -34,10 +98,7 @@ class User:
 
     @name.setter
     def name(self, value):
-        # Validate name
-        if not value or len(value.strip()) < 3:
-            raise ValidationError("Name must be at least 3 characters long.")
-        self._name = value.strip()
+        self._name = validate_name(value)
 
     @property
     def email(self):
@@ -45,11 +106,7 @@ class User:
 
     @email.setter
     def email(self, value):
-        # Validate email format
-        email_pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-        if not value or not re.match(email_pattern, value):
-            raise ValidationError("Invalid email format.")
-        self._email = value.lower()
+        self._email = validate_email(value)
 
     @property
     def password(self):
@@ -57,23 +114,34 @@ class User:
 
     @password.setter
     def password(self, value):
-        """Validate and hash the password."""
+        """Validate the password; hashing is deferred until the user is saved."""
         # Skip validation if the password is already hashed
         if self._password_is_hashed:
             self._password = value
             return
 
-        # Validate password strength
-        if not value or len(value) < 6:
-            raise ValidationError("Password must be at least 6 characters long")
-        # if not any(char.isdigit() for char in value):
-        #     raise ValidationError("Password must contain at least one number")
-        # if not any(char.isupper() for char in value):
-        #     raise ValidationError("Password must contain at least one uppercase letter")
+        self._pending_password = validate_password(value)
+        self._password = None
 
-        # Hash the password
-        self._password = PasswordHandler.hash_password(value)
-        self._password_is_hashed = True
+    @property
+    def has_pending_password(self):
+        """Whether a validated plaintext password is waiting to be hashed."""
+        return self._pending_password is not None
+
+    def hash_pending_password(self):
+        """
+        Hash the pending plaintext password, if any, and forget the plaintext.
+
+        Called by UserRepository.save right before the user is written.
+
+        Returns:
+            str: The password hash
+        """
+        if self._pending_password is not None:
+            self._password = PasswordHandler.hash_password(self._pending_password)
+            self._pending_password = None
+            self._password_is_hashed = True
+        return self._password
 
     @property
     def created_at(self):
@@ -89,14 +157,28 @@ class User:
             'created_at': self.created_at
         }
 
+    @classmethod
+    def hydrate(cls, id, name, email, password, created_at):
+        """
+        Build a User from trusted storage values without re-validating them.
+
+        Rows in the users table were validated (and their password hashed)
+        when they were written, so reading them back skips the setters.
+
+        Returns:
+            User: The hydrated user
+        """
+        user = cls.__new__(cls)
+        user.id = id
+        user._name = name
+        user._email = email
+        user._password = password
+        user._pending_password = None
+        user._created_at = created_at
+        user._password_is_hashed = True
+        return user
+
     @classmethod
     def from_db_row(cls, row):
-        """Create a User object from a database row."""
-        return cls(
-            id=row[0],
-            name=row[1],
-            email=row[2],
-            password=row[3],
-            created_at=row[4],
-            password_is_hashed=True  # Password from DB is already hashed
-        )
\ No newline at end of file
+        """Create a User object from a database row (id, name, email, password, created_at)."""
+        return cls.hydrate(row[0], row[1], row[2], row[3], row[4])
@@ -6,6 +6,12 @@ from db.connection import Database
 
 class GameSessionRepository:
     """Repository for game session data access operations."""
+
+    # Columns that may be streamed out of the game_sessions table
+    COLUMNS = (
+        'id', 'user_id', 'game_id', 'start_time', 'end_time', 'duration',
+        'score', 'completed', 'difficulty_level', 'session_data', 'seed'
+    )
     
     def create(self, game_session):
         """Insert a new game session record.
@@ -18,14 +24,15 @@ class GameSessionRepository:
         """
         with Database.execute('''
         INSERT INTO game_sessions 
-        (user_id, game_id, start_time, difficulty_level, session_data)
-        VALUES (?, ?, ?, ?, ?)
+        (user_id, game_id, start_time, difficulty_level, session_data, seed)
+        VALUES (?, ?, ?, ?, ?, ?)
         ''', (
             game_session.user_id,
             game_session.game_id,
             game_session.start_time.isoformat(),
             game_session.difficulty_level,
-            json.dumps(game_session.session_data)
+            json.dumps(game_session.session_data),
+            game_session.seed
         )) as cursor:
             game_session.id = cursor.lastrowid
             
@@ -129,5 +136,163 @@ class GameSessionRepository:
             score=row['score'],
             completed=bool(row['completed']),
             difficulty_level=row['difficulty_level'],
-            session_data=session_data
-        )
\ No newline at end of file
+            session_data=session_data,
+            seed=row['seed']
+        )
+
+    @staticmethod
+    def _build_filters(user_id=None, game_id=None, since=None, until=None):
+        """Build a WHERE clause and its parameters from optional filters.
+
+        Args:
+            user_id (int, optional): Only sessions played by this user
+            game_id (str, optional): Only sessions of this game
+            since (datetime, optional): Only sessions started at or after this time
+            until (datetime, optional): Only sessions started before this time
+
+        Returns:
+            tuple: (where_clause, params)
+        """
+        clauses = []
+        params = []
+
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if game_id is not None:
+            clauses.append("game_id = ?")
+            params.append(game_id)
+        if since is not None:
+            clauses.append("start_time >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            clauses.append("start_time < ?")
+            params.append(until.isoformat())
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
+
+    def iter_batches(self, columns=COLUMNS, batch_size=10_000, connection=None, **filters):
+        """Stream raw session rows in batches over a read-only connection.
+
+        Args:
+            columns (tuple): Columns to select, in order
+            batch_size (int): Maximum number of rows per batch
+            connection (sqlite3.Connection, optional): Read with this connection, e.g. a
+                Database.snapshot() shared with count()
+            **filters: user_id, game_id, since and until (see _build_filters)
+
+        Yields:
+            list: Up to `batch_size` row tuples at a time
+        """
+        unknown = [column for column in columns if column not in self.COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown game_sessions columns: {', '.join(unknown)}")
+
+        where, params = self._build_filters(**filters)
+        query = f"SELECT {', '.join(columns)} FROM game_sessions{where} ORDER BY id"
+        yield from Database.iter_batches(query, params, batch_size, connection=connection)
+
+    def count(self, connection=None, **filters):
+        """Count the sessions matching the given filters.
+
+        Args:
+            connection (sqlite3.Connection, optional): Count with this connection, e.g. a
+                Database.snapshot() shared with iter_batches()
+            **filters: user_id, game_id, since and until (see _build_filters)
+
+        Returns:
+            int: Number of matching sessions
+        """
+        where, params = self._build_filters(**filters)
+        query = f"SELECT COUNT(*) FROM game_sessions{where}"
+        if connection is not None:
+            return connection.execute(query, params).fetchone()[0]
+        with Database.readonly() as connection:
+            return connection.execute(query, params).fetchone()[0]
+
+    def summarize_groups(self, **filters):
+        """Count sessions and score ranges per game and difficulty.
+
+        Args:
+            **filters: user_id, game_id, since and until (see _build_filters)
+
+        Returns:
+            list: (game_id, difficulty_level, sessions, min_score, max_score) tuples
+        """
+        where, params = self._build_filters(**filters)
+        query = f'''
+        SELECT game_id, difficulty_level, COUNT(*), MIN(score), MAX(score)
+        FROM game_sessions{where}
+        GROUP BY game_id, difficulty_level
+        ORDER BY game_id, difficulty_level
+        '''
+        with Database.readonly() as connection:
+            return connection.execute(query, params).fetchall()
+
+    def summarize_rollups(self, game_id=None, since=None, until=None):
+        """Totals of rolled-up sessions per game and difficulty.
+
+        Rollups are per day, so the time window is applied at day granularity.
+
+        Args:
+            game_id (str, optional): Only rollups of this game
+            since (datetime, optional): Only days on or after this date
+            until (datetime, optional): Only days before this date
+
+        Returns:
+            list: (game_id, difficulty_level, sessions, completed, scored, score_sum,
+                score_sq_sum, score_min, score_max, timed, total_duration) tuples
+        """
+        clauses = []
+        params = []
+        if game_id is not None:
+            clauses.append("game_id = ?")
+            params.append(game_id)
+        if since is not None:
+            clauses.append("day >= ?")
+            params.append(since.date().isoformat())
+        if until is not None:
+            clauses.append("day < ?")
+            params.append(until.date().isoformat())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        query = f'''
+        SELECT game_id, NULLIF(difficulty_level, ''), SUM(sessions), SUM(completed), SUM(scored),
+               SUM(score_sum), SUM(score_sq_sum), MIN(score_min), MAX(score_max),
+               SUM(timed), SUM(total_duration)
+        FROM game_session_daily{where}
+        GROUP BY game_id, difficulty_level
+        '''
+        with Database.readonly() as connection:
+            return connection.execute(query, tuple(params)).fetchall()
+
+    def top_scores(self, game_id, difficulty_level=None, limit=10):
+        """Best score per player for a game, across raw and rolled-up sessions.
+
+        Args:
+            game_id (str): Game to rank
+            difficulty_level (str, optional): Restrict to one difficulty level
+            limit (int): Maximum number of players to return
+
+        Returns:
+            list: (user_name, best_score) tuples, best first
+        """
+        with Database.execute('''
+        SELECT u.name, best.score
+        FROM (
+            SELECT user_id, MAX(score) AS score FROM (
+                SELECT user_id, score FROM game_sessions
+                WHERE game_id = ? AND COALESCE(difficulty_level, '') = COALESCE(?, difficulty_level, '')
+                  AND score IS NOT NULL
+                UNION ALL
+                SELECT user_id, best_score FROM game_user_best
+                WHERE game_id = ? AND difficulty_level = COALESCE(?, difficulty_level)
+            )
+            GROUP BY user_id
+        ) AS best
+        JOIN users u ON u.id = best.user_id AND u.deleted_at IS NULL
+        ORDER BY best.score DESC
+        LIMIT ?
+        ''', (game_id, difficulty_level, game_id, difficulty_level, limit)) as cursor:
+            return cursor.fetchall()
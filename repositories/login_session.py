@@ -0,0 +1,76 @@
+from db.connection import Database
+from models.user import User
+
+
+class LoginSessionRepository:
+    """Repository for "remember me" login sessions (the sessions table)."""
+
+    @staticmethod
+    def create(session_id, user_id, expires_at):
+        """
+        Record an issued token
+
+        Args:
+            session_id (str): The token's jti claim
+            user_id (int): The user the token logs in
+            expires_at (float): UNIX time the token expires
+        """
+        with Database.execute(
+            "INSERT INTO sessions (id, user_id, expires_at) VALUES (?, ?, ?)",
+            (session_id, user_id, expires_at)
+        ):
+            pass
+
+    @staticmethod
+    def find_active_user(session_id, user_id, now):
+        """
+        Load the user of a session that is neither revoked nor expired
+
+        One primary-key lookup both checks revocation and loads the user,
+        including the password hash (needed to confirm account deletion).
+
+        Args:
+            session_id (str): The token's jti claim
+            user_id (int): The token's subject, must match the session
+            now (float): Current UNIX time
+
+        Returns:
+            User: The logged-in user, or None if the session is not valid
+        """
+        with Database.execute(
+            "SELECT u.id, u.name, u.email, u.password, u.created_at "
+            "FROM sessions s JOIN users u ON u.id = s.user_id "
+            "WHERE s.id = ? AND s.user_id = ? AND s.revoked_at IS NULL AND s.expires_at > ? "
+            "AND u.deleted_at IS NULL",
+            (session_id, user_id, now)
+        ) as cursor:
+            row = cursor.fetchone()
+        return User.from_db_row(row) if row else None
+
+    @staticmethod
+    def revoke(session_id):
+        """
+        Revoke one session
+
+        Returns:
+            bool: True if an active session was revoked
+        """
+        with Database.execute(
+            "UPDATE sessions SET revoked_at = CURRENT_TIMESTAMP WHERE id = ? AND revoked_at IS NULL",
+            (session_id,)
+        ) as cursor:
+            return cursor.rowcount > 0
+
+    @staticmethod
+    def revoke_all(user_id):
+        """
+        Revoke every session of a user, e.g. on all devices
+
+        Returns:
+            int: Number of sessions revoked
+        """
+        with Database.execute(
+            "UPDATE sessions SET revoked_at = CURRENT_TIMESTAMP WHERE user_id = ? AND revoked_at IS NULL",
+            (user_id,)
+        ) as cursor:
+            return cursor.rowcount
@@ -1,29 +1,133 @@
 import sqlite3
+from enum import Enum
+from typing import NamedTuple, Optional
+
 from db.connection import Database
 from models.user import User
+from utils.cache import LRUCache
+from utils.config import Config
+
+
+# User lookup cache defaults, overridable with USER_CACHE_SIZE / USER_CACHE_TTL
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TTL = 30.0
+
+
+class WriteStatus(Enum):
+    """Outcome of a user write."""
+
+    OK = "ok"
+    NOT_FOUND = "not_found"
+    EMAIL_TAKEN = "email_taken"
+    NO_CHANGES = "no_changes"
+    ERROR = "error"
+
+
+class UserWriteResult(NamedTuple):
+    """Result of UserRepository.save/update/delete."""
+
+    status: WriteStatus
+    message: str
+    user: Optional[User] = None
+
+    @property
+    def success(self):
+        return self.status is WriteStatus.OK
 
 
 class UserRepository:
-    """Repository for User database operations."""
+    """Repository for User database operations.
+
+    find_by_id and find_by_email are served from bounded LRU+TTL caches of raw
+    rows. Writes through the repository invalidate the affected entries, and
+    commits from other connections are detected through PRAGMA data_version.
+    """
+
+    _id_cache = None
+    _email_cache = None
+    _data_version = None
+
+    @classmethod
+    def _caches(cls):
+        """Create the lookup caches on first use and drop them if another connection wrote."""
+        if cls._id_cache is None:
+            size = Config.get_int("USER_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+            ttl = Config.get_float("USER_CACHE_TTL", DEFAULT_CACHE_TTL)
+            cls._id_cache = LRUCache(size, ttl)
+            cls._email_cache = LRUCache(size, ttl)
+
+        version = Database.data_version()
+        if version != cls._data_version:
+            cls._id_cache.clear()
+            cls._email_cache.clear()
+            cls._data_version = version
+        return cls._id_cache, cls._email_cache
+
+    @classmethod
+    def _invalidate(cls, user_id=None, email=None):
+        """Forget cached rows for a user, by ID and/or email."""
+        if cls._id_cache is None:
+            return
+        if user_id is not None:
+            cls._id_cache.pop(user_id)
+            cls._email_cache.pop_matching(lambda row: row[0] == user_id)
+        if email is not None:
+            cls._email_cache.pop(email.lower())
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop every cached user row."""
+        if cls._id_cache is not None:
+            cls._id_cache.clear()
+            cls._email_cache.clear()
+
+    @classmethod
+    def cache_stats(cls):
+        """
+        Hit and miss counters of the lookup caches
+
+        Returns:
+            dict: {'by_id': stats, 'by_email': stats}, see LRUCache.stats
+        """
+        if cls._id_cache is None:
+            return {'by_id': None, 'by_email': None}
+        return {'by_id': cls._id_cache.stats(), 'by_email': cls._email_cache.stats()}
 
     @staticmethod
     def save(user):
-        """Save a User object to the database."""
+        """
+        Insert a new user in a single statement
+
+        A duplicate email is detected by the UNIQUE constraint itself
+        (ON CONFLICT DO NOTHING returns no row), so no lookup runs first.
+
+        Args:
+            user (User): The user to persist; its id and created_at are filled in
+
+        Returns:
+            UserWriteResult: OK with the user, or EMAIL_TAKEN / ERROR
+        """
         try:
-            if UserRepository.email_exists(user.email):
-                print("Error: This email is already registered.")
-                return False
+            # Passwords are only hashed once the user is actually persisted
+            user.hash_pending_password()
             with Database.execute(
-                "INSERT INTO users (name, email, password) VALUES (?, ?, ?)",
+                "INSERT INTO users (name, email, password) VALUES (?, ?, ?) "
+                "ON CONFLICT DO NOTHING RETURNING id, created_at",
                 (user.name, user.email, user.password)
             ) as cursor:
-                user.id = cursor.lastrowid  # Get the ID of the inserted row
-            return True
-        except sqlite3.IntegrityError:
-            return False
+                row = cursor.fetchone()
+        except sqlite3.Error as e:
+            return UserWriteResult(WriteStatus.ERROR, f"Database error: {str(e)}")
 
-    @staticmethod
-    def find_by_id(user_id):
+        if row is None:
+            return UserWriteResult(WriteStatus.EMAIL_TAKEN, "This email is already registered.")
+
+        user.id, user._created_at = row
+        UserRepository._invalidate(user.id, user.email)
+        return UserWriteResult(WriteStatus.OK, "User created successfully", user)
+
+    @classmethod
+    def find_by_id(cls, user_id):
         """
         Find a user by ID
         
@@ -31,142 +135,217 @@ class UserRepository:
             user_id (int): The ID of the user to find
             
         Returns:
-            dict: User data if found, None otherwise
+            User: The user (without password hash) if found, None otherwise
+        """
+        id_cache, _ = cls._caches()
+        user_data = id_cache.get(user_id)
+        if user_data is None:
+            with Database.execute(
+                "SELECT id, name, email, created_at FROM users WHERE id = ? AND deleted_at IS NULL",
+                (user_id,)
+            ) as cursor:
+                user_data = cursor.fetchone()
+            if user_data is None:
+                return None
+            id_cache.put(user_id, user_data)
+
+        # Stored rows are already validated, skip the model setters
+        return User.hydrate(
+            id=user_data[0],
+            name=user_data[1],
+            email=user_data[2],
+            password=None,
+            created_at=user_data[3]
+        )
+
+    @staticmethod
+    def find_all(limit=None, offset=0):
+        """
+        List active users for admin views, ordered by ID
+
+        Args:
+            limit (int, optional): Maximum number of users to return
+            offset (int): Number of users to skip
+
+        Returns:
+            list: List of User objects (without password hashes)
         """
         with Database.execute(
-            "SELECT id, name, email, created_at FROM users WHERE id = ?", 
-            (user_id,)
+            "SELECT id, name, email, NULL, created_at FROM users WHERE deleted_at IS NULL "
+            "ORDER BY id LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset)
         ) as cursor:
-            user_data = cursor.fetchone()
-
-            if user_data:
-                # Convert tuple to User object
-                return User(
-                    id=user_data[0],
-                    name=user_data[1],
-                    email=user_data[2],
-                    password=None,
-                    created_at=user_data[3],
-                    password_is_hashed=True
-                )
-        return None
+            return [User.from_db_row(row) for row in cursor.fetchall()]
 
     @staticmethod
     def update(user_id, data):
         """
-        Update an existing user record in the database
+        Update an active user record in a single statement
         
         Args:
             user_id (int): The ID of the user to update
             data (dict): Dictionary containing fields to update
                 
         Returns:
-            tuple: (success, message, user_data)
-                success (bool): True if update succeeds, False otherwise
-                message (str): Success/error message
-                user_data (dict): Updated user data if successful, None otherwise
+            UserWriteResult: OK with the updated User, or
+                NO_CHANGES / NOT_FOUND / EMAIL_TAKEN / ERROR
         """
+        # Build update SQL parts (simple mapping only, no validation)
+        update_parts = []
+        params = []
+        for field in ('name', 'email', 'password'):
+            if data and data.get(field) is not None:
+                update_parts.append(f"{field} = ?")
+                params.append(data[field])
+
+        if not update_parts:
+            return UserWriteResult(WriteStatus.NO_CHANGES, "No valid fields to update")
+
+        # RETURNING hands back the stored row, so neither an existence check
+        # nor a re-read is needed
+        sql = (
+            f"UPDATE users SET {', '.join(update_parts)} WHERE id = ? AND deleted_at IS NULL "
+            "RETURNING id, name, email, password, created_at"
+        )
+        params.append(user_id)
+
         try:
-            # Early return if no data
-            if not data:
-                return False, "No data provided for update", None
-            
-            # Check if the user exists
-            existing_user = UserRepository.find_by_id(user_id)
-            print(existing_user)
-            if not existing_user:
-                return False, f"User with ID {user_id} not found", None
-                
-            # Build update SQL parts
-            update_parts = []
-            params = []
-            
-            # Add fields to update (simple mapping only, no validation)
-            valid_fields = ['name', 'email', 'password']
-            for field in valid_fields:
-                if field in data and data[field] is not None:
-                    update_parts.append(f"{field} = ?")
-                    params.append(data[field])
-            
-            # If no fields to update, return early
-            if not update_parts:
-                return False, "No valid fields to update", None
-            
-            # Build and execute the SQL query
-            sql = f"UPDATE users SET {', '.join(update_parts)} WHERE id = ?"
-            params.append(user_id)
-            
             with Database.execute(sql, tuple(params)) as cursor:
-                # Check if update was successful
-                if cursor.rowcount == 0:
-                    return False, "No changes made", None
-                
-                # Get the updated user data
-                updated_user = UserRepository.find_by_id(user_id)
-                return True, "User updated successfully", updated_user
-            
-        except Exception as e:
-            return False, f"Database error: {str(e)}", None
+                row = cursor.fetchone()
+        except sqlite3.IntegrityError:
+            return UserWriteResult(
+                WriteStatus.EMAIL_TAKEN, "Email address is already in use by another account"
+            )
+        except sqlite3.Error as e:
+            return UserWriteResult(WriteStatus.ERROR, f"Database error: {str(e)}")
+
+        if row is None:
+            return UserWriteResult(WriteStatus.NOT_FOUND, f"User with ID {user_id} not found")
+
+        UserRepository._invalidate(user_id)
+        return UserWriteResult(WriteStatus.OK, "User updated successfully", User.from_db_row(row))
+
+    @staticmethod
+    def update_password_hash(user_id, old_hash, new_hash):
+        """
+        Replace a password hash, only if it is still the one that was verified
+
+        Args:
+            user_id (int): The ID of the user
+            old_hash (str): Hash the new one was derived from
+            new_hash (str): Upgraded hash of the same password
+
+        Returns:
+            bool: True if the hash was replaced
+        """
+        with Database.execute(
+            "UPDATE users SET password = ? WHERE id = ? AND password = ? AND deleted_at IS NULL",
+            (new_hash, user_id, old_hash)
+        ) as cursor:
+            updated = cursor.rowcount > 0
+        if updated:
+            UserRepository._invalidate(user_id)
+        return updated
 
     @staticmethod
     def delete(user_id):
         """
-        Delete a user record from the database
+        Soft-delete a user: the row is kept with deleted_at set until it is purged
         
         Args:
             user_id (int): The ID of the user to delete
             
         Returns:
-            tuple: (success, message)
-                success (bool): True if deletion succeeds, False otherwise
-                message (str): Success/error message
+            UserWriteResult: OK, or NOT_FOUND / ERROR
         """
         try:
-            # Check if user exists before attempting deletion
-            existing_user = UserRepository.find_by_id(user_id)
-            if not existing_user:
-                return False, f"User with ID {user_id} not found"
-            
-            # Execute the deletion
-            with Database.execute("DELETE FROM users WHERE id = ?", (user_id,)) as cursor:
-            
-                # Check if delete was successful
-                if cursor.rowcount == 0:
-                    return False, "No user was deleted"
-                    
-                return True, "User deleted successfully"
-            
-        except Exception as e:
-            return False, f"Database error during deletion: {str(e)}"
+            with Database.execute(
+                "UPDATE users SET deleted_at = CURRENT_TIMESTAMP WHERE id = ? AND deleted_at IS NULL",
+                (user_id,)
+            ) as cursor:
+                deleted = cursor.rowcount
+        except sqlite3.Error as e:
+            return UserWriteResult(WriteStatus.ERROR, f"Database error during deletion: {str(e)}")
+
+        UserRepository._invalidate(user_id)
+        if deleted == 0:
+            return UserWriteResult(WriteStatus.NOT_FOUND, f"User with ID {user_id} not found")
+        return UserWriteResult(WriteStatus.OK, "User deleted successfully")
+
+    @staticmethod
+    def restore(user_id):
+        """
+        Undo a soft delete
+
+        Args:
+            user_id (int): The ID of the deleted user
+
+        Returns:
+            UserWriteResult: OK with the restored User, or NOT_FOUND /
+                EMAIL_TAKEN (the address was registered again meanwhile) / ERROR
+        """
+        try:
+            with Database.execute(
+                "UPDATE users SET deleted_at = NULL WHERE id = ? AND deleted_at IS NOT NULL "
+                "RETURNING id, name, email, password, created_at",
+                (user_id,)
+            ) as cursor:
+                row = cursor.fetchone()
+        except sqlite3.IntegrityError:
+            return UserWriteResult(
+                WriteStatus.EMAIL_TAKEN, "Email address is already in use by another account"
+            )
+        except sqlite3.Error as e:
+            return UserWriteResult(WriteStatus.ERROR, f"Database error: {str(e)}")
+
+        if row is None:
+            return UserWriteResult(WriteStatus.NOT_FOUND, f"No deleted user with ID {user_id}")
+
+        UserRepository._invalidate(user_id)
+        return UserWriteResult(WriteStatus.OK, "User restored successfully", User.from_db_row(row))
 
     @staticmethod
-    def find_by_email(email):
-        """Retrieve a user by email."""
+    def find_deleted_by_email(email):
+        """
+        Find the most recently deleted account with this email (for restores)
+
+        Returns:
+            User: The deleted user, or None
+        """
         with Database.execute(
-            "SELECT id, name, email, password, created_at FROM users WHERE email = ?",
-            (email.lower(),)
+            "SELECT id, name, email, password, created_at FROM users "
+            "WHERE email = ? AND deleted_at IS NOT NULL ORDER BY deleted_at DESC LIMIT 1",
+            (email,)
         ) as cursor:
-            user_data = cursor.fetchone()
-
-            if user_data:
-                # Convert tuple to User object
-                return User(
-                    id=user_data[0],
-                    name=user_data[1],
-                    email=user_data[2],
-                    password=user_data[3],
-                    created_at=user_data[4],
-                    password_is_hashed=True
-                )
-        return None
+            row = cursor.fetchone()
+        return User.from_db_row(row) if row else None
+
+    @classmethod
+    def find_by_email(cls, email):
+        """Retrieve an active user by email (case-insensitive, via idx_users_email_active)."""
+        # users.email is COLLATE NOCASE, only the cache key needs folding
+        cache_key = email.lower()
+        _, email_cache = cls._caches()
+        user_data = email_cache.get(cache_key)
+        if user_data is None:
+            with Database.execute(
+                "SELECT id, name, email, password, created_at FROM users "
+                "WHERE email = ? AND deleted_at IS NULL",
+                (email,)
+            ) as cursor:
+                user_data = cursor.fetchone()
+            if user_data is None:
+                return None
+            email_cache.put(cache_key, user_data)
+
+        # Stored rows are already validated, skip the model setters
+        return User.from_db_row(user_data)
 
     @staticmethod
     def email_exists(email):
-        """Check if an email already exists in the database."""
+        """Check if an active account uses this email (case-insensitive)."""
         with Database.execute(
-            "SELECT COUNT(*) FROM users WHERE email = ?",
-            (email.lower(),)
+            "SELECT EXISTS (SELECT 1 FROM users WHERE email = ? AND deleted_at IS NULL)",
+            (email,)
         ) as cursor:
-            count = cursor.fetchone()[0]
-
-        return count > 0
\ No newline at end of file
+            return bool(cursor.fetchone()[0])
\ No newline at end of file
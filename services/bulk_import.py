@@ -0,0 +1,359 @@
+import csv
+import json
+import time
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+from db.connection import Database
+from models.user import EMAIL_PATTERN, NAME_MIN_LENGTH
+
+
+# Records validated and written per transaction; also the checkpoint interval
+DEFAULT_BATCH_SIZE = 50_000
+
+IMPORT_SUFFIXES = ('.jsonl', '.csv')
+
+# Legacy passwords must already be bcrypt hashes, hashing millions of rows here is not an option
+BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+BCRYPT_HASH_LENGTH = 60
+
+
+class BulkImportError(Exception):
+    """Raised when an import cannot start (unknown format, already imported, ...)."""
+    pass
+
+
+def iter_records(path, skip=0):
+    """
+    Stream records out of a JSONL or CSV file.
+
+    Args:
+        path (Path): Input file; the format is picked from its suffix
+        skip (int): Number of leading records to skip (resuming from a checkpoint)
+
+    Yields:
+        dict: One record per line/row
+    """
+    suffix = path.suffix.lower()
+    with open(path, newline='', encoding='utf-8') as handle:
+        if suffix == '.jsonl':
+            lines = (line for line in handle if line.strip())
+            for line in islice(lines, skip, None):
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    yield None  # Counted as a rejected record
+        elif suffix == '.csv':
+            reader = csv.DictReader(handle)
+            for row in islice(reader, skip, None):
+                # CSV has no nulls, treat empty cells as missing
+                yield {key: (value if value != '' else None) for key, value in row.items()}
+        else:
+            raise BulkImportError(f"Unsupported import format '{suffix}', expected .jsonl or .csv")
+
+
+def validate_user(record):
+    """
+    Validate and normalize one user record.
+
+    Returns:
+        tuple: (row, error) where row is (name, email, password, created_at)
+    """
+    if not isinstance(record, dict):
+        return None, "malformed record"
+
+    name = (record.get('name') or '').strip()
+    if len(name) < NAME_MIN_LENGTH:
+        return None, f"name must be at least {NAME_MIN_LENGTH} characters long"
+
+    email = (record.get('email') or '').strip()
+    if not EMAIL_PATTERN.match(email):
+        return None, "invalid email format"
+
+    password = record.get('password_hash') or record.get('password') or ''
+    if len(password) != BCRYPT_HASH_LENGTH or not password.startswith(BCRYPT_PREFIXES):
+        return None, "password must be an existing bcrypt hash"
+
+    created_at = record.get('created_at')
+    if created_at:
+        try:
+            created_at = datetime.fromisoformat(str(created_at)).isoformat(sep=' ')
+        except ValueError:
+            return None, "invalid created_at timestamp"
+    else:
+        created_at = datetime.now().isoformat(sep=' ', timespec='seconds')
+
+    return (name, email.lower(), password, created_at), None
+
+
+def validate_session(record):
+    """
+    Validate and normalize one game session record.
+
+    Returns:
+        tuple: (row, error) where row is (user_id, user_email, game_id, start_time, end_time,
+            duration, score, completed, difficulty_level, session_data); exactly one of
+            user_id and user_email is set
+    """
+    if not isinstance(record, dict):
+        return None, "malformed record"
+
+    user_id = record.get('user_id')
+    user_email = record.get('user_email')
+    if user_id is not None:
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return None, "invalid user_id"
+        user_email = None
+    elif user_email:
+        user_email = str(user_email).strip().lower()
+    else:
+        return None, "user_id or user_email is required"
+
+    game_id = record.get('game_id')
+    if not game_id:
+        return None, "game_id is required"
+
+    try:
+        start_time = datetime.fromisoformat(str(record.get('start_time'))).isoformat()
+        end_time = record.get('end_time')
+        end_time = datetime.fromisoformat(str(end_time)).isoformat() if end_time else None
+    except ValueError:
+        return None, "invalid start_time/end_time timestamp"
+
+    try:
+        duration = record.get('duration')
+        duration = float(duration) if duration is not None else None
+        score = record.get('score')
+        score = int(float(score)) if score is not None else None
+    except (TypeError, ValueError):
+        return None, "invalid duration/score"
+
+    completed = record.get('completed')
+    if isinstance(completed, str):
+        completed = completed.strip().lower() in ('1', 'true', 'yes')
+    completed = 1 if completed else 0
+
+    session_data = record.get('session_data') or {}
+    if isinstance(session_data, str):
+        try:
+            session_data = json.loads(session_data)
+        except json.JSONDecodeError:
+            return None, "session_data is not valid JSON"
+
+    return (
+        user_id, user_email, str(game_id), start_time, end_time, duration, score,
+        completed, record.get('difficulty_level'), json.dumps(session_data)
+    ), None
+
+
+def _resolve_user_ids(connection, rows):
+    """
+    Replace user_email with user_id in session rows and check explicit user_ids.
+
+    Rows whose user (by email or id) doesn't exist or was deleted are returned as rejects.
+    """
+    emails = list({row[1] for row in rows if row[0] is None})
+    explicit_ids = list({row[0] for row in rows if row[0] is not None})
+    ids = {}
+    known_ids = set()
+    # Stay well below SQLite's bound-parameter limit
+    for start in range(0, len(emails), 500):
+        chunk = emails[start:start + 500]
+        placeholders = ', '.join('?' * len(chunk))
+        ids.update(
+            (email.lower(), user_id) for user_id, email in connection.execute(
+                f"SELECT id, email FROM users WHERE email IN ({placeholders}) AND deleted_at IS NULL", chunk
+            )
+        )
+    for start in range(0, len(explicit_ids), 500):
+        chunk = explicit_ids[start:start + 500]
+        placeholders = ', '.join('?' * len(chunk))
+        known_ids.update(
+            user_id for (user_id,) in connection.execute(
+                f"SELECT id FROM users WHERE id IN ({placeholders}) AND deleted_at IS NULL", chunk
+            )
+        )
+
+    resolved, rejects = [], []
+    for row in rows:
+        if row[0] is not None:
+            user_id = row[0] if row[0] in known_ids else None
+        else:
+            user_id = ids.get(row[1])
+        if user_id is None:
+            rejects.append((row, f"unknown user {row[1] if row[0] is None else row[0]}"))
+        else:
+            resolved.append((user_id,) + row[2:])
+    return resolved, rejects
+
+
+def _insert_users(connection, rows):
+    before = connection.total_changes
+    connection.executemany(
+        "INSERT OR IGNORE INTO users (name, email, password, created_at) VALUES (?, ?, ?, ?)",
+        rows
+    )
+    return connection.total_changes - before, []
+
+
+def _insert_sessions(connection, rows):
+    resolved, rejects = _resolve_user_ids(connection, rows)
+    connection.executemany(
+        "INSERT INTO game_sessions (user_id, game_id, start_time, end_time, duration, score, "
+        "completed, difficulty_level, session_data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        resolved
+    )
+    return len(resolved), rejects
+
+
+# kind -> (target table, validator, batch writer)
+_IMPORTERS = {
+    'users': ('users', validate_user, _insert_users),
+    'sessions': ('game_sessions', validate_session, _insert_sessions),
+}
+
+
+def _defer_indexes(connection, table):
+    """
+    Drop the non-unique secondary indexes of a table.
+
+    Unique indexes stay in place since they are what deduplicates the import.
+
+    Returns:
+        list: [name, create_sql] pairs to rebuild the dropped indexes
+    """
+    indexes = connection.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+        "AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%'",
+        (table,)
+    ).fetchall()
+    for name, _ in indexes:
+        connection.execute(f'DROP INDEX IF EXISTS "{name}"')
+    return [[name, sql] for name, sql in indexes]
+
+
+def _rebuild_indexes(connection, indexes):
+    """Recreate deferred indexes that don't exist yet."""
+    for name, sql in indexes:
+        exists = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+        ).fetchone()
+        if not exists:
+            connection.execute(sql)
+
+
+def bulk_import(path, kind, batch_size=DEFAULT_BATCH_SIZE, rejects_path=None, restart=False, progress=None):
+    """
+    Stream users or game sessions from a JSONL/CSV file into the database.
+
+    Records are validated a batch at a time and written with executemany, one
+    transaction per batch. The number of consumed records is stored in the
+    import_checkpoints table inside the same transaction, so an interrupted
+    import resumes exactly after the last committed batch. Secondary indexes
+    on game_sessions are dropped for the duration of the import and rebuilt
+    once at the end.
+
+    Args:
+        path (str|Path): Input file (.jsonl or .csv)
+        kind (str): 'users' or 'sessions'
+        batch_size (int): Records per transaction
+        rejects_path (str|Path, optional): Where to write rejected records as JSONL
+        restart (bool): Ignore any existing checkpoint and import from the start
+        progress (callable, optional): Called with the stats dict after every batch
+
+    Returns:
+        dict: Import statistics (read, inserted, skipped, rejected, seconds, rows_per_second)
+    """
+    if kind not in _IMPORTERS:
+        raise BulkImportError(f"Unknown import kind '{kind}', expected one of {', '.join(_IMPORTERS)}")
+    if batch_size < 1:
+        raise BulkImportError(f"batch_size must be at least 1, got {batch_size}")
+    table, validate, write_batch = _IMPORTERS[kind]
+
+    path = Path(path)
+    if path.suffix.lower() not in IMPORT_SUFFIXES:
+        raise BulkImportError(f"Unsupported import format '{path.suffix}', expected .jsonl or .csv")
+    source = str(path.resolve())
+
+    with Database.execute(
+        "SELECT records, deferred_indexes, completed_at FROM import_checkpoints WHERE source = ? AND kind = ?",
+        (source, kind)
+    ) as cursor:
+        checkpoint = cursor.fetchone()
+
+    if checkpoint and not restart and checkpoint[2]:
+        raise BulkImportError(f"{path} was already imported on {checkpoint[2]} (use restart to import it again)")
+
+    resume_from = checkpoint[0] if checkpoint and not restart else 0
+    deferred = json.loads(checkpoint[1]) if checkpoint and checkpoint[1] else []
+
+    stats = {'read': resume_from, 'inserted': 0, 'skipped': 0, 'rejected': 0,
+             'resumed_from': resume_from, 'seconds': 0.0, 'rows_per_second': 0.0}
+
+    with Database.transaction() as connection:
+        deferred += [index for index in _defer_indexes(connection, table) if index not in deferred]
+        connection.execute(
+            "INSERT INTO import_checkpoints (source, kind, records, deferred_indexes) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(source, kind) DO UPDATE SET records = excluded.records, "
+            "deferred_indexes = excluded.deferred_indexes, completed_at = NULL, updated_at = CURRENT_TIMESTAMP",
+            (source, kind, resume_from, json.dumps(deferred))
+        )
+
+    rejects_file = open(rejects_path, 'a', encoding='utf-8') if rejects_path else None
+    start = time.perf_counter()
+    try:
+        records = iter_records(path, skip=resume_from)
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+
+            rows, rejects = [], []
+            for record in batch:
+                row, error = validate(record)
+                if error:
+                    rejects.append((record, error))
+                else:
+                    rows.append(row)
+
+            with Database.transaction() as connection:
+                inserted, write_rejects = write_batch(connection, rows) if rows else (0, [])
+                stats['read'] += len(batch)
+                connection.execute(
+                    "UPDATE import_checkpoints SET records = ?, updated_at = CURRENT_TIMESTAMP "
+                    "WHERE source = ? AND kind = ?",
+                    (stats['read'], source, kind)
+                )
+
+            rejects += write_rejects
+            stats['inserted'] += inserted
+            stats['rejected'] += len(rejects)
+            stats['skipped'] += len(rows) - len(write_rejects) - inserted  # e.g. duplicate emails
+
+            if rejects_file:
+                for record, error in rejects:
+                    rejects_file.write(json.dumps({'error': error, 'record': record}, default=str) + '\n')
+
+            stats['seconds'] = time.perf_counter() - start
+            stats['rows_per_second'] = (stats['read'] - resume_from) / stats['seconds'] if stats['seconds'] else 0.0
+            if progress:
+                progress(stats)
+
+        # Rebuild deferred indexes once, then mark the import as done
+        with Database.transaction() as connection:
+            _rebuild_indexes(connection, deferred)
+            connection.execute(
+                "UPDATE import_checkpoints SET deferred_indexes = NULL, completed_at = CURRENT_TIMESTAMP, "
+                "updated_at = CURRENT_TIMESTAMP WHERE source = ? AND kind = ?",
+                (source, kind)
+            )
+    finally:
+        if rejects_file:
+            rejects_file.close()
+
+    stats['seconds'] = time.perf_counter() - start
+    stats['rows_per_second'] = (stats['read'] - resume_from) / stats['seconds'] if stats['seconds'] else 0.0
+    return stats
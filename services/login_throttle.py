@@ -0,0 +1,108 @@
+import math
+import socket
+import time
+
+from db.connection import Database
+from utils.config import Config
+
+
+# Token bucket defaults: a burst of attempts, then a steady refill per minute.
+# Overridable with LOGIN_EMAIL_BURST / LOGIN_EMAIL_PER_MINUTE / LOGIN_HOST_BURST / LOGIN_HOST_PER_MINUTE
+DEFAULT_EMAIL_BURST = 5
+DEFAULT_EMAIL_PER_MINUTE = 5
+DEFAULT_HOST_BURST = 20
+DEFAULT_HOST_PER_MINUTE = 30
+
+# Take one token, refilling by elapsed time first. When the bucket is short the
+# WHERE clause skips the update and no row comes back, so a rejection writes nothing.
+_TAKE_SQL = """
+INSERT INTO login_buckets (key, tokens, updated_at) VALUES (:key, :capacity - 1, :now)
+ON CONFLICT (key) DO UPDATE SET
+    tokens = MIN(:capacity, tokens + MAX(:now - updated_at, 0) * :rate) - 1,
+    updated_at = :now
+WHERE MIN(:capacity, tokens + MAX(:now - updated_at, 0) * :rate) >= 1
+RETURNING tokens
+"""
+
+_PEEK_SQL = "SELECT MIN(:capacity, tokens + MAX(:now - updated_at, 0) * :rate) FROM login_buckets WHERE key = :key"
+
+
+class _Throttled(Exception):
+    """Raised inside the throttle transaction to roll back tokens already taken."""
+
+    def __init__(self, retry_after):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
+def _limits(scope):
+    """
+    Bucket size and refill rate for 'email' or 'host'.
+
+    Returns:
+        tuple: (capacity, tokens per second)
+    """
+    if scope == 'email':
+        burst = Config.get_int("LOGIN_EMAIL_BURST", DEFAULT_EMAIL_BURST)
+        per_minute = Config.get_float("LOGIN_EMAIL_PER_MINUTE", DEFAULT_EMAIL_PER_MINUTE)
+    else:
+        burst = Config.get_int("LOGIN_HOST_BURST", DEFAULT_HOST_BURST)
+        per_minute = Config.get_float("LOGIN_HOST_PER_MINUTE", DEFAULT_HOST_PER_MINUTE)
+    return max(burst, 1), max(per_minute, 0.0) / 60
+
+
+def _take(connection, key, capacity, rate, now):
+    """Take a token from one bucket, raising _Throttled if it is empty."""
+    params = {'key': key, 'capacity': capacity, 'rate': rate, 'now': now}
+    if connection.execute(_TAKE_SQL, params).fetchall():
+        return
+    available = connection.execute(_PEEK_SQL, params).fetchone()[0]
+    raise _Throttled(math.inf if rate <= 0 else (1 - available) / rate)
+
+
+def check_login_attempt(email, host=None, now=None):
+    """
+    Spend one login attempt from the email's and the host's token buckets.
+
+    Call this before verifying a password: a rejected attempt costs one small
+    SQLite transaction instead of a bcrypt verify. Buckets live in the
+    login_buckets table, so every process on the machine shares them.
+    Both buckets must have a token; otherwise neither is charged.
+
+    Args:
+        email (str): Email being logged into
+        host (str, optional): Where the attempt comes from, defaults to this machine's hostname
+        now (float, optional): Current UNIX time, for tests and benchmarks
+
+    Returns:
+        tuple: (allowed, message)
+            allowed (bool): True if the attempt may go ahead
+            message (str): Why it was rejected, with the time to wait
+    """
+    now = time.time() if now is None else now
+    host = host or socket.gethostname()
+
+    try:
+        with Database.transaction() as connection:
+            _take(connection, f"email:{email.strip().lower()}", *_limits('email'), now)
+            _take(connection, f"host:{host}", *_limits('host'), now)
+    except _Throttled as e:
+        wait = "later" if math.isinf(e.retry_after) else f"in {math.ceil(e.retry_after)} seconds"
+        return False, f"Too many login attempts, try again {wait}"
+    return True, ""
+
+
+def prune_idle_buckets(max_idle_seconds=86_400, now=None):
+    """
+    Delete buckets that have not been touched for `max_idle_seconds`.
+
+    Idle buckets are full again, so dropping them changes nothing but table size.
+
+    Returns:
+        int: Number of buckets deleted
+    """
+    now = time.time() if now is None else now
+    with Database.execute(
+        "DELETE FROM login_buckets WHERE updated_at < ?", (now - max_idle_seconds,)
+    ) as cursor:
+        return cursor.rowcount
@@ -0,0 +1,209 @@
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from db.connection import Database
+from models.user import ValidationError, validate_name, validate_email, validate_password
+from services.bulk_import import iter_records, BulkImportError, IMPORT_SUFFIXES
+from utils.password import PasswordHandler
+
+
+# Passwords sent to a worker process per task
+DEFAULT_HASH_CHUNK = 16
+
+# Hashed accounts written per transaction
+DEFAULT_BATCH_SIZE = 1_000
+
+
+def _hash_chunk(passwords, rounds):
+    """
+    Hash a chunk of passwords in a worker process.
+
+    Returns:
+        tuple: (hashes, seconds spent hashing)
+    """
+    start = time.perf_counter()
+    hashes = [PasswordHandler.hash_password(password, rounds=rounds) for password in passwords]
+    return hashes, time.perf_counter() - start
+
+
+def _parse(record, seen):
+    """
+    Validate one provisioning record (name, email, plaintext password).
+
+    Returns:
+        tuple: ((name, email, password), error)
+    """
+    if not isinstance(record, dict):
+        return None, "malformed record"
+    try:
+        name = validate_name(record.get('name') or '')
+        email = validate_email((record.get('email') or '').strip())
+        password = validate_password(record.get('password') or '')
+    except ValidationError as e:
+        return None, str(e)
+
+    if email in seen:
+        return None, "duplicate email in file"
+    seen.add(email)
+    return (name, email, password), None
+
+
+def _existing_emails(connection, emails):
+    """Return the subset of `emails` that already belong to an account."""
+    existing = set()
+    # Stay well below SQLite's bound-parameter limit
+    for start in range(0, len(emails), 500):
+        chunk = emails[start:start + 500]
+        placeholders = ', '.join('?' * len(chunk))
+        existing.update(
+            email.lower() for (email,) in connection.execute(
+                f"SELECT email FROM users WHERE email IN ({placeholders}) AND deleted_at IS NULL", chunk
+            )
+        )
+    return existing
+
+
+def _report_safe(record):
+    """Copy of a rejected record without its plaintext password."""
+    if not isinstance(record, dict):
+        return record
+    return {key: value for key, value in record.items() if key != 'password'}
+
+
+def provision_users(path, workers=None, batch_size=DEFAULT_BATCH_SIZE, hash_chunk=DEFAULT_HASH_CHUNK,
+                    rounds=None, rejects_path=None, progress=None):
+    """
+    Create accounts from a CSV (or JSONL) file of name, email and plaintext password.
+
+    The work is pipelined over three stages: records are parsed and validated
+    in this process, passwords are hashed in chunks on a ProcessPoolExecutor
+    (bcrypt is CPU-bound, so this scales with cores), and hashed accounts are
+    inserted `batch_size` at a time, one transaction per batch.
+    Emails that are invalid, repeated in the file or already registered are
+    rejected before any hashing is spent on them.
+
+    Args:
+        path (str|Path): Input file (.csv or .jsonl)
+        workers (int, optional): Hashing processes, defaults to the number of cores
+        batch_size (int): Accounts inserted per transaction
+        hash_chunk (int): Passwords hashed per worker task
+        rounds (int, optional): bcrypt cost, defaults to the configured one
+        rejects_path (str|Path, optional): Where to write rejected records as JSONL
+            (plaintext passwords are left out)
+        progress (callable, optional): Called with the stats dict after every inserted batch
+
+    Returns:
+        dict: Job statistics (read, provisioned, rejected, seconds, rows_per_second)
+            and per-stage 'stages' with rows, seconds and rows_per_second each
+    """
+    path = Path(path)
+    if path.suffix.lower() not in IMPORT_SUFFIXES:
+        raise BulkImportError(f"Unsupported provisioning format '{path.suffix}', expected .csv or .jsonl")
+
+    workers = workers or os.cpu_count() or 1
+    rounds = rounds or PasswordHandler.rounds()
+    stats = {
+        'read': 0, 'provisioned': 0, 'rejected': 0, 'workers': workers, 'rounds': rounds,
+        'seconds': 0.0, 'rows_per_second': 0.0,
+        'stages': {stage: {'rows': 0, 'seconds': 0.0, 'rows_per_second': 0.0}
+                   for stage in ('parse', 'hash', 'insert')},
+    }
+    stages = stats['stages']
+    seen = set()
+    pending = deque()  # (accounts, future) in submission order
+    ready = []         # hashed (name, email, password_hash) rows waiting for insert
+    rejects_file = open(rejects_path, 'w', encoding='utf-8') if rejects_path else None
+    start = time.perf_counter()
+
+    def reject(record, error):
+        stats['rejected'] += 1
+        if rejects_file:
+            rejects_file.write(json.dumps({'error': error, 'record': _report_safe(record)}, default=str) + '\n')
+
+    def insert_ready():
+        if not ready:
+            return
+        begin = time.perf_counter()
+        with Database.transaction() as connection:
+            for (name, email, password_hash) in ready:
+                # Registered concurrently since the pre-check: the unique index rejects it
+                row = connection.execute(
+                    "INSERT INTO users (name, email, password) VALUES (?, ?, ?) "
+                    "ON CONFLICT DO NOTHING RETURNING id",
+                    (name, email, password_hash)
+                ).fetchone()
+                if row is None:
+                    reject({'name': name, 'email': email}, "email already registered")
+                else:
+                    stats['provisioned'] += 1
+        stages['insert']['rows'] += len(ready)
+        stages['insert']['seconds'] += time.perf_counter() - begin
+        ready.clear()
+
+        stats['seconds'] = time.perf_counter() - start
+        stats['rows_per_second'] = stats['provisioned'] / stats['seconds'] if stats['seconds'] else 0.0
+        if progress:
+            progress(stats)
+
+    def collect(accounts, future):
+        hashes, seconds = future.result()
+        stages['hash']['rows'] += len(hashes)
+        stages['hash']['seconds'] += seconds
+        ready.extend((name, email, password_hash) for (name, email, _), password_hash in zip(accounts, hashes))
+        if len(ready) >= batch_size:
+            insert_ready()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor, Database.readonly() as reader:
+            records = iter_records(path)
+            while True:
+                begin = time.perf_counter()
+                batch = list(islice(records, hash_chunk))
+                if not batch:
+                    break
+                stats['read'] += len(batch)
+
+                accounts = []
+                for record in batch:
+                    account, error = _parse(record, seen)
+                    if error:
+                        reject(record, error)
+                    else:
+                        accounts.append((account, record))
+
+                # Don't spend bcrypt on emails that are already taken
+                taken = _existing_emails(reader, [account[1] for account, _ in accounts])
+                for account, record in accounts:
+                    if account[1] in taken:
+                        reject(record, "email already registered")
+                accounts = [account for account, _ in accounts if account[1] not in taken]
+                stages['parse']['rows'] += len(batch)
+                stages['parse']['seconds'] += time.perf_counter() - begin
+
+                if accounts:
+                    future = executor.submit(_hash_chunk, [account[2] for account in accounts], rounds)
+                    pending.append((accounts, future))
+
+                # Keep every worker busy without reading the whole file ahead
+                while len(pending) > workers * 2:
+                    collect(*pending.popleft())
+
+            while pending:
+                collect(*pending.popleft())
+        insert_ready()
+    finally:
+        if rejects_file:
+            rejects_file.close()
+
+    stats['seconds'] = time.perf_counter() - start
+    stats['rows_per_second'] = stats['provisioned'] / stats['seconds'] if stats['seconds'] else 0.0
+    for name, stage in stages.items():
+        # Hash time is summed over workers, so divide by them for wall-clock throughput
+        seconds = stage['seconds'] / workers if name == 'hash' else stage['seconds']
+        stage['rows_per_second'] = stage['rows'] / seconds if seconds else 0.0
+    return stats
@@ -0,0 +1,139 @@
+import os
+import secrets
+import time
+import uuid
+from pathlib import Path
+
+import jwt
+
+from repositories.login_session import LoginSessionRepository
+from utils.config import Config
+
+
+# Overridable with SESSION_TTL_DAYS / REMEMBER_ME_FILE
+DEFAULT_TTL_DAYS = 30
+DEFAULT_TOKEN_FILE = Path.home() / ".cli-game-collection" / "remember_me.jwt"
+
+TOKEN_ALGORITHM = "HS256"
+
+
+def _secret():
+    """Signing key for session tokens; generated and saved to .env on first use."""
+    secret = Config.get("SESSION_SECRET")
+    if not secret:
+        secret = secrets.token_urlsafe(32)
+        Config.set("SESSION_SECRET", secret)
+    return secret
+
+
+def token_path():
+    """File holding this OS user's remembered token."""
+    return Path(Config.get("REMEMBER_ME_FILE") or DEFAULT_TOKEN_FILE).expanduser()
+
+
+def _read_token():
+    try:
+        return token_path().read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def _delete_token():
+    try:
+        token_path().unlink()
+    except FileNotFoundError:
+        pass
+
+
+def remember_user(user):
+    """
+    Issue a signed, expiring token for `user` and store it for the next launch.
+
+    The token file is only readable by the current OS user.
+
+    Args:
+        user (User): The logged-in user
+
+    Returns:
+        Path: Where the token was written
+    """
+    now = time.time()
+    expires_at = now + Config.get_float("SESSION_TTL_DAYS", DEFAULT_TTL_DAYS) * 86_400
+    session_id = uuid.uuid4().hex
+    LoginSessionRepository.create(session_id, user.id, expires_at)
+
+    token = jwt.encode(
+        {'sub': str(user.id), 'jti': session_id, 'iat': int(now), 'exp': int(expires_at)},
+        _secret(),
+        algorithm=TOKEN_ALGORITHM
+    )
+
+    path = token_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Create with owner-only permissions before anything is written
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(token)
+    return path
+
+
+def restore_remembered_user():
+    """
+    Log back in from the stored token, without a password prompt.
+
+    The signature and expiry are checked locally, then one query confirms the
+    session was not revoked and loads the user. Invalid tokens are deleted.
+
+    Returns:
+        User: The remembered user, or None if there is no valid token
+    """
+    token = _read_token()
+    if not token:
+        return None
+
+    try:
+        claims = jwt.decode(token, _secret(), algorithms=[TOKEN_ALGORITHM], options={'require': ['exp', 'jti', 'sub']})
+        user = LoginSessionRepository.find_active_user(claims['jti'], int(claims['sub']), time.time())
+    except (jwt.InvalidTokenError, ValueError):
+        user = None
+
+    if user is None:
+        _delete_token()
+    return user
+
+
+def forget_remembered_user():
+    """
+    Revoke the stored token (on logout) and delete the file.
+
+    Returns:
+        bool: True if a token was revoked
+    """
+    token = _read_token()
+    _delete_token()
+    if not token:
+        return False
+
+    try:
+        claims = jwt.decode(token, _secret(), algorithms=[TOKEN_ALGORITHM], options={'verify_exp': False})
+    except jwt.InvalidTokenError:
+        return False
+    return LoginSessionRepository.revoke(claims.get('jti'))
+
+
+def revoke_other_devices(user):
+    """
+    Revoke every "remember me" session of `user`, e.g. after a password change,
+    keeping this device remembered with a fresh token if it was.
+
+    Args:
+        user (User): The logged-in user
+
+    Returns:
+        int: Number of sessions revoked
+    """
+    remembered = restore_remembered_user()
+    revoked = LoginSessionRepository.revoke_all(user.id)
+    if remembered is not None and remembered.id == user.id:
+        remember_user(user)
+    return revoked
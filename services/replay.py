@@ -0,0 +1,161 @@
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from games.game_io import ReplayInput, NullOutput
+from games.registry import GameRegistry
+from repositories.game_session import GameSessionRepository
+
+
+# Sessions sent to a worker process per task
+DEFAULT_BATCH_SIZE = 5_000
+
+# Mismatching sessions listed in the audit report
+MAX_REPORTED_MISMATCHES = 100
+
+_AUDIT_COLUMNS = ('id', 'game_id', 'difficulty_level', 'seed', 'score', 'session_data')
+
+# One game instance per game ID and process, reused for every replay
+_games = {}
+
+
+def replay(game_id, difficulty, seed, inputs):
+    """
+    Re-run a recorded session headless, as fast as the game allows.
+
+    The game is seeded with the session's seed and fed its recorded inputs
+    (BaseGame.inputs); nothing is rendered or stored.
+
+    Args:
+        game_id (str): Game that was played
+        difficulty (str): Difficulty it was played at
+        seed (int): The session's seed
+        inputs (list): The session's recorded inputs
+
+    Returns:
+        tuple: (final score, number of recorded inputs the replay did not consume)
+
+    Raises:
+        KeyError: If the game is not installed
+    """
+    game = _games.get(game_id)
+    if game is None:
+        descriptor = GameRegistry.default().get(game_id)
+        if descriptor is None:
+            raise KeyError(game_id)
+        game = _games[game_id] = descriptor.create()
+
+    replay_input = ReplayInput(inputs)
+    game.set_io(replay_input, NullOutput())
+    game.difficulty = difficulty
+    game.realtime = False  # Tick-driven games run on a virtual clock
+    game.start(None, seed=seed)
+    return game.score, replay_input.remaining
+
+
+def _audit_batch(rows):
+    """
+    Replay a batch of session rows in a worker process.
+
+    Returns:
+        dict: Counts (replayed, matched, skipped), mismatches as
+            (session id, stored score, replayed score, inputs left) and seconds spent
+    """
+    start = time.perf_counter()
+    result = {'replayed': 0, 'matched': 0, 'skipped': 0, 'mismatches': []}
+    for session_id, game_id, difficulty, seed, score, session_data in rows:
+        try:
+            inputs = json.loads(session_data or '{}').get('inputs') if seed is not None else None
+        except (ValueError, AttributeError):
+            inputs = None
+        if inputs is None or score is None:
+            # Played before seeds were recorded, or never finished
+            result['skipped'] += 1
+            continue
+
+        try:
+            replayed, left = replay(game_id, difficulty, seed, inputs)
+        except KeyError:
+            result['skipped'] += 1  # Game no longer installed
+            continue
+
+        result['replayed'] += 1
+        if replayed == score and not left:
+            result['matched'] += 1
+        else:
+            result['mismatches'].append((session_id, score, replayed, left))
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def audit_scores(game_id=None, since=None, until=None, workers=None, batch_size=DEFAULT_BATCH_SIZE,
+                 progress=None):
+    """
+    Replay stored sessions and check that they reproduce their stored score.
+
+    Run it after a scoring change to find the sessions whose score would
+    differ. Sessions are streamed from a read-only connection in batches and
+    replayed on a ProcessPoolExecutor. Sessions without a seed or recorded
+    inputs (played before they were recorded) and unfinished ones are skipped.
+    A replay also counts as a mismatch when it doesn't consume every recorded
+    input, since the game then took a different path.
+
+    Args:
+        game_id (str, optional): Only audit sessions of this game
+        since (datetime, optional): Only sessions started at or after this time
+        until (datetime, optional): Only sessions started before this time
+        workers (int, optional): Replay processes, defaults to the number of cores
+        batch_size (int): Sessions per worker task
+        progress (callable, optional): Called with the stats dict after every batch
+
+    Returns:
+        dict: Audit statistics (sessions, replayed, matched, mismatched, skipped,
+            seconds, sessions_per_second, sessions_per_second_per_core) and up to
+            MAX_REPORTED_MISMATCHES 'mismatches' with id, stored_score,
+            replayed_score and inputs_left
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = {
+        'sessions': 0, 'replayed': 0, 'matched': 0, 'mismatched': 0, 'skipped': 0,
+        'mismatches': [], 'workers': workers, 'cpu_seconds': 0.0,
+        'seconds': 0.0, 'sessions_per_second': 0.0, 'sessions_per_second_per_core': 0.0,
+    }
+    pending = deque()
+    start = time.perf_counter()
+
+    def collect(future):
+        result = future.result()
+        for key in ('replayed', 'matched', 'skipped'):
+            stats[key] += result[key]
+        stats['mismatched'] += len(result['mismatches'])
+        room = MAX_REPORTED_MISMATCHES - len(stats['mismatches'])
+        stats['mismatches'].extend(
+            {'id': session_id, 'stored_score': stored, 'replayed_score': replayed, 'inputs_left': left}
+            for session_id, stored, replayed, left in result['mismatches'][:max(room, 0)]
+        )
+        stats['cpu_seconds'] += result['seconds']
+        stats['seconds'] = time.perf_counter() - start
+        stats['sessions_per_second'] = stats['replayed'] / stats['seconds'] if stats['seconds'] else 0.0
+        if progress:
+            progress(stats)
+
+    batches = GameSessionRepository().iter_batches(
+        columns=_AUDIT_COLUMNS, batch_size=batch_size, game_id=game_id, since=since, until=until
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for rows in batches:
+            stats['sessions'] += len(rows)
+            pending.append(executor.submit(_audit_batch, rows))
+            # Keep every worker busy without reading the whole table ahead
+            while len(pending) > workers * 2:
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+
+    stats['seconds'] = time.perf_counter() - start
+    stats['sessions_per_second'] = stats['replayed'] / stats['seconds'] if stats['seconds'] else 0.0
+    stats['sessions_per_second_per_core'] = \
+        stats['replayed'] / stats['cpu_seconds'] if stats['cpu_seconds'] else 0.0
+    return stats
@@ -0,0 +1,197 @@
+import time
+from datetime import datetime, timedelta
+
+from db.connection import Database
+from utils.config import Config
+
+
+# Raw sessions deleted per transaction, keeps write locks short
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Days a deleted account can still be restored, overridable with ACCOUNT_PURGE_DAYS
+DEFAULT_PURGE_DAYS = 30
+
+# Latest start_time of the next chunk of expired sessions, walking
+# idx_game_sessions_start_time so each chunk is an index range scan
+_CHUNK_BOUND_SQL = """
+SELECT MAX(start_time) FROM (
+    SELECT start_time FROM game_sessions WHERE start_time < ? ORDER BY start_time LIMIT ?
+)
+"""
+
+_ROLLUP_DAILY_SQL = """
+INSERT INTO game_session_daily (
+    day, game_id, difficulty_level, sessions, completed, scored,
+    score_sum, score_sq_sum, score_min, score_max, timed, total_duration
+)
+SELECT
+    substr(start_time, 1, 10), game_id, COALESCE(difficulty_level, ''),
+    COUNT(*), SUM(completed != 0), COUNT(score),
+    COALESCE(SUM(score), 0), COALESCE(SUM(score * score * 1.0), 0), MIN(score), MAX(score),
+    COUNT(duration), COALESCE(SUM(duration), 0)
+FROM game_sessions
+WHERE start_time <= ?
+GROUP BY 1, 2, 3
+ON CONFLICT (day, game_id, difficulty_level) DO UPDATE SET
+    sessions = sessions + excluded.sessions,
+    completed = completed + excluded.completed,
+    scored = scored + excluded.scored,
+    score_sum = score_sum + excluded.score_sum,
+    score_sq_sum = score_sq_sum + excluded.score_sq_sum,
+    score_min = COALESCE(MIN(score_min, excluded.score_min), score_min, excluded.score_min),
+    score_max = COALESCE(MAX(score_max, excluded.score_max), score_max, excluded.score_max),
+    timed = timed + excluded.timed,
+    total_duration = total_duration + excluded.total_duration
+"""
+
+_ROLLUP_BEST_SQL = """
+INSERT INTO game_user_best (game_id, difficulty_level, user_id, best_score)
+SELECT game_id, COALESCE(difficulty_level, ''), user_id, MAX(score)
+FROM game_sessions
+WHERE start_time <= ? AND score IS NOT NULL
+GROUP BY 1, 2, 3
+ON CONFLICT (game_id, difficulty_level, user_id) DO UPDATE SET
+    best_score = MAX(best_score, excluded.best_score)
+"""
+
+_DELETE_SQL = "DELETE FROM game_sessions WHERE start_time <= ?"
+
+# deleted_at is stored by CURRENT_TIMESTAMP (UTC), so the cutoff is computed by SQLite too
+_PURGE_CUTOFF_SQL = "SELECT datetime('now', ?)"
+
+# Next chunk of sessions of purgeable accounts, found through idx_users_deleted_at
+_PURGE_SESSIONS_SQL = """
+DELETE FROM game_sessions WHERE id IN (
+    SELECT gs.id FROM users u JOIN game_sessions gs ON gs.user_id = u.id
+    WHERE u.deleted_at < ?
+    LIMIT ?
+)
+"""
+
+# Purgeable accounts whose game sessions are all gone; an account is never
+# removed while sessions still point at it
+_PURGEABLE_USERS = (
+    "SELECT id FROM users WHERE deleted_at < :cutoff "
+    "AND NOT EXISTS (SELECT 1 FROM game_sessions WHERE user_id = users.id)"
+)
+
+# Remaining rows of purgeable accounts, the users table last
+_PURGE_USERS_SQL = (
+    f"DELETE FROM game_user_best WHERE user_id IN ({_PURGEABLE_USERS})",
+    f"DELETE FROM sessions WHERE user_id IN ({_PURGEABLE_USERS})",
+    f"DELETE FROM users WHERE id IN ({_PURGEABLE_USERS})",
+)
+
+
+def retention_cutoff(older_than_days, now=None):
+    """
+    Start of the first day that is kept raw.
+
+    Sessions are rolled up by whole days, so the cutoff is aligned to midnight.
+
+    Args:
+        older_than_days (int): Number of days of raw sessions to keep
+        now (datetime, optional): Reference time, defaults to now
+
+    Returns:
+        datetime: Sessions started before this moment are rolled up
+    """
+    now = now or datetime.now()
+    day = (now - timedelta(days=older_than_days)).date()
+    return datetime(day.year, day.month, day.day)
+
+
+def rollup_old_sessions(older_than_days, chunk_size=DEFAULT_CHUNK_SIZE, vacuum=True, progress=None):
+    """
+    Roll game sessions older than `older_than_days` up into daily aggregates
+    and delete the raw rows.
+
+    Each chunk of up to `chunk_size` sessions is aggregated into
+    game_session_daily (per day, game and difficulty), folded into the per-player
+    best scores of game_user_best, and deleted, all in one transaction. When
+    done, freed pages are returned to the file system with incremental_vacuum.
+
+    Args:
+        older_than_days (int): Number of days of raw sessions to keep
+        chunk_size (int): Sessions rolled up and deleted per transaction
+        vacuum (bool): Run PRAGMA incremental_vacuum afterwards
+        progress (callable, optional): Called with the stats dict after every chunk
+
+    Returns:
+        dict: Job statistics (cutoff, rolled_up, chunks, pages_freed, seconds)
+    """
+    if older_than_days < 0:
+        raise ValueError("older_than_days must not be negative")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    cutoff = retention_cutoff(older_than_days).isoformat()
+    stats = {'cutoff': cutoff, 'rolled_up': 0, 'chunks': 0, 'pages_freed': 0, 'seconds': 0.0}
+    start = time.perf_counter()
+
+    while True:
+        with Database.transaction() as connection:
+            bound = connection.execute(_CHUNK_BOUND_SQL, (cutoff, chunk_size)).fetchone()[0]
+            if bound is None:
+                break
+            connection.execute(_ROLLUP_DAILY_SQL, (bound,))
+            connection.execute(_ROLLUP_BEST_SQL, (bound,))
+            deleted = connection.execute(_DELETE_SQL, (bound,)).rowcount
+
+        stats['rolled_up'] += deleted
+        stats['chunks'] += 1
+        if progress:
+            progress(stats)
+
+    if vacuum:
+        stats['pages_freed'] = Database.incremental_vacuum()
+
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
+
+def purge_deleted_users(older_than_days=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """
+    Permanently remove accounts soft-deleted more than `older_than_days` ago.
+
+    Their game sessions are deleted first, `chunk_size` per transaction so
+    players are never blocked for long; then best scores, login sessions and
+    the user rows themselves go in one final transaction.
+
+    Args:
+        older_than_days (float, optional): Restore window, defaults to ACCOUNT_PURGE_DAYS (30)
+        chunk_size (int): Game sessions deleted per transaction
+        progress (callable, optional): Called with the stats dict after every chunk
+
+    Returns:
+        dict: Job statistics (cutoff, sessions_deleted, users_purged, chunks, seconds)
+    """
+    if older_than_days is None:
+        older_than_days = Config.get_float("ACCOUNT_PURGE_DAYS", DEFAULT_PURGE_DAYS)
+    if older_than_days < 0:
+        raise ValueError("older_than_days must not be negative")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    with Database.execute(_PURGE_CUTOFF_SQL, (f"-{older_than_days} days",)) as cursor:
+        cutoff = cursor.fetchone()[0]
+    stats = {'cutoff': cutoff, 'sessions_deleted': 0, 'users_purged': 0, 'chunks': 0, 'seconds': 0.0}
+    start = time.perf_counter()
+
+    while True:
+        with Database.transaction() as connection:
+            deleted = connection.execute(_PURGE_SESSIONS_SQL, (cutoff, chunk_size)).rowcount
+        if not deleted:
+            break
+        stats['sessions_deleted'] += deleted
+        stats['chunks'] += 1
+        if progress:
+            progress(stats)
+
+    with Database.transaction() as connection:
+        for statement in _PURGE_USERS_SQL:
+            deleted = connection.execute(statement, {'cutoff': cutoff}).rowcount
+        stats['users_purged'] = deleted
+
+    stats['seconds'] = time.perf_counter() - start
+    return stats
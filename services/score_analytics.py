@@ -0,0 +1,225 @@
+import math
+import numpy as np
+
+from repositories.game_session import GameSessionRepository
+
+
+# Percentiles reported for every game/difficulty group
+PERCENTILES = (25, 50, 75, 90, 99)
+
+# Upper bounds (seconds) of the duration histogram buckets; the last bucket is open-ended
+DURATION_BUCKETS = (10, 30, 60, 120, 300, 600)
+
+# Score ranges up to this many distinct values get one bin per score (exact percentiles);
+# wider ranges are folded into APPROX_SCORE_BINS equal-width bins
+MAX_EXACT_SCORE_BINS = 65_536
+APPROX_SCORE_BINS = 4_096
+
+# Rows pulled from SQLite per chunk, which bounds memory regardless of table size
+DEFAULT_CHUNK_SIZE = 100_000
+
+_STREAM_COLUMNS = ('game_id', 'difficulty_level', 'score', 'duration', 'completed')
+
+
+def duration_bucket_labels():
+    """
+    Human readable labels for the duration histogram buckets
+
+    Returns:
+        list: One label per bucket, matching the histogram order
+    """
+    labels = []
+    lower = 0
+    for upper in DURATION_BUCKETS:
+        labels.append(f"{lower}-{upper}s")
+        lower = upper
+    labels.append(f"{lower}s+")
+    return labels
+
+
+def _score_binning(min_score, max_score):
+    """Pick (lowest score, bin width, number of bins) for one group's score range."""
+    if min_score is None:
+        return 0.0, 1.0, 1
+    span = int(max_score) - int(min_score) + 1
+    if span <= MAX_EXACT_SCORE_BINS:
+        return float(min_score), 1.0, span
+    return float(min_score), span / APPROX_SCORE_BINS, APPROX_SCORE_BINS
+
+
+def _percentiles_from_histogram(histogram, low, width):
+    """Nearest-rank percentiles read off a cumulative score histogram."""
+    total = int(histogram.sum())
+    if total == 0:
+        return {p: None for p in PERCENTILES}
+    cumulative = np.cumsum(histogram)
+    result = {}
+    for p in PERCENTILES:
+        rank = max(1, math.ceil(p / 100 * total))
+        index = int(np.searchsorted(cumulative, rank, side="left"))
+        value = low + index * width
+        result[p] = int(value) if width == 1 else round(float(value), 1)
+    return result
+
+
+def _merge_extreme(func, a, b):
+    """Combine two optional minimums/maximums."""
+    values = [v for v in (a, b) if v is not None]
+    return func(values) if values else None
+
+
+def compute_score_analytics(since=None, until=None, game_id=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compute score distributions, completion rates and duration histograms
+    per game and difficulty level.
+
+    Sessions are streamed from a read-only connection in chunks of `chunk_size`
+    rows; every chunk is folded into fixed-size NumPy accumulators, so memory
+    stays bounded no matter how many sessions match. Daily rollups left by the
+    retention job are merged into the counts, means and extremes.
+
+    Args:
+        since (datetime, optional): Only sessions started at or after this time
+        until (datetime, optional): Only sessions started before this time
+        game_id (str, optional): Restrict the report to one game
+        chunk_size (int): Rows pulled from the database per chunk
+
+    Returns:
+        list: One dict per (game_id, difficulty) group, sorted by game then difficulty
+    """
+    repository = GameSessionRepository()
+    filters = {'since': since, 'until': until, 'game_id': game_id}
+
+    # Pre-pass in SQL: discover groups and their score ranges to size the histograms
+    groups = repository.summarize_groups(**filters)
+    rollups = {(row[0], row[1]): row[2:] for row in repository.summarize_rollups(**filters)}
+    if not groups and not rollups:
+        return []
+
+    group_index = {(row[0], row[1]): code for code, row in enumerate(groups)}
+    n_groups = len(groups)
+
+    binning = [_score_binning(row[3], row[4]) for row in groups]
+    score_low = np.array([b[0] for b in binning], dtype=np.float64)
+    score_width = np.array([b[1] for b in binning], dtype=np.float64)
+    score_bins = np.array([b[2] for b in binning], dtype=np.int64)
+    score_offset = np.concatenate(([0], np.cumsum(score_bins)[:-1])).astype(np.int64)
+
+    duration_edges = np.array(DURATION_BUCKETS, dtype=np.float64)
+    n_duration_bins = len(DURATION_BUCKETS) + 1
+
+    # Accumulators, all fixed-size
+    sessions = np.zeros(n_groups, dtype=np.int64)
+    completed = np.zeros(n_groups, dtype=np.int64)
+    scored = np.zeros(n_groups, dtype=np.int64)
+    score_sum = np.zeros(n_groups)
+    score_sq_sum = np.zeros(n_groups)
+    duration_sum = np.zeros(n_groups)
+    timed = np.zeros(n_groups, dtype=np.int64)
+    score_hist = np.zeros(int(score_bins.sum()), dtype=np.int64)
+    duration_hist = np.zeros(n_groups * n_duration_bins, dtype=np.int64)
+
+    for rows in repository.iter_batches(_STREAM_COLUMNS, batch_size=chunk_size, **filters):
+        game_ids, difficulties, scores, durations, completions = zip(*rows)
+
+        codes = np.fromiter(
+            (group_index.get(key, -1) for key in zip(game_ids, difficulties)),
+            dtype=np.intp, count=len(rows)
+        )
+        scores = np.array(scores, dtype=np.float64)  # NULL -> nan
+        durations = np.array(durations, dtype=np.float64)
+        completions = np.array(completions, dtype=np.float64)
+
+        # Drop groups that appeared after the pre-pass (sessions written mid-scan)
+        known = codes >= 0
+        if not known.all():
+            codes, scores, durations, completions = (
+                codes[known], scores[known], durations[known], completions[known]
+            )
+
+        sessions += np.bincount(codes, minlength=n_groups)
+        completed += np.bincount(codes, weights=np.nan_to_num(completions), minlength=n_groups).astype(np.int64)
+
+        # Score moments and histogram over sessions that recorded a score
+        has_score = ~np.isnan(scores)
+        score_codes = codes[has_score]
+        score_values = scores[has_score]
+        scored += np.bincount(score_codes, minlength=n_groups)
+        score_sum += np.bincount(score_codes, weights=score_values, minlength=n_groups)
+        score_sq_sum += np.bincount(score_codes, weights=score_values * score_values, minlength=n_groups)
+
+        bins = ((score_values - score_low[score_codes]) // score_width[score_codes]).astype(np.int64)
+        np.clip(bins, 0, score_bins[score_codes] - 1, out=bins)
+        score_hist += np.bincount(score_offset[score_codes] + bins, minlength=score_hist.size)
+
+        # Duration totals and histogram over sessions that finished
+        has_duration = ~np.isnan(durations)
+        duration_codes = codes[has_duration]
+        duration_values = durations[has_duration]
+        timed += np.bincount(duration_codes, minlength=n_groups)
+        duration_sum += np.bincount(duration_codes, weights=duration_values, minlength=n_groups)
+        buckets = np.searchsorted(duration_edges, duration_values, side="right")
+        duration_hist += np.bincount(
+            duration_codes * n_duration_bins + buckets,
+            minlength=duration_hist.size
+        )
+
+    results = []
+    keys = list(group_index) + [key for key in rollups if key not in group_index]
+    for key in sorted(keys, key=lambda k: (k[0], k[1] or "")):
+        code = group_index.get(key)
+        if code is not None:
+            n_sessions, n_completed, n_scored = int(sessions[code]), int(completed[code]), int(scored[code])
+            total, total_sq = float(score_sum[code]), float(score_sq_sum[code])
+            n_timed, total_duration = int(timed[code]), float(duration_sum[code])
+            min_score, max_score = groups[code][3], groups[code][4]
+            start = score_offset[code]
+            percentiles = _percentiles_from_histogram(
+                score_hist[start:start + score_bins[code]], score_low[code], score_width[code]
+            )
+            duration_histogram = duration_hist[code * n_duration_bins:(code + 1) * n_duration_bins].tolist()
+        else:
+            n_sessions = n_completed = n_scored = n_timed = 0
+            total = total_sq = total_duration = 0.0
+            min_score = max_score = None
+            percentiles = {p: None for p in PERCENTILES}
+            duration_histogram = [0] * n_duration_bins
+
+        # Fold in sessions the retention job rolled up into daily aggregates; counts,
+        # moments and extremes stay exact, percentiles and histograms cover raw sessions only
+        rolled = rollups.get(key)
+        rolled_up = 0
+        if rolled:
+            (rolled_up, r_completed, r_scored, r_sum, r_sq_sum,
+             r_min, r_max, r_timed, r_duration) = rolled
+            n_sessions += rolled_up
+            n_completed += r_completed
+            n_scored += r_scored
+            total += r_sum
+            total_sq += r_sq_sum
+            n_timed += r_timed
+            total_duration += r_duration
+            min_score = _merge_extreme(min, min_score, r_min)
+            max_score = _merge_extreme(max, max_score, r_max)
+
+        mean = total / n_scored if n_scored else None
+        std = math.sqrt(max(total_sq / n_scored - mean * mean, 0.0)) if n_scored else None
+
+        results.append({
+            'game_id': key[0],
+            'difficulty': key[1],
+            'sessions': n_sessions,
+            'rolled_up': rolled_up,
+            'completed': n_completed,
+            'completion_rate': n_completed / n_sessions if n_sessions else 0.0,
+            'scored': n_scored,
+            'score_mean': mean,
+            'score_std': std,
+            'score_min': min_score,
+            'score_max': max_score,
+            'score_percentiles': percentiles,
+            'duration_mean': total_duration / n_timed if n_timed else None,
+            'duration_histogram': duration_histogram,
+        })
+
+    return results
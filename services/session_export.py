@@ -0,0 +1,155 @@
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from db.connection import Database
+from repositories.game_session import GameSessionRepository
+
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'npy')
+
+# Rows held in memory at once; the export streams batch by batch
+DEFAULT_BATCH_SIZE = 10_000
+
+# On-disk dtypes of the columnar (npy) export. Text columns are dictionary-encoded
+# into int32 codes, timestamps are datetime64, missing numbers are NaN.
+_NPY_DTYPES = {
+    'id': np.int64,
+    'user_id': np.int64,
+    'game_id': np.int32,
+    'start_time': 'datetime64[us]',
+    'end_time': 'datetime64[us]',
+    'duration': np.float64,
+    'score': np.float64,
+    'completed': np.int8,
+    'difficulty_level': np.int32,
+}
+_NPY_CATEGORICAL = ('game_id', 'difficulty_level')
+
+
+def _write_csv(path, batches):
+    rows = 0
+    with open(path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(GameSessionRepository.COLUMNS)
+        for batch in batches:
+            writer.writerows(batch)
+            rows += len(batch)
+    return rows
+
+
+def _write_jsonl(path, batches):
+    rows = 0
+    columns = GameSessionRepository.COLUMNS
+    data_index = columns.index('session_data')
+    with open(path, 'w', encoding='utf-8') as handle:
+        for batch in batches:
+            lines = []
+            for row in batch:
+                record = dict(zip(columns, row))
+                try:
+                    record['session_data'] = json.loads(row[data_index]) if row[data_index] else {}
+                except json.JSONDecodeError:
+                    record['session_data'] = {}
+                record['completed'] = bool(record['completed'])
+                lines.append(json.dumps(record))
+            lines.append('')
+            handle.write('\n'.join(lines))
+            rows += len(batch)
+    return rows
+
+
+def _write_npy(path, batches, total):
+    """
+    Write one memory-mappable .npy file per column into the `path` directory,
+    plus a meta.json describing row count and categorical codes.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    columns = list(_NPY_DTYPES)
+    arrays = {
+        column: np.lib.format.open_memmap(path / f"{column}.npy", mode='w+', dtype=dtype, shape=(total,))
+        for column, dtype in _NPY_DTYPES.items()
+    }
+    categories = {column: {} for column in _NPY_CATEGORICAL}
+
+    rows = 0
+    for batch in batches:
+        # Never past the preallocated rows (the snapshot keeps the count exact)
+        batch = batch[:total - rows]
+        if not batch:
+            break
+        values = dict(zip(GameSessionRepository.COLUMNS, zip(*batch)))
+        end = rows + len(batch)
+
+        for column in columns:
+            if column in _NPY_CATEGORICAL:
+                codes = categories[column]
+                encoded = [codes.setdefault(value, len(codes)) for value in values[column]]
+                arrays[column][rows:end] = encoded
+            else:
+                arrays[column][rows:end] = np.array(values[column], dtype=_NPY_DTYPES[column])
+        rows = end
+
+    for array in arrays.values():
+        array.flush()
+    del arrays
+
+    meta = {
+        'rows': rows,
+        'columns': {column: str(np.dtype(dtype)) for column, dtype in _NPY_DTYPES.items()},
+        'categories': {column: list(codes) for column, codes in categories.items()},
+    }
+    (path / 'meta.json').write_text(json.dumps(meta, indent=2), encoding='utf-8')
+    return rows
+
+
+def export_sessions(output, fmt='csv', user_id=None, game_id=None, since=None, until=None,
+                    batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Stream game sessions out of the database into a file.
+
+    Rows are read through a read-only cursor with fetchmany, so at most
+    `batch_size` rows are held in memory whatever the size of the table.
+
+    Args:
+        output (str|Path): Output file (csv, jsonl) or directory (npy)
+        fmt (str): One of EXPORT_FORMATS
+        user_id (int, optional): Only sessions played by this user
+        game_id (str, optional): Only sessions of this game
+        since (datetime, optional): Only sessions started at or after this time
+        until (datetime, optional): Only sessions started before this time
+        batch_size (int): Rows fetched per batch
+
+    Returns:
+        dict: Export statistics (rows, seconds, rows_per_second, output)
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}', expected one of {', '.join(EXPORT_FORMATS)}")
+
+    output = Path(output)
+    repository = GameSessionRepository()
+    filters = {'user_id': user_id, 'game_id': game_id, 'since': since, 'until': until}
+
+    start = time.perf_counter()
+    if fmt == 'npy':
+        # Columnar files are preallocated, so the row count is needed up front; count
+        # and read in one snapshot so sessions removed meanwhile can't leave zero rows
+        with Database.snapshot() as connection:
+            total = repository.count(connection=connection, **filters)
+            batches = repository.iter_batches(batch_size=batch_size, connection=connection, **filters)
+            rows = _write_npy(output, batches, total)
+    else:
+        batches = repository.iter_batches(batch_size=batch_size, **filters)
+        writer = _write_csv if fmt == 'csv' else _write_jsonl
+        rows = writer(output, batches)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed if elapsed else 0.0,
+        'output': str(output),
+    }
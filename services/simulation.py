@@ -0,0 +1,216 @@
+import io
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+
+from db.connection import Database, MEMORY
+from db.migration import MigrationManager
+from games.bots import BOTS
+from games.game_io import NullOutput
+from games.registry import GameRegistry
+from models.game_session import GameSession
+
+
+# Games played per worker task
+DEFAULT_CHUNK_SIZE = 2_000
+
+# Account the simulated sessions of a worker belong to (in its in-memory database)
+_bot_user_id = None
+
+
+class SimulationError(Exception):
+    """Raised when a simulation cannot be set up (unknown game, strategy or difficulty)."""
+
+
+class _RecordingTracker:
+    """
+    Session tracker that keeps finished sessions in memory.
+
+    Stands in for GameSessionTracker, which writes two statements per game;
+    the sessions of a whole chunk are inserted in one transaction by flush().
+    """
+
+    def __init__(self):
+        self.finished = []
+        self._active_session = None
+
+    def start_session(self, user_id, game_id, difficulty_level="Medium", seed=None):
+        self._active_session = GameSession(user_id=user_id, game_id=game_id,
+                                           difficulty_level=difficulty_level, seed=seed)
+
+    def update_session_data(self, key, value):
+        if not self._active_session:
+            return False
+        self._active_session.session_data[key] = value
+        return True
+
+    def end_session(self, score=None, completed=True, session_data=None):
+        if not self._active_session:
+            return False
+        self._active_session.end(score, completed, session_data)
+        self.finished.append(self._active_session)
+        self._active_session = None
+        return True
+
+    def flush(self):
+        """Insert the finished sessions in one transaction."""
+        with Database.transaction() as connection:
+            connection.executemany(
+                "INSERT INTO game_sessions (user_id, game_id, start_time, end_time, duration, "
+                "score, completed, difficulty_level, session_data, seed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((session.user_id, session.game_id, session.start_time.isoformat(),
+                  session.end_time.isoformat(), session.duration, session.score,
+                  1 if session.completed else 0, session.difficulty_level,
+                  json.dumps(session.session_data), session.seed) for session in self.finished)
+            )
+        self.finished.clear()
+
+
+def _init_worker(record):
+    """Give a worker process its own migrated in-memory database, if sessions are recorded."""
+    global _bot_user_id
+    if not record:
+        return
+    # Don't reuse a connection inherited from the parent process
+    Database.close()
+    Database.initialize(MEMORY)
+    with redirect_stdout(io.StringIO()):  # Keep per-worker migration logs out of the report
+        MigrationManager.migrate()
+    with Database.transaction() as connection:
+        _bot_user_id = connection.execute(
+            "INSERT INTO users (name, email, password) VALUES (?, ?, ?) RETURNING id",
+            ("Simulation Bot", "bot@simulation.invalid", "!")
+        ).fetchone()[0]
+
+
+def _play_chunk(game_id, strategy, difficulty, games, seed, record):
+    """
+    Play `games` games with one bot in a worker process.
+
+    The chunk seed drives the bot and seeds every game, so a chunk plays the
+    same games whichever worker runs it.
+
+    Returns:
+        dict: Tallies (games, wins, scores, attempts) and the seconds spent playing
+    """
+    rng = random.Random(seed)
+
+    game = GameRegistry.default().get(game_id).create()
+    game.set_io(BOTS[strategy](rng), NullOutput())
+    game.difficulty = difficulty
+    game.realtime = False  # Tick-driven games run on a virtual clock
+    tracker = _RecordingTracker() if record else None
+
+    wins = 0
+    scores = Counter()
+    attempts = Counter()
+    start = time.perf_counter()
+    for _ in range(games):
+        game.start(_bot_user_id, tracker, seed=rng.getrandbits(63))
+        wins += game.score > 0
+        scores[game.score] += 1
+        attempts[game.attempts] += 1
+    if tracker:
+        tracker.flush()
+
+    return {
+        'games': games, 'wins': wins, 'scores': scores, 'attempts': attempts,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _percentile(counts, fraction):
+    """Value at `fraction` (0-1) of a {value: count} distribution."""
+    rank = fraction * (sum(counts.values()) - 1)
+    seen = 0
+    for value in sorted(counts):
+        seen += counts[value]
+        if seen > rank:
+            return value
+    return None
+
+
+def simulate(game_id="number_guessing", strategy="binary", games=10_000, difficulty=None, workers=None,
+             seed=0, chunk_size=DEFAULT_CHUNK_SIZE, record=False, progress=None):
+    """
+    Play a game many times with a bot and aggregate the results.
+
+    The game is loaded from the GameRegistry and driven headless by a bot
+    from games.bots. Games are split into chunks of `chunk_size` and played
+    on a ProcessPoolExecutor; every chunk has its own seed derived from
+    `seed`, so a run is reproducible regardless of the number of workers.
+    A game counts as won when it ends with a positive score.
+
+    Args:
+        game_id (str): Game to play
+        strategy (str): Bot strategy, a key of games.bots.BOTS
+        games (int): Number of games to play
+        difficulty (str, optional): Difficulty level, the game's default if omitted
+        workers (int, optional): Worker processes, defaults to the number of cores
+        seed (int): Base seed of the run
+        chunk_size (int): Games per worker task
+        record (bool): Also write every session to an in-memory database in each
+            worker, to include the cost of persisting sessions
+        progress (callable, optional): Called with the stats dict after every chunk
+
+    Returns:
+        dict: Run statistics: games, wins, win_rate, mean_score, score_p50/p90,
+            mean_attempts, 'scores' and 'attempts' distributions ({value: games}),
+            seconds, games_per_second and games_per_second_per_core
+
+    Raises:
+        SimulationError: If the game, strategy or difficulty is unknown
+    """
+    descriptor = GameRegistry.default().get(game_id)
+    if descriptor is None:
+        raise SimulationError(f"Unknown game '{game_id}'")
+    if strategy not in BOTS:
+        raise SimulationError(f"Unknown strategy '{strategy}', expected one of: {', '.join(sorted(BOTS))}")
+    difficulty = difficulty or descriptor.default_difficulty
+    if difficulty not in descriptor.difficulty_levels:
+        raise SimulationError(f"Unknown difficulty '{difficulty}' for {descriptor.name}, "
+                              f"expected one of: {', '.join(descriptor.difficulty_levels)}")
+
+    workers = workers or os.cpu_count() or 1
+    stats = {
+        'game_id': game_id, 'strategy': strategy, 'difficulty': difficulty, 'workers': workers,
+        'games': 0, 'wins': 0, 'scores': Counter(), 'attempts': Counter(), 'cpu_seconds': 0.0,
+    }
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(record,)) as executor:
+        futures = [
+            executor.submit(_play_chunk, game_id, strategy, difficulty,
+                            min(chunk_size, games - offset), f"{seed}:{index}", record)
+            for index, offset in enumerate(range(0, games, chunk_size))
+        ]
+        for future in as_completed(futures):
+            chunk = future.result()
+            stats['games'] += chunk['games']
+            stats['wins'] += chunk['wins']
+            stats['scores'].update(chunk['scores'])
+            stats['attempts'].update(chunk['attempts'])
+            stats['cpu_seconds'] += chunk['seconds']
+            if progress:
+                progress(stats)
+
+    seconds = time.perf_counter() - start
+    played = stats['games'] or 1
+    stats.update({
+        'win_rate': stats['wins'] / played,
+        'mean_score': sum(score * n for score, n in stats['scores'].items()) / played,
+        'score_p50': _percentile(stats['scores'], 0.5),
+        'score_p90': _percentile(stats['scores'], 0.9),
+        'mean_attempts': sum(count * n for count, n in stats['attempts'].items()) / played,
+        'scores': dict(sorted(stats['scores'].items())),
+        'attempts': dict(sorted(stats['attempts'].items())),
+        'seconds': seconds,
+        'games_per_second': stats['games'] / seconds if seconds else 0.0,
+        # Summed over workers: what one core sustains
+        'games_per_second_per_core': stats['games'] / stats['cpu_seconds'] if stats['cpu_seconds'] else 0.0,
+    })
+    return stats
@@ -3,12 +3,32 @@ from rich.console import Console
 from rich.panel import Panel
 from prompt_toolkit import prompt
 
-from models.user import User, ValidationError
-from repositories.user import UserRepository
+from models.user import User, ValidationError, validate_name, validate_email, validate_password
+from repositories.user import UserRepository, WriteStatus
+from repositories.login_session import LoginSessionRepository
+from services.login_throttle import check_login_attempt
+from services.remember_me import remember_user, forget_remembered_user, revoke_other_devices
 from utils.password import PasswordHandler
 from utils.session import Session
 
 
+def _await_password_task(future, message):
+    """
+    Wait for a background password hash or check, with a spinner while it runs
+
+    Args:
+        future (Future): Task returned by PasswordHandler.*_future
+        message (str): Spinner text
+
+    Returns:
+        The task's result
+    """
+    if future.done():
+        return future.result()
+    with Console().status(f"[cyan]{message}[/cyan]"):
+        return future.result()
+
+
 def register_user():
     """Register a new user with interactive validation using the repository pattern."""
     print("\n=== User Registration ===")
@@ -18,17 +38,14 @@ def register_user():
         try:
             # Name validation - keep asking until valid
             try:
-                name = input("Enter your name: ")
-                user = User("temp", "temp@example.com", "Password123!")
-                user.name = name  # This will validate
+                name = validate_name(input("Enter your name: "))
             except ValidationError as e:
                 print(f"Invalid name: {str(e)}")
                 continue
 
             # Email validation - keep asking until valid
             try:
-                email = input("Enter your email: ")
-                user.email = email  # This will validate
+                email = validate_email(input("Enter your email: "))
 
                 # Check if email already exists
                 if UserRepository.email_exists(email):
@@ -39,30 +56,39 @@ def register_user():
                 continue
 
             # Password validation with masking - keep asking until valid
-            valid_password = False
-            while not valid_password:
+            hashed_password = None
+            while hashed_password is None:
                 try:
-                    password = getpass.getpass("Enter your password: ")
-                    password_confirm = getpass.getpass("Confirm your password: ")
-
-                    if password != password_confirm:
-                        print("Error: Passwords don't match.")
-                        continue
-
-                    user.password = password
-                    valid_password = True
+                    password = validate_password(getpass.getpass("Enter your password: "))
                 except ValidationError as e:
                     print(f"Invalid password: {str(e)}")
+                    continue
+
+                # Start hashing right away so it runs while the confirmation is typed
+                hash_future = PasswordHandler.hash_password_future(password)
+                password_confirm = getpass.getpass("Confirm your password: ")
+
+                if password != password_confirm:
+                    hash_future.cancel()
+                    print("Error: Passwords don't match.")
+                    continue
+
+                hashed_password = _await_password_task(hash_future, "Securing your password...")
 
-            # If we get here, all validation passed - create the user
-            user = User(name=name, email=email, password=password)
+            # If we get here, all validation passed - create the user with the precomputed hash
+            user = User(name=name, email=email, password=hashed_password, password_is_hashed=True)
 
             # Save user via repository
-            if UserRepository.save(user):
+            result = UserRepository.save(user)
+            if result.success:
                 # Set the user in the session
                 Session.login(user)
                 print(f"\nRegistration successful, welcome to the Archive, {user.name}!")
                 return user
+            elif result.status is WriteStatus.EMAIL_TAKEN:
+                # Registered by someone else since the email was checked
+                print(f"Error: {result.message}")
+                continue
             else:
                 print("Error: Failed to register user.")
                 return None
@@ -72,6 +98,35 @@ def register_user():
             return None
 
 
+def _restore_deleted_account(email, password, console):
+    """
+    Offer to restore a soft-deleted account whose password was entered correctly
+
+    Returns:
+        User: The restored user, or None
+    """
+    user = UserRepository.find_deleted_by_email(email)
+    if not user:
+        return None
+
+    password_matches = _await_password_task(
+        PasswordHandler.verify_password_future(password, user.password),
+        "Checking your password..."
+    )
+    if not password_matches:
+        return None
+
+    if prompt("This account was deleted. Restore it? (y/n): ").strip().lower() != 'y':
+        return None
+
+    result = UserRepository.restore(user.id)
+    if not result.success:
+        console.print(f"[red]{result.message}[/red]")
+        return None
+    console.print("[green]Your account has been restored.[/green]")
+    return result.user
+
+
 def login_user():
     """
     Log in a user with email and password.
@@ -88,21 +143,47 @@ def login_user():
     password = prompt("Password: ", is_password=True)
     # password = getpass.getpass("Password: ")
 
+    # Reject floods before they cost a lookup and a bcrypt verify
+    allowed, message = check_login_attempt(email)
+    if not allowed:
+        console.print(f"[red]{message}[/red]")
+        return False
+
     # Find the user by email
     user = UserRepository.find_by_email(email)
 
     if not user:
-        console.print(f"[red]Invalid email or password[/red]")
-        return False
+        # A deleted account can be restored by logging into it (the password is checked there)
+        user = _restore_deleted_account(email, password, console)
+        if not user:
+            console.print(f"[red]Invalid email or password[/red]")
+            return False
+    else:
+        # Verify password
+        password_matches = _await_password_task(
+            PasswordHandler.verify_password_future(password, user.password),
+            "Checking your password..."
+        )
+        if not password_matches:
+            console.print(f"[red]Invalid email or password[/red]")
+            return False
 
-    # Verify password
-    if not PasswordHandler.verify_password(password, user.password):
-        console.print(f"[red]Invalid email or password[/red]")
-        return False
+    # Transparently upgrade hashes made with a lower work factor than configured
+    if PasswordHandler.needs_rehash(user.password):
+        new_hash = _await_password_task(
+            PasswordHandler.hash_password_future(password),
+            "Upgrading your password protection..."
+        )
+        if UserRepository.update_password_hash(user.id, user.password, new_hash):
+            user.password = new_hash
 
     # Set the user in the session
     Session.login(user)
 
+    # Optionally skip this prompt (and bcrypt) on the next launch
+    if prompt("Remember me on this device? (y/n): ").strip().lower() == 'y':
+        remember_user(user)
+
     print(f"\nWelcome back, {user.name}!")
     return user
 
@@ -135,11 +216,8 @@ def update_user_details(id, user_data):
         # Basic email validation
         if '@' not in email or '.' not in email or len(email) < 5:
             return False, "Please enter a valid email address"
-        # Check if email is already in use by another user
-        existing_user = UserRepository.find_by_email(email).to_dict()
-        if existing_user and existing_user['id'] != id:
-            return False, "Email address is already in use by another account"
-        update_data['email'] = email
+        # Emails already used by another account are rejected by the update itself
+        update_data['email'] = email.lower()
     
     # Handle password update (if provided)
     if 'password' in user_data and user_data['password']:
@@ -154,7 +232,10 @@ def update_user_details(id, user_data):
                 return False, "Passwords do not match"
         
         # Hash the password before storing it
-        hashed_password = PasswordHandler.hash_password(password)
+        hashed_password = _await_password_task(
+            PasswordHandler.hash_password_future(password),
+            "Securing your new password..."
+        )
         update_data['password'] = hashed_password
     
     # If there's nothing to update, return early
@@ -162,19 +243,18 @@ def update_user_details(id, user_data):
         return False, "No changes were made to your profile"
     
     # Call the repository to update the user
-    success, message, updated_user = UserRepository.update(id, update_data)
+    result = UserRepository.update(id, update_data)
     
-    # If update was successful, update the session
-    if success and updated_user:
-        # Update the session with new user details (excluding sensitive data)
-        sensitive_fields = ['password']
-        session_user = {k: v for k, v in updated_user.to_dict() if k not in sensitive_fields}
-        Session.update_current_user(session_user)
-        
+    # If update was successful, update the session with the row the update returned
+    if result.success:
+        Session.update_current_user(result.user)
+        if 'password' in update_data:
+            # Tokens issued before the change, possibly stolen, stop working
+            revoke_other_devices(result.user)
         return True, "Your profile has been updated successfully"
     
     # Return the result from the repository
-    return success, message
+    return False, result.message
 
 
 def delete_current_user_account(confirm_password=None):
@@ -197,25 +277,38 @@ def delete_current_user_account(confirm_password=None):
     # If password confirmation is required and provided
     if confirm_password is not None:
         # Verify the password matches before proceeding
-        is_valid = PasswordHandler.verify_password(confirm_password, current_user.get('password', ''))
+        is_valid = _await_password_task(
+            PasswordHandler.verify_password_future(confirm_password, current_user.password or ''),
+            "Checking your password..."
+        )
         if not is_valid:
             return False, "Incorrect password. Account deletion cancelled."
     
     # Delete the user account
-    success, message = UserRepository.delete(current_user['id'])
+    result = UserRepository.delete(current_user.id)
     
-    # If deletion was successful, invalidate the session
-    if success:
-        Session.clear()
+    # If deletion was successful, invalidate the session on every device
+    if result.success:
+        LoginSessionRepository.revoke_all(current_user.id)
+        forget_remembered_user()
+        Session.logout()
     
-    return success, message
+    return result.success, result.message
 
 
-def logout_user():
-    """Log out the current user."""
+def logout_user(forget=True):
+    """
+    Log out the current user.
+
+    Args:
+        forget (bool): Also revoke this device's "remember me" token; exiting
+            without logging out passes False to stay remembered
+    """
     user = Session.get_current_user()
     if user:
         print(f"\nGoodbye, {user.name}!")
+        if forget:
+            forget_remembered_user()
         Session.logout()
     else:
         print("\nNo user is currently logged in")
\ No newline at end of file
@@ -0,0 +1,65 @@
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv, set_key
+
+
+class Config:
+    """Application settings read from environment variables and the .env file."""
+
+    ENV_FILE = Path(".env")
+    _loaded = False
+
+    @classmethod
+    def _load(cls):
+        """Load the .env file once; real environment variables take precedence."""
+        if not cls._loaded:
+            load_dotenv(cls.ENV_FILE)
+            cls._loaded = True
+
+    @classmethod
+    def get(cls, name, default=None):
+        """
+        Read a setting as a string.
+
+        Args:
+            name (str): Setting name, e.g. BCRYPT_ROUNDS
+            default: Value returned when the setting is missing
+
+        Returns:
+            str: The setting value, or `default`
+        """
+        cls._load()
+        return os.environ.get(name, default)
+
+    @classmethod
+    def get_int(cls, name, default):
+        """Read a setting as an integer, falling back to `default` if missing or invalid."""
+        value = cls.get(name)
+        try:
+            return int(value) if value is not None else default
+        except ValueError:
+            return default
+
+    @classmethod
+    def get_float(cls, name, default):
+        """Read a setting as a float, falling back to `default` if missing or invalid."""
+        value = cls.get(name)
+        try:
+            return float(value) if value is not None else default
+        except ValueError:
+            return default
+
+    @classmethod
+    def set(cls, name, value):
+        """
+        Persist a setting to the .env file and apply it to this process.
+
+        Args:
+            name (str): Setting name
+            value: Value to store (converted to a string)
+        """
+        cls._load()
+        cls.ENV_FILE.touch(exist_ok=True)
+        set_key(str(cls.ENV_FILE), name, str(value), quote_mode="never")
+        os.environ[name] = str(value)
@@ -1,53 +1,20 @@
-import os
-import importlib
 from rich.panel import Panel
+from rich.table import Table
+
+from games.registry import GameRegistry
+from repositories.game_session import GameSessionRepository
 
 
 def discover_games():
     """
-    Discover and load available games from the games directory
+    Instantiate every available game
     
+    Prefer GameRegistry.default().games(), which lists games without importing them.
+
     Returns:
         list: List of instantiated game objects
     """
-    games = []
-    games_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "games")
-    
-    # Create games directory if it doesn't exist
-    if not os.path.exists(games_dir):
-        os.makedirs(games_dir)
-        return games
-    
-    # Look for game modules in the games directory
-    for item in os.listdir(games_dir):
-        game_dir = os.path.join(games_dir, item)
-        
-        # Check if it's a directory and contains a game.py file
-        if os.path.isdir(game_dir) and os.path.exists(os.path.join(game_dir, "game.py")):
-            try:
-                # Dynamically import the game module
-                module_path = f"games.{item}.game"
-                game_module = importlib.import_module(module_path)
-                
-                # Look for a class that inherits from BaseGame
-                for attr_name in dir(game_module):
-                    attr = getattr(game_module, attr_name)
-                    
-                    # Check if it's a class and not BaseGame itself
-                    if (isinstance(attr, type) and 
-                        attr.__name__ != 'BaseGame' and
-                        hasattr(attr, "__bases__") and
-                        any('BaseGame' in str(base) for base in attr.__bases__)):
-                        
-                        # Create an instance of the game and add to list
-                        game_instance = attr()
-                        games.append(game_instance)
-                        break
-                        
-            except Exception as e:
-                print(f"Error loading game {item}: {str(e)}")
-    
-    return games
+    return [game.create() for game in GameRegistry.default().games()]
 
 
 def run_game(game, user, console, session_tracker):
@@ -126,7 +93,7 @@ def select_difficulty_and_run_game(game, user, console, session_tracker):
         # Show difficulty selection menu
         console.print("\n[bold cyan]Select Difficulty:[/bold cyan]")
         
-        difficulty_options = ["Easy", "Medium", "Hard", "Return to Games Menu"]
+        difficulty_options = [*game.difficulty_levels(), "Return to Games Menu"]
         
         # Display difficulty options and get user choice
         for i, option in enumerate(difficulty_options, 1):
@@ -140,7 +107,7 @@ def select_difficulty_and_run_game(game, user, console, session_tracker):
         
         # Get user's difficulty selection
         valid_choices = [str(i) for i in range(1, len(difficulty_options) + 1)]
-        choice = input("\nSelect an option (1-4): ")
+        choice = input(f"\nSelect an option (1-{len(difficulty_options)}): ")
         
         if choice not in valid_choices:
             console.print("[red]Invalid choice. Please try again.[/red]")
@@ -218,14 +185,28 @@ def show_post_game_options(game, user, console, session_tracker):
             console.print("[red]Invalid choice. Please select 1, 2, or 3.[/red]")
 
 
-def show_high_scores(game_id, console):
+def show_high_scores(game_id, console, difficulty=None, limit=10):
     """
     Display high scores for a specific game
     
     Args:
         game_id: The ID of the game
         console: Rich console instance
+        difficulty: Only rank sessions played at this difficulty level
+        limit: Number of players to show
     """
-    # This is a placeholder - implement a proper high score service
     console.print("\n[bold cyan]High Scores[/bold cyan]")
-    console.print("[yellow]High score functionality coming soon![/yellow]")
\ No newline at end of file
+
+    # Best score per player, including sessions compacted by the retention job
+    top_scores = GameSessionRepository().top_scores(game_id, difficulty, limit)
+    if not top_scores:
+        console.print("[yellow]No scores recorded yet. Be the first![/yellow]")
+        return
+
+    table = Table(border_style="cyan", title=difficulty)
+    table.add_column("#", justify="right", style="cyan")
+    table.add_column("Player")
+    table.add_column("Score", justify="right", style="bold")
+    for rank, (player, score) in enumerate(top_scores, 1):
+        table.add_row(str(rank), player, f"{score:,}")
+    console.print(table)
\ No newline at end of file
@@ -9,13 +9,14 @@ class GameSessionTracker:
         self._repository = GameSessionRepository()
         self._active_session = None
     
-    def start_session(self, user_id, game_id, difficulty_level="Medium"):
+    def start_session(self, user_id, game_id, difficulty_level="Medium", seed=None):
         """Start a new game session.
         
         Args:
             user_id (int): ID of the current user
             game_id (str): ID of the game being played
             difficulty_level (str): Selected difficulty level
+            seed (int, optional): Seed of the game's random numbers, stored for replays
             
         Returns:
             int: ID of the created session
@@ -24,7 +25,8 @@ class GameSessionTracker:
         self._active_session = GameSession(
             user_id=user_id,
             game_id=game_id,
-            difficulty_level=difficulty_level
+            difficulty_level=difficulty_level,
+            seed=seed
         )
         
         # Persist to database
@@ -1,16 +1,98 @@
+import asyncio
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+from utils.config import Config
+
+
+# bcrypt work factor bounds; each round doubles the hashing time
+DEFAULT_ROUNDS = 12
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+
 
 class PasswordHandler:
     """Handles secure password operations."""
 
+    # bcrypt releases the GIL while hashing, so a thread pool keeps the UI
+    # thread responsive and runs several hashes on separate cores
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @classmethod
+    def _get_executor(cls):
+        """Lazily create the shared hashing pool."""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=os.cpu_count() or 2,
+                        thread_name_prefix="bcrypt"
+                    )
+        return cls._executor
+
+    @classmethod
+    def hash_password_future(cls, plain_password):
+        """
+        Start hashing a password in the background.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the hashed password
+        """
+        return cls._get_executor().submit(cls.hash_password, plain_password)
+
+    @classmethod
+    def verify_password_future(cls, plain_password, hashed_password):
+        """
+        Start verifying a password in the background.
+
+        Returns:
+            concurrent.futures.Future: Resolves to True if the password matches
+        """
+        return cls._get_executor().submit(cls.verify_password, plain_password, hashed_password)
+
+    @classmethod
+    async def hash_password_async(cls, plain_password):
+        """Hash a password without blocking the running asyncio event loop."""
+        return await asyncio.wrap_future(cls.hash_password_future(plain_password))
+
+    @classmethod
+    async def verify_password_async(cls, plain_password, hashed_password):
+        """Verify a password without blocking the running asyncio event loop."""
+        return await asyncio.wrap_future(cls.verify_password_future(plain_password, hashed_password))
+
+    @classmethod
+    def shutdown(cls):
+        """Stop the hashing pool (waits for pending hashes)."""
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=True)
+                cls._executor = None
+
+    @staticmethod
+    def rounds():
+        """
+        bcrypt work factor for new hashes.
+
+        Returns:
+            int: BCRYPT_ROUNDS from the config (see `calibrate_rounds`), 12 by default
+        """
+        rounds = Config.get_int("BCRYPT_ROUNDS", DEFAULT_ROUNDS)
+        return min(max(rounds, MIN_ROUNDS), MAX_ROUNDS)
+
     @staticmethod
-    def hash_password(plain_password):
+    def hash_password(plain_password, rounds=None):
         """
         Hash a password using bcrypt.
 
         Args:
             plain_password: The plaintext password to hash
+            rounds (int, optional): Work factor, defaults to the configured one
 
         Returns:
             str: The hashed password (includes the salt)
@@ -21,9 +103,8 @@ class PasswordHandler:
         else:
             password_bytes = plain_password
 
-        # Generate a salt and hash the password
-        # Using 12 rounds (work factor) - good balance of security and performance
-        salt = bcrypt.gensalt(rounds=12)
+        # Generate a salt and hash the password with the configured work factor
+        salt = bcrypt.gensalt(rounds=rounds or PasswordHandler.rounds())
         hashed = bcrypt.hashpw(password_bytes, salt)
 
         # Return the hash as a string
@@ -57,4 +138,59 @@ class PasswordHandler:
             return bcrypt.checkpw(password_bytes, hash_bytes)
         except Exception:
             # If there's any error, fail securely
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def needs_rehash(hashed_password):
+        """
+        Check whether a stored hash was made with less work than currently configured.
+
+        Args:
+            hashed_password: The stored bcrypt hash ($2b$<cost>$...)
+
+        Returns:
+            bool: True if the hash should be upgraded on the next successful login
+        """
+        if isinstance(hashed_password, bytes):
+            hashed_password = hashed_password.decode('utf-8')
+        try:
+            cost = int(hashed_password.split('$')[2])
+        except (AttributeError, IndexError, ValueError):
+            return False
+        return cost < PasswordHandler.rounds()
+
+    @staticmethod
+    def calibrate_rounds(target_ms=250, samples=3, min_rounds=MIN_ROUNDS, max_rounds=MAX_ROUNDS):
+        """
+        Benchmark this machine and pick the highest work factor within a latency budget.
+
+        Each extra round doubles the cost, so costs are timed in increasing order
+        and measurement stops at the first one over the target.
+
+        Args:
+            target_ms (float): Maximum acceptable time for one hash, in milliseconds
+            samples (int): Hashes timed per cost (the median is used)
+            min_rounds (int): Lowest cost considered, returned even if over budget
+            max_rounds (int): Highest cost considered
+
+        Returns:
+            tuple: (chosen_rounds, timings) where timings maps cost -> median ms
+
+        Raises:
+            ValueError: If samples is less than 1
+        """
+        if samples < 1:
+            raise ValueError(f"samples must be at least 1, got {samples}")
+        timings = {}
+        chosen = min_rounds
+        for rounds in range(min_rounds, max_rounds + 1):
+            durations = []
+            for _ in range(samples):
+                start = time.perf_counter()
+                PasswordHandler.hash_password("calibration-password", rounds=rounds)
+                durations.append((time.perf_counter() - start) * 1000)
+            timings[rounds] = statistics.median(durations)
+            if timings[rounds] > target_ms:
+                break
+            chosen = rounds
+        return chosen, timings
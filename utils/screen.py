@@ -0,0 +1,307 @@
+from rich.align import Align
+from rich.cells import get_character_cell_size
+from rich.color import ColorSystem
+from rich.console import Console, Group
+from rich.styled import Styled
+
+
+# Rows kept free under the frame for input prompts, so typing doesn't scroll the screen
+PROMPT_ROWS = 2
+
+# Unchanged cells between two changed runs that are rewritten instead of skipped with a
+# cursor move (a move costs 4-8 bytes)
+MERGE_GAP = 6
+
+_COLOR_SYSTEMS = {
+    'standard': ColorSystem.STANDARD,
+    '256': ColorSystem.EIGHT_BIT,
+    'truecolor': ColorSystem.TRUECOLOR,
+    'windows': ColorSystem.WINDOWS,
+}
+
+_BLANK = (" ", None)
+
+
+class Screen:
+    """
+    Terminal screen that only rewrites what changed.
+
+    Renderables are rendered with Rich into a grid of (character, style)
+    cells. The last frame written is kept, and a new frame is compared with
+    it cell by cell: only runs of changed cells are written, each after one
+    ANSI cursor move, and styles are only emitted where they change. Nothing
+    is erased before it is redrawn, so there is no flicker.
+
+    It stands in for the parts of a Rich Console the menus use (print, clear,
+    width, status): print() adds to the current page and clear() starts a new
+    one. Since other code may have written to the terminal in between, the
+    first frame after clear() repaints every row in place; frames within a page,
+    and frame() replacing the whole page (animations), are diffed. Input typed
+    under the frame is wiped on the next update.
+
+    When the output is not an ANSI terminal it falls back to the Console.
+    """
+
+    _default = None
+
+    def __init__(self, console=None):
+        """
+        Args:
+            console (Console, optional): Console to render with and write to
+        """
+        self.console = console or Console()
+        self.enabled = self.console.is_terminal and not self.console.legacy_windows
+        self.items = []
+        self.bytes_written = 0
+        self.frames = 0
+        self._rows = None  # Rows of cells on screen, None when unknown
+        self._parked_row = None
+        self._style_codes = {}
+        self._color_system = _COLOR_SYSTEMS.get(self.console.color_system)
+
+    @classmethod
+    def default(cls):
+        """The shared screen of the application's terminal."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @property
+    def width(self):
+        return self.console.width
+
+    @property
+    def height(self):
+        return self.console.height
+
+    def status(self, *args, **kwargs):
+        """Spinner under the frame, see Console.status."""
+        return self.console.status(*args, **kwargs)
+
+    def print(self, *renderables, **kwargs):
+        """
+        Add renderables to the page and update the screen.
+
+        Takes the Console.print options that lay out what is printed: sep,
+        style, justify, markup, emoji and highlight. Every print starts a new
+        line, so end can only be "\n".
+
+        Raises:
+            TypeError: For any other Console.print option
+        """
+        if not self.enabled:
+            self.console.print(*renderables, **kwargs)
+            return
+        self.items.extend(self._page_items(renderables, **kwargs))
+        self.flush()
+
+    def _page_items(self, renderables, sep=" ", end="\n", style=None, justify=None,
+                    markup=None, emoji=None, highlight=None, **unsupported):
+        """Renderables as Console.print would lay them out: strings joined by `sep`, then justified and styled."""
+        if unsupported:
+            raise TypeError(f"Screen.print() got unsupported options: {', '.join(sorted(unsupported))}")
+        if end != "\n":
+            raise TypeError("Screen.print() only supports end='\\n'")
+
+        items = []
+        strings = []
+
+        def add_strings():
+            if strings:
+                items.append(self.console.render_str(sep.join(strings), justify=justify, markup=markup,
+                                                     emoji=emoji, highlight=highlight))
+                strings.clear()
+
+        for renderable in renderables:
+            if isinstance(renderable, str):
+                strings.append(renderable)
+                continue
+            add_strings()
+            items.append(renderable)
+        add_strings()
+
+        if justify in ("center", "right"):
+            items = [Align(item, justify) for item in items]
+        if style:
+            items = [Styled(item, style) for item in items]
+        return items
+
+    def clear(self):
+        """Start a new page; the screen is repainted in place on the next update."""
+        if not self.enabled:
+            self.console.clear()
+            return
+        self.items = []
+        self._rows = None
+
+    def frame(self, *renderables):
+        """Replace the page with these renderables, rewriting only the cells that changed."""
+        if not self.enabled:
+            self.console.clear()
+            self.console.print(*renderables)
+            return
+        self.items = list(renderables)
+        self.flush()
+
+    def invalidate(self):
+        """Forget what is on screen, e.g. after something else drew on it."""
+        self._rows = None
+
+    def flush(self):
+        """
+        Write the current page to the terminal.
+
+        Returns:
+            int: Bytes written
+        """
+        rows = self.render_cells(self.items)
+        data = self.diff(self._rows, rows)
+        self.console.file.write(data)
+        self.console.file.flush()
+        self._rows = rows
+        self.frames += 1
+        self.bytes_written += len(data.encode('utf-8'))
+        return len(data)
+
+    def render_cells(self, renderables):
+        """
+        Render to rows of (character, style) cells.
+
+        Wide characters take two cells, the second one holding "". Only the
+        bottom rows that fit above the prompt rows are kept, like a scrolling
+        terminal would.
+
+        Returns:
+            list: Rows, each a list of cells
+        """
+        width = self.width
+        lines = self.console.render_lines(Group(*renderables), self.console.options.update(width=width), pad=False)
+        rows = []
+        for line in lines:
+            cells = []
+            for text, style, control in line:
+                if control:
+                    continue
+                if text.isascii():
+                    cells.extend([(char, style) for char in text])
+                    continue
+                for char in text:
+                    size = get_character_cell_size(char)
+                    if size == 0:
+                        if cells:  # Combining character
+                            cells[-1] = (cells[-1][0] + char, cells[-1][1])
+                        continue
+                    cells.append((char, style))
+                    if size == 2:
+                        cells.append(("", style))
+            rows.append(cells[:width])
+        return rows[-max(self.height - PROMPT_ROWS, 1):]
+
+    def diff(self, old_rows, new_rows):
+        """
+        Build the ANSI output turning `old_rows` into `new_rows`.
+
+        Args:
+            old_rows (list): Rows on screen, or None to repaint every row
+            new_rows (list): Rows to show
+
+        Returns:
+            str: Cursor moves, styles and text
+        """
+        out = []
+        cursor = [None, None]  # Where the terminal cursor is, if known
+        current = [None]       # Style in effect
+
+        def move(row, col):
+            if cursor != [row, col]:
+                out.append(f"\x1b[{row + 1};{col + 1}H" if col else f"\x1b[{row + 1}H")
+                cursor[:] = [row, col]
+
+        def write(cells):
+            for char, style in cells:
+                if style != current[0]:
+                    out.append(self._style_prefix(style, current[0]))
+                    current[0] = style
+                out.append(char)
+            cursor[1] += len(cells)
+
+        parked = self._parked_row
+        if old_rows is not None and parked is not None and parked < len(old_rows):
+            old_rows = old_rows[:parked]
+        if old_rows is not None and parked is not None:
+            # Whatever was typed under the last frame
+            move(parked, 0)
+            out.append("\x1b[J")
+
+        for index, new in enumerate(new_rows):
+            old = old_rows[index] if old_rows is not None and index < len(old_rows) else None
+            new_end = self._content_end(new)
+
+            if old is None:
+                move(index, 0)
+                write(new[:new_end])
+                if old_rows is None:
+                    out.append(self._reset(current) + "\x1b[K")
+                continue
+
+            old_end = self._content_end(old)
+            for start, stop in self._changed_runs(old, new, max(old_end, new_end)):
+                move(index, start)
+                write(new[start:min(stop, new_end)])
+                if stop > new_end:
+                    out.append(self._reset(current) + "\x1b[K")
+
+        if old_rows is None or len(old_rows) > len(new_rows):
+            move(len(new_rows), 0)
+            out.append(self._reset(current) + "\x1b[J")
+
+        # Park the cursor under the frame, where input() prompts appear
+        out.append(self._reset(current))
+        move(len(new_rows), 0)
+        self._parked_row = len(new_rows)
+        return "".join(out)
+
+    @staticmethod
+    def _content_end(row):
+        end = len(row)
+        while end and row[end - 1] == _BLANK:
+            end -= 1
+        return end
+
+    @staticmethod
+    def _changed_runs(old, new, end):
+        """Column ranges (start, stop) that differ, merging runs separated by small gaps."""
+        runs = []
+        for col in range(end):
+            old_cell = old[col] if col < len(old) else _BLANK
+            new_cell = new[col] if col < len(new) else _BLANK
+            if old_cell == new_cell:
+                continue
+            if runs and col - runs[-1][1] <= MERGE_GAP:
+                runs[-1][1] = col + 1
+            else:
+                runs.append([col, col + 1])
+
+        for run in runs:
+            # Never split a wide character
+            if run[0] and run[0] < len(new) and new[run[0]][0] == "":
+                run[0] -= 1
+            if run[1] < len(new) and new[run[1]][0] == "":
+                run[1] += 1
+        return runs
+
+    def _style_prefix(self, style, previous):
+        """SGR sequence switching from `previous` to `style`."""
+        if style is None or not style:
+            return "\x1b[0m" if previous else ""
+        codes = self._style_codes.get(style)
+        if codes is None:
+            codes = self._style_codes[style] = style.render("\0", color_system=self._color_system).split("\0")[0]
+        return ("\x1b[0m" if previous else "") + codes
+
+    @staticmethod
+    def _reset(current):
+        if current[0]:
+            current[0] = None
+            return "\x1b[0m"
+        return ""